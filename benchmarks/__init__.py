@@ -0,0 +1,2 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Performance benchmarks of ocxwiki, run with ``python -m benchmarks.<name>``."""
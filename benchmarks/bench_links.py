@@ -0,0 +1,51 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Benchmark the link resolution of a transformed schema on growing schemas.
+
+Times ``WikiManager.transform`` plus linking the children and attributes tables of all elements, repeated on the
+same manager. Run with ``python -m benchmarks.bench_links``. The cost per element stays flat when linking is linear
+in the schema size, and the last run is as fast as the first when reprocessing does not accumulate state.
+"""
+
+# System imports
+import argparse
+import time
+
+# Third party imports
+from loguru import logger
+
+# Module imports
+from ocxwiki.render import Render
+from ocxwiki.wiki_manager import WikiManager
+from benchmarks import synthetic
+
+
+def bench(elements: int, repeat: int = 3) -> tuple:
+    """The best and the last time in seconds of transforming and linking a schema with ``elements`` elements."""
+    manager = WikiManager('http://localhost/')
+    manager._transformer = synthetic.transformer(elements)
+    namespace = manager.get_publish_namespace()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        manager.transform()
+        for ocx in manager.transformer.get_ocx_elements():
+            Render.children_table(ocx, manager._links, namespace)
+            Render.attributes_table(ocx, manager._links, namespace)
+        times.append(time.perf_counter() - start)
+    return min(times), times[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[250, 500, 1000, 2000, 4000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    logger.remove()
+    print(f'{"elements":>10} {"seconds":>10} {"us/element":>12} {"last run":>10}')
+    for elements in args.sizes:
+        seconds, last = bench(elements, args.repeat)
+        print(f'{elements:>10} {seconds:>10.4f} {1e6 * seconds / elements:>12.1f} {last:>10.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Benchmark the DokuWiki table writer against the former tabulate based writer.
+
+Renders the linked children and attributes tables of all elements of a synthetic schema with both writers and
+compares the time and the size of the tables. Run with ``python -m benchmarks.bench_tables``.
+"""
+
+# System imports
+import argparse
+import time
+
+# Third party imports
+from loguru import logger
+from tabulate import tabulate
+
+# Module imports
+from ocxwiki.render import Render
+from ocxwiki.render.page_model import Table
+from ocxwiki.wiki_manager import WikiManager
+from benchmarks import synthetic
+
+
+def tabulate_table(table: Table) -> str:
+    """The former ``Render.table``, padding the columns with tabulate."""
+    table = {f'%%{key}%%': values for key, values in table.to_dict().items()}
+    return tabulate(table, headers="keys", tablefmt="jira").replace('||', '^')
+
+
+def bench(elements: int, repeat: int = 3) -> dict:
+    """The best time in seconds and the size in bytes of the tables of a schema with ``elements`` elements, for
+    each writer."""
+    manager = WikiManager('http://localhost/')
+    manager._transformer = synthetic.transformer(elements)
+    manager.transform()
+    namespace = manager.get_publish_namespace()
+    tables = [table for ocx in manager.transformer.get_ocx_elements()
+              for table in (Render.children_table(ocx, manager._links, namespace),
+                            Render.attributes_table(ocx, manager._links, namespace))]
+    results = {}
+    for name, writer in (('tabulate', tabulate_table), ('dokuwiki', Render.table)):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            rendered = [writer(table) for table in tables]
+            times.append(time.perf_counter() - start)
+        results[name] = (min(times), sum(len(text.encode('utf-8')) for text in rendered))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[250, 1000, 4000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    logger.remove()
+    print(f'{"elements":>10} {"writer":>10} {"seconds":>10} {"bytes":>12} {"speedup":>8} {"size":>6}')
+    for elements in args.sizes:
+        results = bench(elements, args.repeat)
+        seconds, size = results['tabulate']
+        for name, (s, b) in results.items():
+            print(f'{elements:>10} {name:>10} {s:>10.4f} {b:>12} {seconds / s:>7.1f}x {b / size:>6.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""A synthetic schema of any size standing in for a processed OCX schema."""
+
+# System imports
+from types import SimpleNamespace
+from typing import Dict, List
+
+# Module imports
+from ocx_schema_parser.data_classes import OcxEnumerator, OcxSchemaAttribute, OcxSchemaChild
+
+NAMESPACE = 'https://3docx.org/fileadmin//ocx_schema//V301//OCX_Schema.xsd'
+XS = 'http://www.w3.org/2001/XMLSchema'
+BUILTINS = ('string', 'boolean', 'double', 'int', 'ID', 'IDREF', 'anyURI', 'dateTime')
+
+
+class SyntheticElement:
+    """A schema global element with children and attributes."""
+
+    def __init__(self, name: str, children: List[OcxSchemaChild], attributes: List[OcxSchemaAttribute]):
+        self._name = name
+        self._children = children
+        self._attributes = attributes
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_prefix(self) -> str:
+        return 'ocx'
+
+    def get_tag(self) -> str:
+        return f'{{{NAMESPACE}}}{self._name}'
+
+    def get_annotation(self) -> str:
+        return f'The {self._name} element.'
+
+    def get_children(self) -> List[OcxSchemaChild]:
+        return self._children
+
+    def get_attributes(self) -> List[OcxSchemaAttribute]:
+        return self._attributes
+
+    def children_to_dict(self) -> Dict:
+        table = {}
+        for child in sorted(self._children, key=lambda x: x.name):
+            for key, value in child.to_dict().items():
+                table.setdefault(key, []).append(value)
+        return table
+
+    def attributes_to_dict(self) -> Dict:
+        table = {}
+        for attribute in self._attributes:
+            for key, value in attribute.to_dict().items():
+                table.setdefault(key, []).append(value)
+        return table
+
+
+def transformer(elements: int, children: int = 8, attributes: int = 6, enums: int = 0) -> SimpleNamespace:
+    """A transformer of a schema with ``elements`` global elements.
+
+    Each element has ``children`` child elements typed by other globals and ``attributes`` attributes, half of them
+    named like a global and half typed by a builtin.
+    """
+    names = [f'Element{i}' for i in range(elements)]
+    ocx_elements = []
+    for i, name in enumerate(names):
+        kids = [OcxSchemaChild(name=names[(i + k + 1) % elements], prefix='ocx',
+                               type=f'ocx:{names[(i + k + 1) % elements]}_T', use='opt', cardinality='[0, 1]',
+                               description=f'Child {k}') for k in range(children)]
+        attrs = [OcxSchemaAttribute(name=names[(i + k) % elements] if k % 2 else f'attr{k}', prefix='ocx',
+                                    type=f'xs:{BUILTINS[k % len(BUILTINS)]}', use='optional',
+                                    description=f'Attribute {k}') for k in range(attributes)]
+        ocx_elements.append(SyntheticElement(name, kids, attrs))
+    enumerators = {f'Enum{i}': OcxEnumerator(name=f'Enum{i}', prefix='ocx', tag=f'{{{NAMESPACE}}}Enum{i}')
+                   for i in range(enums)}
+    parser = SimpleNamespace(
+        get_namespaces=lambda: {'ocx': NAMESPACE, 'xs': XS},
+        get_xs_types=lambda: {f'{{{XS}}}{t}': f'https://www.w3.org/TR/xmlschema-2/#{t}' for t in BUILTINS},
+        get_prefix_from_namespace=lambda ns: 'xs' if ns == XS else 'ocx',
+        get_schema_element_types=lambda: [f'{{{NAMESPACE}}}{n}' for n in names],
+        get_schema_attribute_types=lambda: [],
+        get_schema_attribute_group_types=lambda: [],
+        get_schema_simple_types=lambda: [f'{{{NAMESPACE}}}{n}_T' for n in names],
+        get_schema_version=lambda: '3.0.1',
+        get_schema_namespace=lambda version: NAMESPACE,
+    )
+    return SimpleNamespace(parser=parser, get_ocx_elements=lambda: ocx_elements,
+                           get_enumerators=lambda: enumerators, get_global_attributes=lambda: [],
+                           get_simple_types=lambda: [])
@@ -23,3 +23,5 @@ TEST_WIKI_URL = app_config.get("TEST_WIKI_URL")
 DEFAULT_NSP = app_config.get("DEFAULT_NSP")
 WORKING_DRAFT = app_config.get("WORKING_DRAFT")
 SCHEMA_FOLDER = app_config.get("SCHEMA_FOLDER")
+CACHE_FOLDER = app_config.get("CACHE_FOLDER", ".ocxwiki_cache")
+RATE_LIMITS = app_config.get("RATE_LIMITS") or {}  # Client side rate limits keyed by wiki url
@@ -1,4 +1,5 @@
 from difflib import get_close_matches
+from pathlib import Path
 from typing import Callable, Optional
 import threading
 
@@ -9,11 +10,15 @@ from textual.containers import Vertical
 from textual.widgets import Footer, Header, Input, ProgressBar, RichLog
 
 from cli import cli
+from ocxwiki import SCHEMA_FOLDER
+from ocxwiki.async_helper import run_async
+from ocxwiki.error import OcxWikiError
+from ocxwiki.watcher import SchemaWatcher, WatchUpdate
 from ocxwiki.commands.base import Command, dispatch_typer_command
 from ocxwiki.commands.config import AppConfig
 from ocxwiki.commands.history import HistoryManager
 from ocxwiki.commands.loader import load_commands
-from ocxwiki.ui.command_provider import CommandProvider
+from ocxwiki.ui.command_provider import CommandProvider, SchemaSearchProvider
 from ocxwiki.ui.logging import TextualLogHandler, TextualProgressSink
 
 
@@ -44,8 +49,9 @@ class CLIApp(App):
 
     BINDINGS = [
         ("ctrl+c", "quit", "Quit"),
+        ("f2", "toggle_watch", "Watch schema"),
     ]
-    COMMANDS = App.COMMANDS | {CommandProvider}
+    COMMANDS = App.COMMANDS | {CommandProvider, SchemaSearchProvider}
 
     def __init__(self):
         super().__init__()
@@ -81,6 +87,9 @@ class CLIApp(App):
         #   'message': str,            # the question to display
         # }
 
+        # The schema folder watch toggled with F2
+        self._watcher: Optional[SchemaWatcher] = None
+
     def compose(self) -> ComposeResult:
         yield Header()
         with Vertical(id="main-container"):
@@ -655,6 +664,37 @@ class CLIApp(App):
         else:
             print(f"Unknown command: {command}")
 
+    def action_toggle_watch(self) -> None:
+        """Start or stop watching the schema folder.
+
+        While watching, every change of the schema files is reprocessed and the changed pages are republished to
+        the draft namespace if the wiki is connected.
+        """
+        watcher = self._watcher
+        if watcher is not None and watcher.running:
+            watcher.stop()
+            self.add_output("[dim]Stopping the schema watch...[/dim]")
+            return
+        from ocxwiki.wiki_cli import get_wiki_manager
+        wiki_manager = get_wiki_manager()
+        publish = wiki_manager.client.is_connected()
+        watcher = self._watcher = SchemaWatcher(wiki_manager, Path(SCHEMA_FOLDER), publish=publish)
+        self.add_output(f"[bold cyan]Watching the schema in {watcher.folder}[/bold cyan]"
+                        f"{'' if publish else ' (not connected, the pages are not republished)'}. Press F2 to stop.")
+        self.run_worker(lambda: self._run_watch(watcher), thread=True, group="watch", exit_on_error=False)
+
+    def _run_watch(self, watcher: SchemaWatcher) -> None:
+        """Run the schema watch in a worker thread with its own event loop."""
+
+        def on_update(update: WatchUpdate) -> None:
+            self.call_from_thread(self.add_output, f"[bold]Schema changed:[/bold] {update.summary()}")
+
+        try:
+            run_async(watcher.run(on_update=on_update))
+        except OcxWikiError as e:
+            self.call_from_thread(self.add_output, f"[bold red]Error:[/bold red] {e}")
+        self.call_from_thread(self.add_output, "[dim]Stopped watching the schema.[/dim]")
+
     def action_quit(self) -> None:
         """Save history and config on exit."""
         self.history_manager.save()
@@ -663,6 +703,8 @@ class CLIApp(App):
 
     def exit(self, result=None) -> None:
         """Save history and config before exiting."""
+        if self._watcher is not None:
+            self._watcher.stop()
         self.history_manager.save()
         self.app_config.save()
         super().exit(result)
@@ -3,24 +3,63 @@
 
 import asyncio
 import threading
-from typing import TypeVar, Awaitable, Callable
+from typing import TypeVar, Awaitable, Callable, Optional
 from functools import wraps
 
 T = TypeVar('T')
 
 
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """The event loop running the coroutines of the synchronous API, started on first use.
+
+    The loop runs for the lifetime of the process on a daemon thread, so state bound to a loop, like the
+    keep-alive connections of the XML-RPC transport, is reused by all synchronous calls.
+    """
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or _loop.is_closed() or not _loop_thread.is_alive():
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name='ocxwiki-async', daemon=True)
+            _loop_thread.start()
+        return _loop
+
+
+def _run_in_new_loop(coro: Awaitable[T]) -> T:
+    """Run ``coro`` in a new event loop on a dedicated thread and block until it completes."""
+    result_holder: list = []
+    exc_holder: list = []
+
+    def _run():
+        new_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(new_loop)
+        try:
+            result_holder.append(new_loop.run_until_complete(coro))
+        except Exception as exc:
+            exc_holder.append(exc)
+        finally:
+            new_loop.close()
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    thread.join()
+
+    if exc_holder:
+        raise exc_holder[0]
+    return result_holder[0] if result_holder else None
+
+
 def run_async(coro: Awaitable[T]) -> T:
     """Run an async coroutine in a synchronous context.
 
-    Handles two situations:
-
-    1. **No running loop** (plain CLI / script): creates a new event loop
-       and calls ``run_until_complete``.
-    2. **Running loop present** (called from ``asyncio.to_thread`` inside the
-       Textual TUI): spins up a *dedicated* event loop in a new thread and
-       blocks the caller until the coroutine completes.  This avoids posting
-       back to the already-busy Textual event loop (which can cause deadlocks
-       or ``NoneType`` errors when the loop is processing other callbacks).
+    The coroutine runs on one background event loop shared by all synchronous calls, both from a plain CLI or
+    script and from a worker thread of the Textual TUI, so it never re-enters a loop that is busy processing
+    other callbacks. A coroutine running on the background loop that calls the synchronous API gets a
+    dedicated event loop on a new thread instead, as blocking the background loop would deadlock.
 
     Args:
         coro: The coroutine to run
@@ -28,48 +67,16 @@ def run_async(coro: Awaitable[T]) -> T:
     Returns:
         The result of the coroutine
     """
+    loop = _background_loop()
+    if threading.current_thread() is _loop_thread:
+        return _run_in_new_loop(coro)
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
     try:
-        asyncio.get_running_loop()
-        _has_running_loop = True
-    except RuntimeError:
-        _has_running_loop = False
-
-    if _has_running_loop:
-        # We are inside a worker thread that was spawned by an async event loop
-        # (e.g. asyncio.to_thread / Textual worker).  Run the coroutine in a
-        # brand-new event loop on a dedicated background thread so we don't
-        # re-enter the parent loop.
-        result_holder: list = []
-        exc_holder: list = []
-
-        def _run_in_new_loop():
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                result_holder.append(new_loop.run_until_complete(coro))
-            except Exception as exc:
-                exc_holder.append(exc)
-            finally:
-                new_loop.close()
-
-        thread = threading.Thread(target=_run_in_new_loop, daemon=True)
-        thread.start()
-        thread.join()
-
-        if exc_holder:
-            raise exc_holder[0]
-        return result_holder[0] if result_holder else None
-
-    # No running loop – plain synchronous context.
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            raise RuntimeError("closed")
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    return loop.run_until_complete(coro)
+        return future.result()
+    except BaseException:
+        # Interrupted by the user, stop the coroutine as well
+        future.cancel()
+        raise
 
 
 def async_command(func: Callable[..., Awaitable[T]]) -> Callable[..., T]:
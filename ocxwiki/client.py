@@ -1,61 +1,173 @@
-#  Copyright (c) 2023. #  OCX Consortium https://3docx.org. See the LICENSE
+#  Copyright (c) 2023. OCX Consortium https://3docx.org. See the LICENSE
 """Python xml-rpc client for the OCX wiki."""
 
 # System imports
-from typing import Dict, OrderedDict, Optional
+from typing import Dict, OrderedDict, Optional, List, Union, NamedTuple, Sequence, Tuple, Callable, Any
 import datetime
-import threading
-import requests.exceptions as http_error
-from pathlib import Path
 import asyncio
-from functools import partial
+import hashlib
+from pathlib import Path
+from xmlrpc.client import Binary
 # Third party imports
-from dokuwiki import DokuWiki, DokuWikiError
+from dokuwiki import DokuWikiError
 from loguru import logger
 # Module imports
 from ocxwiki import USER, PSWD, WIKI_URL, DEFAULT_NSP
 import ocxwiki.struct_data as struct_data
+from ocxwiki.async_helper import run_async
+from ocxwiki.error import OcxWikiError
+from ocxwiki.transport import AsyncXmlRpcTransport
+from ocxwiki.retry import RetryPolicy, RetryStats, CircuitBreaker
+from ocxwiki.rate_limit import RateLimiter, rate_limiter_for
+
+DEFAULT_POOL_SIZE = 8  # Number of concurrent keep-alive connections to the wiki
+MAX_BATCH_BYTES = 512 * 1024  # Target payload size of one system.multicall request
+MAX_BATCH_CALLS = 100  # Maximum number of calls packed into one system.multicall request
+_CALL_OVERHEAD = 256  # Approximate XML-RPC envelope bytes per packed call
+
+
+def _unix_time(timestamp: Union[datetime.datetime, int, float]) -> int:
+    """DokuWiki expects change timestamps as unix seconds."""
+    if isinstance(timestamp, datetime.datetime):
+        return int(timestamp.timestamp())
+    return int(timestamp)
+
+
+def page_hash(content: str) -> str:
+    """The md5 hash DokuWiki reports for a page with ``content``.
+
+    DokuWiki stores page text with unix line endings, so ``\r\n`` is normalised before hashing.
+    """
+    return hashlib.md5(content.replace('\r\n', '\n').encode('utf-8')).hexdigest()
+
+
+class PageWrite(NamedTuple):
+    """A page write for :meth:`WikiClient.set_pages`.
+
+    Parameters:
+        page: page name
+        content: The page content
+        summary: Change summary
+        namespace: the namespace of the page
+        minor: Whether this is a minor change
+    """
+    page: str
+    content: str
+    summary: str
+    namespace: str = DEFAULT_NSP
+    minor: bool = False
+
+    @property
+    def wiki_page(self) -> str:
+        """The full page id."""
+        return f'{self.namespace}:{self.page}'
+
+    def payload_size(self) -> int:
+        """Estimate the encoded size of the ``wiki.putPage`` call."""
+        return _call_size((self.wiki_page, self.content, self.summary))
+
+
+def _call_size(params: Sequence) -> int:
+    """Estimate the encoded size of an XML-RPC call from its string parameters."""
+    return _CALL_OVERHEAD + sum(len(p.encode('utf-8')) if isinstance(p, str) else _CALL_OVERHEAD for p in params)
+
+
+def batches(calls: Sequence[Tuple[str, Sequence]], max_bytes: int = MAX_BATCH_BYTES,
+            max_calls: int = MAX_BATCH_CALLS) -> List[Tuple[int, int]]:
+    """Split ``calls`` into ``(start, stop)`` slices with a payload of at most ``max_bytes``.
+
+    A single call larger than ``max_bytes`` gets a batch of its own.
+    """
+    slices = []
+    start, size = 0, 0
+    for index, (_, params) in enumerate(calls):
+        call_size = _call_size(params)
+        if index > start and (size + call_size > max_bytes or index - start >= max_calls):
+            slices.append((start, index))
+            start, size = index, 0
+        size += call_size
+    if start < len(calls):
+        slices.append((start, len(calls)))
+    return slices
 
 
 class WikiClient:
     """The WikiClient provides functionality for interacting with the OCX wiki pages.
 
+    All XML-RPC calls go through an asyncio native transport holding a cookie based session and a pool of
+    keep-alive HTTP connections on the event loop, so ``N`` concurrent publish operations use ``N`` sockets
+    without a thread per request. The ``*_async`` methods are the primary API, the synchronous methods are thin
+    wrappers running the coroutine with :func:`~ocxwiki.async_helper.run_async`.
+
+    Transient failures of idempotent calls are retried by the ``retry`` policy, whose circuit breaker pauses all
+    calls while the wiki is down.
+
     Args:
         url: the OCX wiki URL
-        user: The wiki user
-        password: The user password
+        pool_size: The maximum number of concurrent connections to the wiki
+        retry: The retry policy, default up to 4 attempts with exponential backoff and a circuit breaker
+        rate_limiter: The rate limit of the requests, default the limit configured for ``url`` in ``RATE_LIMITS``
 
     Attributes:
         _url: the wiki url
-        _wiki: the DocuWiki proxy
+        _transport: the asyncio XML-RPC transport
+        _version: The DokuWiki version, retrieved when connecting
+        _xmlrpc_version: The XML-RPC API version, retrieved when connecting
 
     """
 
-    def __init__(self, url: str = WIKI_URL):
+    def __init__(self, url: str = WIKI_URL, pool_size: int = DEFAULT_POOL_SIZE, retry: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
         self._url: str = url
-        self._wiki: DokuWiki = None  # Initialize with URL only; login will be done separately
+        self._pool_size: int = max(1, pool_size)
+        self._transport = AsyncXmlRpcTransport(url, max_connections=self._pool_size,
+                                               rate_limiter=rate_limiter or rate_limiter_for(url))
         self._connected: bool = False
-        self._lock = threading.Lock()  # Protect DokuWiki XML-RPC calls from concurrent threads
+        self._version: Optional[str] = None
+        self._xmlrpc_version: Optional[int] = None
+        self._multicall: bool = True  # Cleared if the wiki does not support system.multicall
+        self.max_batch_bytes: int = MAX_BATCH_BYTES
+        self._retry: RetryPolicy = retry or RetryPolicy(breaker=CircuitBreaker())
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """The rate limit of the requests to the wiki, None if there is no limit."""
+        return self._transport.rate_limiter
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """The counters of the retried calls."""
+        return self._retry.stats
+
+    async def _call(self, method: str, *params, idempotent: bool = True) -> Any:
+        """Execute the XML-RPC ``method`` under the retry policy."""
+        return await self._retry.run(lambda: self._transport.call(method, *params, idempotent=idempotent),
+                                     idempotent=idempotent)
 
     def connect(self, user: str = USER, password=PSWD) -> bool:
+        """Log in to the wiki."""
+        return run_async(self.connect_async(user=user, password=password))
+
+    async def connect_async(self, user: str = USER, password=PSWD) -> bool:
+        """Async version of connect. Log in to the wiki and establish the session shared by all connections."""
         try:
-            self._wiki = DokuWiki(url=self._url, user=user, password=password)
+            logged_in = await self._call('dokuwiki.login', user, password)
         except DokuWikiError as e:
             logger.error(f'Connecting to {self._url} failed: {e}')
-        if self._wiki is None:
+            logged_in = False
+        if not logged_in:
+            self._connected = False
             raise DokuWikiError(f'Failed to connect to {self._url}')
-        else:
-            self._connected = True
-            logger.info(f'Connected to {self._url}')
-            logger.info(f'Dokuwiki version: {self._wiki.version}')
-            logger.info(f'XMLRPC version: {self._wiki.xmlrpc_version}')
+        self._version, self._xmlrpc_version = await asyncio.gather(
+            self._call('dokuwiki.getVersion'),
+            self._call('dokuwiki.getXMLRPCAPIVersion'),
+        )
+        self._connected = True
+        logger.info(f'Connected to {self._url}')
+        logger.info(f'Dokuwiki version: {self._version}')
+        logger.info(f'XMLRPC version: {self._xmlrpc_version}')
         return self._connected
 
-    async def connect_async(self, user: str = USER, password=PSWD) -> bool:
-        """Async wrapper for connect."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, partial(self.connect, user, password))
-
     def is_connected(self) -> bool:
         """True if a connection to the ocxwiki is established, False otherwise."""
         return self._connected
@@ -64,6 +176,19 @@ class WikiClient:
         """Return the current ocxwiki url."""
         return self._url
 
+    def pool_size(self) -> int:
+        """Return the maximum number of concurrent connections to the wiki."""
+        return self._pool_size
+
+    @property
+    def transport(self) -> AsyncXmlRpcTransport:
+        """Return the XML-RPC transport."""
+        return self._transport
+
+    def close(self):
+        """Close all idle connections to the wiki."""
+        self._transport.close()
+
     def login(self, user: str = USER, password: str = PSWD) -> bool:
         """Log in to the wiki.
 
@@ -72,8 +197,7 @@ class WikiClient:
             password: The user password
         """
         try:
-            self._wiki.login(user, password)
-            self._connected = True
+            self._connected = bool(run_async(self._call('dokuwiki.login', user, password)))
             return self._connected
         except (DokuWikiError, Exception) as err:
             logger.error(f'Unable to connect: {err}')
@@ -82,11 +206,11 @@ class WikiClient:
 
     def wiki_version(self) -> str:
         """Return the ocxwiki dokuwiki version."""
-        return self._wiki.version
+        return self._version
 
     def xmlrpc_version(self) -> str:
         """Return the ocxwiki xmlrpc version."""
-        return self._wiki.xmlrpc_version
+        return self._xmlrpc_version
 
     # Wiki pages
     def list_pages(self, namespace: str = DEFAULT_NSP, depth: int = 0, md5_hash: bool = False, skip_acl: bool = False):
@@ -98,9 +222,30 @@ class WikiClient:
             skip_acl: skip everything regardless of ACL
             namespace: List pages in this namespace.
         """
+        return run_async(self.list_pages_async(namespace, depth, md5_hash, skip_acl))
+
+    async def list_pages_async(self, namespace: str = DEFAULT_NSP, depth: int = 0, md5_hash: bool = False,
+                               skip_acl: bool = False):
+        """Async version of list_pages."""
         options = {'depth': depth, 'hash': md5_hash, 'skipacl': skip_acl}
         logger.debug(f'Listing pages in namespace "{namespace}" with options: {options}')
-        return self._wiki.pages.list(namespace, **options)
+        return await self._call('dokuwiki.getPagelist', namespace, options)
+
+    def page_hashes(self, namespace: str = DEFAULT_NSP) -> Dict[str, str]:
+        """Return the md5 hash of every page in ``namespace`` and its sub namespaces.
+
+        Arguments:
+            namespace: List pages in this namespace.
+
+        Returns:
+            The page hashes keyed by the lower case page id.
+        """
+        return run_async(self.page_hashes_async(namespace))
+
+    async def page_hashes_async(self, namespace: str = DEFAULT_NSP) -> Dict[str, str]:
+        """Async version of page_hashes."""
+        pages = await self.list_pages_async(namespace, md5_hash=True)
+        return {page['id'].lower(): page.get('hash', '') for page in pages or []}
 
     def changes(self, timestamp: datetime):
         """Returns a list of changes since given timestamp.
@@ -111,7 +256,11 @@ class WikiClient:
         Returns:
             Returns a list of changes since given timestamp.
         """
-        return self._wiki.pages.changes(timestamp)
+        return run_async(self.changes_async(timestamp))
+
+    async def changes_async(self, timestamp: datetime):
+        """Async version of changes."""
+        return await self._call('wiki.getRecentChanges', _unix_time(timestamp))
 
     def append_page(self, page: str, content: str, summary: str, namespace: str = DEFAULT_NSP,
                     minor: bool = False):
@@ -124,24 +273,20 @@ class WikiClient:
             summary: Change summary
             minor: Whether this is a minor change
         """
+        return run_async(self.append_page_async(page, content, summary, namespace, minor))
+
+    async def append_page_async(self, page: str, content: str, summary: str, namespace: str = DEFAULT_NSP,
+                                minor: bool = False):
+        """Async version of append_page."""
         wiki_page = f'{namespace}:{page}'
+        options = {'sum': summary, 'minor': minor}
         result = False
         try:
-            with self._lock:
-                result = self._wiki.pages.append(wiki_page, content, summary, minor)
+            result = await self._call('dokuwiki.appendPage', wiki_page, content, options, idempotent=False)
         except DokuWikiError as e:
             logger.error(e)
         return result
 
-    async def append_page_async(self, page: str, content: str, summary: str, namespace: str = DEFAULT_NSP,
-                                minor: bool = False):
-        """Async wrapper for append_page."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None,
-            partial(self.append_page, page, content, summary, namespace, minor)
-        )
-
     def set_page(self, page: str, content: str, summary: str, namespace: str = DEFAULT_NSP,
                  minor: bool = False) -> bool:
         """Set/replace the content of ''page''.
@@ -156,27 +301,128 @@ class WikiClient:
         Returns:
             Returns True if the page was successfully set, False otherwise.
         """
-        if self._wiki is None:
+        return run_async(self.set_page_async(page, content, summary, namespace, minor))
+
+    async def set_page_async(self, page: str, content: str, summary: str, namespace: str = DEFAULT_NSP,
+                             minor: bool = False) -> bool:
+        """Async version of set_page."""
+        if not self._connected:
             logger.error('Not connected to the wiki. Call connect() first.')
             return False
         options = {'sum': summary, 'minor': minor}
         wiki_page = f'{namespace}:{page}'
         result = False
         try:
-            with self._lock:
-                result = self._wiki.pages.set(wiki_page, content, **options)
+            result = await self._call('wiki.putPage', wiki_page, content, options)
         except DokuWikiError as e:
             logger.error(e)
         return result
 
-    async def set_page_async(self, page: str, content: str, summary: str, namespace: str = DEFAULT_NSP,
-                             minor: bool = False) -> bool:
-        """Async wrapper for set_page."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None,
-            partial(self.set_page, page, content, summary, namespace, minor)
-        )
+    def set_pages(self, batch: Sequence[PageWrite], max_concurrent: Optional[int] = None) -> List[Union[bool, Exception]]:
+        """Set/replace the content of many pages using ``system.multicall`` batches.
+
+        Arguments:
+            batch: The page writes
+            max_concurrent: Maximum number of multicall requests in flight, default is the connection pool size
+
+        Returns:
+            One entry per page write: True if the page was set, otherwise the error of that page.
+        """
+        return run_async(self.set_pages_async(batch, max_concurrent))
+
+    async def set_pages_async(self, batch: Sequence[PageWrite], max_concurrent: Optional[int] = None,
+                              done_callback: Optional[Callable[[int, Any], None]] = None
+                              ) -> List[Union[bool, Exception]]:
+        """Async version of set_pages.
+
+        Arguments:
+            batch: The page writes
+            max_concurrent: Maximum number of multicall requests in flight, default is the connection pool size
+            done_callback: Optional callable(index, result) called for each page write when its request completes
+        """
+        if not self._connected:
+            logger.error('Not connected to the wiki. Call connect() first.')
+            return [False] * len(batch)
+        calls = [('wiki.putPage', (write.wiki_page, write.content, {'sum': write.summary, 'minor': write.minor}))
+                 for write in batch]
+        return await self._batch_async(calls, max_concurrent, done_callback)
+
+    def get_pages_info(self, names: Sequence[str]) -> List[Union[Dict, Exception]]:
+        """Get the page information of many pages using ``system.multicall`` batches.
+
+        Returns:
+            One entry per page: the page information (empty if the page does not exist) or the error of that page.
+        """
+        return run_async(self.get_pages_info_async(names))
+
+    async def get_pages_info_async(self, names: Sequence[str]) -> List[Union[Dict, Exception]]:
+        """Async version of get_pages_info."""
+        return await self._batch_async([('wiki.getPageInfo', (name,)) for name in names])
+
+    def get_pages(self, names: Sequence[str]) -> List[Union[str, Exception]]:
+        """Get the raw wiki text of many pages using ``system.multicall`` batches.
+
+        Returns:
+            One entry per page: the page content or the error of that page.
+        """
+        return run_async(self.get_pages_async(names))
+
+    async def get_pages_async(self, names: Sequence[str]) -> List[Union[str, Exception]]:
+        """Async version of get_pages."""
+        return await self._batch_async([('wiki.getPage', (name,)) for name in names])
+
+    async def _batch_async(self, calls: Sequence[Tuple[str, Sequence]], max_concurrent: Optional[int] = None,
+                           done_callback: Optional[Callable[[int, Any], None]] = None) -> List[Any]:
+        """Execute ``calls`` in multicall batches adapted to the payload size.
+
+        A failing request reports its error for every call of the batch, a fault reports for its own call only.
+        """
+        results: List[Any] = [None] * len(calls)
+        semaphore = asyncio.Semaphore(max_concurrent or self._pool_size)
+
+        async def send(start: int, stop: int):
+            async with semaphore:
+                try:
+                    batch_results = await self._multicall_async(calls[start:stop])
+                except (DokuWikiError, OcxWikiError, OSError, asyncio.TimeoutError) as e:
+                    logger.error(f'Batch of {stop - start} calls failed: {e}')
+                    batch_results = [e] * (stop - start)
+            for index, result in enumerate(batch_results, start):
+                if isinstance(result, DokuWikiError):
+                    logger.error(f'{calls[index][0]} {calls[index][1][0]}: {result}')
+                results[index] = result
+                if done_callback is not None:
+                    done_callback(index, result)
+
+        await asyncio.gather(*(send(start, stop) for start, stop in batches(calls, self.max_batch_bytes)))
+        return results
+
+    async def _multicall_async(self, calls: Sequence[Tuple[str, Sequence]]) -> List[Any]:
+        """Send ``calls`` as one multicall, falling back to single calls if the wiki lacks ``system.multicall``."""
+        if self._multicall:
+            try:
+                return await self._retry.run(lambda: self._transport.multicall(calls))
+            except DokuWikiError as e:
+                if 'system.multicall' not in str(e) and '-32601' not in str(e):
+                    raise
+                logger.warning(f'{self._url} does not support system.multicall, sending single calls')
+                self._multicall = False
+
+        async def single(method: str, params: Sequence):
+            try:
+                return await self._call(method, *params)
+            except DokuWikiError as e:
+                return e
+
+        return list(await asyncio.gather(*(single(method, params) for method, params in calls)))
+
+    def get_page(self, page: str) -> str:
+        """Get the raw wiki text of the latest version of ''page''."""
+        return run_async(self.get_page_async(page))
+
+    async def get_page_async(self, page: str) -> str:
+        """Async version of get_page."""
+        return await self._call('wiki.getPage', page)
 
     # Data structs
     def get_data(self, page: str, keep_order: bool = True) -> Dict:
@@ -186,9 +432,13 @@ class WikiClient:
             page: the page of interest
             keep_order: Return an ordered dict if True
         """
+        return run_async(self.get_data_async(page, keep_order))
+
+    async def get_data_async(self, page: str, keep_order: bool = True) -> Dict:
+        """Async version of get_data."""
         data = {}
         try:
-            content = self._wiki.pages.get(page)
+            content = await self.get_page_async(page)
             data = struct_data.struct_get(content, keep_order)
         except DokuWikiError as e:
             logger.error(e)
@@ -196,7 +446,11 @@ class WikiClient:
 
     def get_page_info(self, page: str) -> Dict:
         """Get the page information of ''page''."""
-        return self._wiki.pages.info(page)
+        return run_async(self.get_page_info_async(page))
+
+    async def get_page_info_async(self, page: str) -> Dict:
+        """Async version of get_page_info."""
+        return await self._call('wiki.getPageInfo', page)
 
     # Wiki media
     def list_media(self, namespace: str, depth: int = 0, md5_hash: bool = False, skip_acl: bool = False,
@@ -210,10 +464,15 @@ class WikiClient:
             skip_acl: skip everything regardless of ACL
             pattern: list only media matching pattern
         """
+        return run_async(self.list_media_async(namespace, depth, md5_hash, skip_acl, pattern))
+
+    async def list_media_async(self, namespace: str, depth: int = 0, md5_hash: bool = False, skip_acl: bool = False,
+                               pattern: str = '*') -> Dict:
+        """Async version of list_media."""
         options = {'depth': depth, 'hash': md5_hash, 'skipacl': skip_acl}
         result = {}
         try:
-            result = self._wiki.medias.list(namespace, **options)
+            result = await self._call('wiki.getAttachments', namespace, options)
         except DokuWikiError as e:
             logger.error(e)
         return result
@@ -227,7 +486,11 @@ class WikiClient:
         Returns:
             Returns a list of changes since given ''timestamp''.
         """
-        return self._wiki.medias.changes(timestamp)
+        return run_async(self.media_changes_async(timestamp))
+
+    async def media_changes_async(self, timestamp: datetime):
+        """Async version of media_changes."""
+        return await self._call('wiki.getRecentMediaChanges', _unix_time(timestamp))
 
     def media_info(self, media: str):
         """Returns information of ''media''.
@@ -238,7 +501,11 @@ class WikiClient:
         Returns:
             Returns information of ''media''.
         """
-        return self._wiki.medias.info(media)
+        return run_async(self.media_info_async(media))
+
+    async def media_info_async(self, media: str):
+        """Async version of media_info."""
+        return await self._call('wiki.getAttachmentInfo', media)
 
     def add_media(self, media: str, filepath: Path, overwrite: bool = True):
         """Set media from local file filepath.
@@ -248,7 +515,12 @@ class WikiClient:
             filepath: path to local media file
             overwrite: parameter specify if the media must be replaced if it exists remotely.
         """
-        self._wiki.medias.add(media, filepath.resolve(), overwrite)
+        return run_async(self.add_media_async(media, filepath, overwrite))
+
+    async def add_media_async(self, media: str, filepath: Path, overwrite: bool = True):
+        """Async version of add_media."""
+        data = await asyncio.to_thread(filepath.resolve().read_bytes)
+        return await self._call('wiki.putAttachment', media, Binary(data), {'ow': overwrite})
 
     def media_delete(self, media: str):
         """Delete ''media''.
@@ -256,4 +528,8 @@ class WikiClient:
         Arguments:
             media: name of media
         """
-        return self._wiki.medias.delete(media)
+        return run_async(self.media_delete_async(media))
+
+    async def media_delete_async(self, media: str):
+        """Async version of media_delete."""
+        return await self._call('wiki.deleteAttachment', media)
@@ -0,0 +1,151 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Adaptive limit of the number of concurrent wiki requests."""
+
+# System imports
+from typing import Optional
+import asyncio
+import time
+
+# Third party imports
+from loguru import logger
+
+
+class AdaptiveLimiter:
+    """An AIMD (additive increase, multiplicative decrease) limit of the requests in flight.
+
+    While the request latency stays close to the lowest latency observed, the limit grows by about one request per
+    round trip as long as at least half of the slots are in use. When the smoothed latency exceeds ``tolerance``
+    times the baseline, or a request fails with an overload error, the limit is multiplied by ``backoff``. Only
+    requests started after the last decrease can decrease the limit again, so one congestion event cuts the limit
+    once.
+
+    Args:
+        floor: The minimum limit
+        ceiling: The maximum limit
+        initial: The initial limit, default ``floor``
+        backoff: The factor applied to the limit when the wiki is overloaded
+        tolerance: The ratio of the smoothed latency to the baseline latency considered as overload
+        smoothing: The weight of a new latency sample in the smoothed latency
+
+    Attributes:
+        peak: The highest limit reached
+        decreases: The number of times the limit was cut back
+    """
+
+    def __init__(self, floor: int = 1, ceiling: int = 32, initial: Optional[int] = None, backoff: float = 0.7,
+                 tolerance: float = 2.0, smoothing: float = 0.2):
+        self._floor = max(1, floor)
+        self._ceiling = max(self._floor, ceiling)
+        self._limit = float(min(self._ceiling, max(self._floor, initial or self._floor)))
+        self._backoff = backoff
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._in_flight = 0
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._epoch = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self.peak = int(self._limit)
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """The current limit of requests in flight."""
+        return int(self._limit)
+
+    @property
+    def floor(self) -> int:
+        """Return the minimum limit."""
+        return self._floor
+
+    @property
+    def ceiling(self) -> int:
+        """Return the maximum limit."""
+        return self._ceiling
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests in flight."""
+        return self._in_flight
+
+    @property
+    def latency(self) -> Optional[float]:
+        """The smoothed latency in seconds, None before the first request completed."""
+        return self._latency
+
+    async def acquire(self) -> int:
+        """Wait for a free slot.
+
+        Returns:
+            The token to pass to :meth:`release`
+        """
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self._epoch
+
+    async def release(self, latency: float, overload: bool = False, token: Optional[int] = None):
+        """Free a slot and adapt the limit to the outcome of its request.
+
+        Arguments:
+            latency: The request latency in seconds, normalised by the request size by the caller if they vary
+            overload: True if the request failed in a way indicating an overloaded wiki
+            token: The token returned by :meth:`acquire`
+        """
+        saturated = 2 * self._in_flight >= self.limit
+        self._in_flight -= 1
+        self._adapt(latency, overload, saturated, self._epoch if token is None else token)
+        if self._condition is not None:
+            async with self._condition:
+                self._condition.notify_all()
+
+    def slot(self) -> '_Slot':
+        """An async context manager holding a slot and timing its request.
+
+        Set ``overload`` or ``size`` (the number of calls sharing the latency) on the slot before leaving it.
+        """
+        return _Slot(self)
+
+    def _adapt(self, latency: float, overload: bool, saturated: bool, token: int):
+        if not overload:
+            self._latency = latency if self._latency is None else \
+                self._smoothing * latency + (1 - self._smoothing) * self._latency
+            if self._baseline is None or latency < self._baseline:
+                self._baseline = latency
+            else:
+                # Let the baseline follow a permanent latency increase slowly
+                self._baseline += 0.01 * (latency - self._baseline)
+        congested = overload or (self._baseline is not None and self._latency > self._tolerance * self._baseline)
+        if congested:
+            if token == self._epoch:
+                self._limit = max(float(self._floor), self._limit * self._backoff)
+                self._epoch += 1
+                self.decreases += 1
+                logger.debug(f'Concurrency limit decreased to {self.limit} (latency {self._latency}, '
+                             f'overload {overload})')
+        elif saturated:
+            self._limit = min(float(self._ceiling), self._limit + 1 / self._limit)
+            self.peak = max(self.peak, self.limit)
+
+
+class _Slot:
+    """A slot of an :class:`AdaptiveLimiter` held for one request."""
+
+    def __init__(self, limiter: AdaptiveLimiter):
+        self._limiter = limiter
+        self._start = 0.0
+        self._token = 0
+        self.overload = False
+        self.size = 1
+
+    async def __aenter__(self) -> '_Slot':
+        self._token = await self._limiter.acquire()
+        self._start = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        latency = (time.monotonic() - self._start) / max(1, self.size)
+        overload = self.overload or isinstance(exc, (OSError, asyncio.TimeoutError))
+        await self._limiter.release(latency, overload, self._token)
@@ -0,0 +1,257 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Conditional, parallel schema download backed by a content-addressed store."""
+
+# System imports
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlparse
+from urllib.request import Request, build_opener, url2pathname, OpenerDirector
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+# Third party imports
+from loguru import logger
+from lxml import etree
+from xsdata.models.enums import Namespace
+
+# Module imports
+import ocxwiki
+from ocxwiki import SCHEMA_FOLDER
+from ocxwiki.error import SchemaDownloadError
+
+DEFAULT_STORE_FOLDER = Path(SCHEMA_FOLDER or '.') / 'store'
+DEFAULT_WORKERS = 8  # Schema files downloaded concurrently
+DEFAULT_TIMEOUT = 30.0  # Seconds before a download is abandoned
+IMPORTS_FOLDER = 'imports'  # Sub folder of the download folder holding the imported schemas
+
+_XSD = 'http://www.w3.org/2001/XMLSchema'
+_REFERENCES = (f'{{{_XSD}}}import', f'{{{_XSD}}}include', f'{{{_XSD}}}redefine')
+# W3C schemas bundled with xsdata, used instead of downloading them
+_BUNDLED = {ns.uri: ns.location for ns in Namespace if ns.location}
+
+
+class ContentStore:
+    """Files stored once by the sha256 hash of their content.
+
+    Args:
+        folder: The store folder
+    """
+
+    def __init__(self, folder: Union[Path, str]):
+        self._folder = Path(folder)
+
+    def path(self, digest: str) -> Path:
+        """The file holding the content with ``digest``."""
+        return self._folder / digest[:2] / digest
+
+    def has(self, digest: Optional[str]) -> bool:
+        """True if the content with ``digest`` is stored."""
+        return bool(digest) and self.path(digest).is_file()
+
+    def put(self, data: bytes) -> str:
+        """Store ``data``.
+
+        Returns:
+            The content digest
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if not path.is_file():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f'{digest}.{os.getpid()}.{threading.get_ident()}.tmp')
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """The content with ``digest``."""
+        return self.path(digest).read_bytes()
+
+
+@dataclass
+class DownloadResult:
+    """The outcome of a schema download.
+
+    Parameters:
+        files: The local schema files keyed by their url
+        downloaded: The number of files transferred
+        not_modified: The number of files confirmed unchanged by the server
+        stale: The number of stored files used because the server could not be reached
+        local: The number of files read from the local file system
+        bytes: The bytes transferred
+    """
+    files: Dict[str, Path] = field(default_factory=dict)
+    downloaded: int = 0
+    not_modified: int = 0
+    stale: int = 0
+    local: int = 0
+    bytes: int = 0
+
+
+class SchemaDownloader:
+    """Download a schema and all the schemas it imports or includes.
+
+    Every file is revalidated with ``If-None-Match`` / ``If-Modified-Since`` against the ``ETag`` and
+    ``Last-Modified`` of the stored copy, so an unchanged schema costs one round trip per file and no transfer.
+    Imports are fetched concurrently as soon as the importing schema has arrived. The content is kept in a
+    :class:`ContentStore`, so schema versions sharing files store them once, and a stored copy is used when the
+    server cannot be reached. W3C schemas bundled with xsdata (e.g. ``xml.xsd``) are never downloaded.
+
+    Args:
+        folder: The store folder
+        max_workers: The number of files downloaded concurrently
+        timeout: Seconds before a download is abandoned
+        opener: The urllib opener, default a new opener
+    """
+
+    def __init__(self, folder: Union[Path, str] = DEFAULT_STORE_FOLDER, max_workers: int = DEFAULT_WORKERS,
+                 timeout: float = DEFAULT_TIMEOUT, opener: Optional[OpenerDirector] = None):
+        self._folder = Path(folder)
+        self._store = ContentStore(self._folder / 'objects')
+        self._max_workers = max(1, max_workers)
+        self._timeout = timeout
+        self._opener = opener or build_opener()
+        self._opener.addheaders = [('User-agent', f'ocxwiki/{ocxwiki.__version__}')]
+
+    @property
+    def store(self) -> ContentStore:
+        """Return the content store."""
+        return self._store
+
+    def download(self, url: str, folder: Union[Path, str]) -> DownloadResult:
+        """Download the schema ``url`` and its imports to ``folder``.
+
+        The schema is written to ``folder`` and the imported schemas to its ``imports`` sub folder, replacing the
+        schema files of a previous download. The schema parser reads the folder before the sub folder, so the
+        namespace prefixes of the main schema are known when the imports are parsed.
+
+        Raises:
+            SchemaDownloadError: If the schema ``url`` cannot be downloaded and is not stored
+        """
+        index = self._load_index()
+        result = DownloadResult()
+        digests: Dict[str, str] = {}
+        pool = ThreadPoolExecutor(self._max_workers, thread_name_prefix='ocxwiki-download')
+        try:
+            pending: Dict[Future, str] = {pool.submit(self._fetch, url, index.get(url)): url}
+            seen = {url}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    location = pending.pop(future)
+                    try:
+                        entry, status, size = future.result()
+                    except SchemaDownloadError as e:
+                        if location == url:
+                            raise
+                        logger.error(f'Skipping the imported schema: {e}')
+                        continue
+                    index[location] = entry
+                    digests[location] = entry['digest']
+                    setattr(result, status, getattr(result, status) + 1)
+                    result.bytes += size
+                    for reference in self._references(location, self._store.get(entry['digest'])):
+                        if reference not in seen:
+                            seen.add(reference)
+                            pending[pool.submit(self._fetch, reference, index.get(reference))] = reference
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._save_index(index)
+        result.files = self._materialize(url, digests, Path(folder))
+        logger.debug(f'Schema {url}: {result.downloaded} files downloaded ({result.bytes} bytes), '
+                     f'{result.not_modified} not modified, {result.stale} stale')
+        return result
+
+    def _fetch(self, url: str, entry: Optional[Dict]) -> Tuple[Dict, str, int]:
+        """Fetch ``url`` unless the stored ``entry`` is still valid.
+
+        Returns:
+            The index entry, the result counter to increment and the bytes transferred
+        """
+        stored = entry is not None and self._store.has(entry.get('digest'))
+        parsed = urlparse(url)
+        if parsed.scheme in ('', 'file'):
+            path = Path(url2pathname(parsed.path)) if parsed.scheme else Path(url)
+            try:
+                data = path.read_bytes()
+            except OSError as e:
+                raise SchemaDownloadError(f'Cannot read the schema {url}: {e}') from e
+            return {'digest': self._store.put(data)}, 'local', 0
+        request = Request(url)
+        if stored:
+            if entry.get('etag'):
+                request.add_header('If-None-Match', entry['etag'])
+            if entry.get('last_modified'):
+                request.add_header('If-Modified-Since', entry['last_modified'])
+        try:
+            with self._opener.open(request, timeout=self._timeout) as response:
+                data = response.read()
+                headers = response.headers
+        except HTTPError as e:
+            if e.code == 304 and stored:
+                return entry, 'not_modified', 0
+            if stored:
+                logger.warning(f'Using the stored copy of {url}, the server answered {e.code}')
+                return entry, 'stale', 0
+            raise SchemaDownloadError(f'Cannot download the schema {url}: HTTP {e.code}') from e
+        except (OSError, ValueError) as e:
+            if stored:
+                logger.warning(f'Using the stored copy of {url}, the server cannot be reached: {e}')
+                return entry, 'stale', 0
+            raise SchemaDownloadError(f'Cannot download the schema {url}: {e}') from e
+        entry = {'digest': self._store.put(data), 'etag': headers.get('ETag'),
+                 'last_modified': headers.get('Last-Modified')}
+        return entry, 'downloaded', len(data)
+
+    @staticmethod
+    def _references(url: str, data: bytes) -> List[str]:
+        """The urls of the schemas imported, included or redefined by the schema ``url``."""
+        try:
+            root = etree.fromstring(data)
+        except etree.XMLSyntaxError as e:
+            logger.warning(f'Cannot parse the schema {url}: {e}')
+            return []
+        references = []
+        for element in root.iter(*_REFERENCES):
+            namespace = element.get('namespace')
+            location = element.get('schemaLocation')
+            if namespace in _BUNDLED:
+                references.append(_BUNDLED[namespace])
+            elif location:
+                references.append(urljoin(url, location))
+        return references
+
+    def _materialize(self, url: str, digests: Dict[str, str], folder: Path) -> Dict[str, Path]:
+        """Copy the stored schema files to the download ``folder``."""
+        imports = folder / IMPORTS_FOLDER
+        imports.mkdir(parents=True, exist_ok=True)
+        for old in list(folder.glob('*.xsd')) + list(imports.glob('*.xsd')):
+            old.unlink()
+        files = {}
+        for location, digest in digests.items():
+            name = Path(urlparse(location).path).name or 'schema.xsd'
+            target = (folder if location == url else imports) / name
+            if target.exists():
+                target = target.with_name(f'{target.stem}-{digest[:8]}{target.suffix}')
+            shutil.copyfile(self._store.path(digest), target)
+            files[location] = target
+        return files
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            return json.loads((self._folder / 'index.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: Dict[str, Dict]):
+        self._folder.mkdir(parents=True, exist_ok=True)
+        path = self._folder / 'index.json'
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(index, indent=1, sort_keys=True), encoding='utf-8')
+        os.replace(tmp, path)
@@ -1,7 +1,32 @@
 #  Copyright (c) 2023. OCX Consortium https://3docx.org. See the LICENSE
 """Exceptions raised by the ocxwiki module."""
+from typing import Dict, Optional
 
 
 class OcxWikiError(Exception):
     """Exception raised by this module when there is an error."""
     pass
+
+
+class WikiTransportError(OcxWikiError):
+    """Exception raised when the wiki answers an XML-RPC request with a non-successful HTTP status.
+
+    Parameters:
+        status: The HTTP status code
+        headers: The HTTP response headers (lower case names)
+    """
+
+    def __init__(self, message: str, status: int = 0, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class WikiUnavailableError(OcxWikiError):
+    """Exception raised when the wiki has been down for longer than the circuit breaker waits."""
+    pass
+
+
+class SchemaDownloadError(OcxWikiError):
+    """Exception raised when a schema cannot be downloaded and there is no stored copy."""
+    pass
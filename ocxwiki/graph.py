@@ -0,0 +1,119 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""The reference graph of the schema items, answering which items use a given item."""
+
+# System imports
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Module imports
+from ocx_schema_parser.transformer import Transformer
+
+
+def _qualified(type_name: Optional[str], prefix: str) -> Optional[str]:
+    """The type name ``prefix:name``, None if it is not a schema type name."""
+    if not type_name or ' ' in type_name:  # Anonymous types are described, e.g. 'Restriction of type xs:token'
+        return None
+    return type_name if ':' in type_name else f'{prefix}:{type_name}'
+
+
+class ReferenceGraph:
+    """The references between the schema items, stored as integer indexed adjacency arrays.
+
+    The nodes are the qualified names ``prefix:name`` of the items having a wiki page. An element references its
+    children, its global attributes and the types of its children and attributes that have a page, a global
+    attribute or simple type references its type. The edges of each node are a slice of a flat ``array`` of node
+    indices, in both directions, so the graph takes a few bytes per edge.
+
+    Args:
+        names: The node names
+        edges: The ``(source, target)`` node indices of the references, duplicates are ignored
+    """
+
+    def __init__(self, names: List[str], edges: Iterable[Tuple[int, int]]):
+        self._names = list(names)
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        pairs = sorted(set(edges))
+        self._uses = self._compress(pairs, len(self._names))
+        self._used_by = self._compress(sorted((target, source) for source, target in pairs), len(self._names))
+
+    @staticmethod
+    def _compress(pairs: List[Tuple[int, int]], size: int) -> Tuple[array, array]:
+        """The offsets and targets of the sorted ``(source, target)`` pairs, the targets of node ``i`` are
+        ``targets[offsets[i]:offsets[i + 1]]``."""
+        offsets = array('I', [0] * (size + 1))
+        for source, _ in pairs:
+            offsets[source + 1] += 1
+        for i in range(size):
+            offsets[i + 1] += offsets[i]
+        return offsets, array('I', (target for _, target in pairs))
+
+    @classmethod
+    def from_transformer(cls, transformer: Transformer) -> 'ReferenceGraph':
+        """Build the graph of the schema processed by ``transformer``."""
+        items = [(f'{ocx.get_prefix()}:{ocx.get_name()}', ocx) for ocx in transformer.get_ocx_elements()]
+        items += [(f'{enum.prefix}:{enum.name}', None) for enum in transformer.get_enumerators().values()]
+        items += [(f'{attribute.prefix}:{attribute.name}', attribute)
+                  for attribute in (*transformer.get_global_attributes(), *transformer.get_simple_types())]
+        index: Dict[str, int] = {}
+        for name, _ in items:
+            index.setdefault(name, len(index))
+
+        def references(item) -> Iterable[Optional[str]]:
+            if item is None:
+                return
+            if hasattr(item, 'get_children'):
+                for child in item.get_children():
+                    yield f'{child.prefix}:{child.name}'
+                    yield _qualified(child.type, child.prefix)
+                for attribute in item.get_attributes():
+                    yield f'{attribute.prefix}:{attribute.name}'
+                    yield _qualified(attribute.type, attribute.prefix)
+            else:
+                yield _qualified(item.type, item.prefix)
+
+        edges = [(index[name], index[target]) for name, item in items for target in references(item)
+                 if target in index and target != name]
+        return cls(list(index), edges)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    @property
+    def edges(self) -> int:
+        """The number of references."""
+        return len(self._uses[1])
+
+    def _adjacent(self, name: str, adjacency: Tuple[array, array]) -> List[str]:
+        i = self._index.get(name)
+        if i is None:
+            return []
+        offsets, targets = adjacency
+        return [self._names[j] for j in targets[offsets[i]:offsets[i + 1]]]
+
+    def uses(self, name: str) -> List[str]:
+        """The items referenced by the item ``name``, sorted by name."""
+        return sorted(self._adjacent(name, self._uses))
+
+    def used_by(self, name: str) -> List[str]:
+        """The items referencing the item ``name``, sorted by name."""
+        return sorted(self._adjacent(name, self._used_by))
+
+    def impacted(self, names: Iterable[str], previous: Optional['ReferenceGraph'] = None) -> Set[str]:
+        """The items whose page must be republished when the items ``names`` change.
+
+        These are the changed items and the items using them, as their tables show the declarations of the
+        changed items. Give the graph of the schema before the change as ``previous`` to include the former users
+        of removed items and the items whose "Used by" table changes because a changed item references them
+        since, or no longer references them.
+        """
+        impacted = set()
+        for name in names:
+            impacted.add(name)
+            impacted.update(self._adjacent(name, self._used_by))
+            if previous is not None:
+                impacted.update(previous._adjacent(name, previous._used_by))
+                impacted.update(set(self._adjacent(name, self._uses)) ^ set(previous._adjacent(name, previous._uses)))
+        return impacted
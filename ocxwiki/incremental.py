@@ -0,0 +1,239 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Incremental schema processing re-transforming only the global elements affected by a change."""
+
+# System imports
+from dataclasses import dataclass, field
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+import hashlib
+
+# Third party imports
+from loguru import logger
+from lxml import etree
+from lxml.etree import QName
+
+# Module imports
+from ocx_schema_parser.helpers import SchemaHelper
+from ocx_schema_parser.ocxparser import OcxParser
+from ocx_schema_parser.transformer import Transformer
+from ocx_schema_parser.xelement import LxmlElement
+from ocxwiki.schema_cache import SchemaElement, schema_files
+
+# The schema constructs of a global element and its parent types that are read when transforming it
+_REFERENCING = ('element', 'attribute', 'attributeGroup', 'group')
+# The ocx-schema-parser releases whose Transformer internals the IncrementalTransformer is built on
+PARSER_RELEASES = ('2.0.',)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _tag(qname: str, namespaces: Dict[str, str]) -> str:
+    """The unique tag ``{namespace}name`` of the schema type ``prefix:name``, the type itself if it has no known prefix."""
+    namespace = namespaces.get(LxmlElement.namespace_prefix(qname))
+    return SchemaHelper.unique_tag(LxmlElement.strip_namespace_prefix(qname), namespace) if namespace else qname
+
+
+@dataclass
+class SchemaState:
+    """The content hashes of a processed schema and the dependencies of its global elements.
+
+    Parameters:
+        version: The schema version
+        namespaces: The namespace prefixes of the schema
+        files: The sha256 of the XSD files keyed by their path relative to the schema folder
+        sources: The file defining each global definition, keyed by tag
+        definitions: The sha256 of each global definition, keyed by tag
+        groups: The tag of the substitution group head of the global elements that have one
+        dependencies: The tags of the global definitions read when transforming each global element, keyed by tag
+        source: The url or the folder the schema was processed from
+    """
+    version: Optional[str]
+    namespaces: Dict[str, str]
+    files: Dict[str, str] = field(default_factory=dict)
+    sources: Dict[str, str] = field(default_factory=dict)
+    definitions: Dict[str, str] = field(default_factory=dict)
+    groups: Dict[str, str] = field(default_factory=dict)
+    dependencies: Dict[str, List[str]] = field(default_factory=dict)
+    source: str = ''
+
+    @classmethod
+    def from_parser(cls, folder: Union[Path, str], parser: OcxParser,
+                    previous: Optional['SchemaState'] = None) -> 'SchemaState':
+        """Hash the XSD files in ``folder`` and the global definitions parsed from them.
+
+        Definitions in files unchanged since the ``previous`` state keep their hash without being serialised again.
+        """
+        folder = Path(folder).resolve()
+        namespaces = dict(parser.get_namespaces())
+        state = cls(parser.get_schema_version(), namespaces,
+                    {file.relative_to(folder).as_posix(): _sha256(file.read_bytes()) for file in schema_files(folder)})
+        bases: Dict[str, str] = {}
+        for tag, node in parser.get_lookup_table().items():
+            base = node.base or ''
+            source = bases.get(base)
+            if source is None:
+                source = bases[base] = cls._source(base, folder)
+            state.sources[tag] = source
+            if (previous is not None and tag in previous.definitions and previous.sources.get(tag) == source
+                    and source in state.files and previous.files.get(source) == state.files[source]):
+                state.definitions[tag] = previous.definitions[tag]
+                if tag in previous.groups:
+                    state.groups[tag] = previous.groups[tag]
+                continue
+            state.definitions[tag] = _sha256(etree.tostring(node, with_tail=False))
+            group = node.get('substitutionGroup')
+            if group:
+                state.groups[tag] = _tag(group, namespaces)
+        return state
+
+    @classmethod
+    def from_transformer(cls, folder: Union[Path, str], transformer: Transformer) -> 'SchemaState':
+        """The state of the schema in ``folder`` fully processed by ``transformer``."""
+        state = cls.from_parser(folder, transformer.parser)
+        state.track(transformer.parser, transformer.get_ocx_elements())
+        return state
+
+    @staticmethod
+    def _source(base: str, folder: Path) -> str:
+        """The path of the schema file ``base`` relative to the schema ``folder``."""
+        parsed = urlparse(base)
+        path = Path(url2pathname(parsed.path)) if parsed.scheme == 'file' else Path(base)
+        try:
+            return path.resolve().relative_to(folder).as_posix()
+        except ValueError:
+            return base
+
+    def track(self, parser: OcxParser, elements: Iterable, previous: Optional['SchemaState'] = None):
+        """Record the dependencies of the transformed ``elements``.
+
+        Elements reused from the ``previous`` state keep their recorded dependencies.
+        """
+        for ocx in elements:
+            tag = ocx.get_tag()
+            if isinstance(ocx, SchemaElement):
+                self.dependencies[tag] = previous.dependencies[tag]
+            else:
+                self.dependencies[tag] = self._dependencies(parser, ocx)
+
+    def _dependencies(self, parser: OcxParser, ocx) -> List[str]:
+        """The tags of the global definitions read by the transformer when processing the global element ``ocx``.
+
+        These are the element itself, its parent types, the referenced elements, attributes and groups, and the
+        names of its children, which are the heads of the substitution groups replacing them.
+        """
+        namespaces = self.namespaces
+        prefix = parser.get_prefix_from_namespace(ocx.get_namespace())
+        parents = ocx.get_parents()
+        tags = {ocx.get_tag(), *parents}
+        for node in (ocx.get_schema_element(), *parents.values()):
+            if node.get('type'):
+                tags.add(_tag(node.get('type'), namespaces))
+            for item in node.iter(etree.Element):
+                local = QName(item).localname
+                if item.get('base'):
+                    tags.add(_tag(item.get('base'), namespaces))
+                if local in _REFERENCING and item is not node:
+                    if item.get('ref'):
+                        tags.add(_tag(item.get('ref'), namespaces))
+                    elif local == 'element' and item.get('name'):
+                        tags.add(_tag(f'{prefix}:{item.get("name")}', namespaces))
+        return sorted(tags)
+
+    def is_compatible(self, previous: Optional['SchemaState']) -> bool:
+        """True if elements transformed in the ``previous`` state can be reused in this state."""
+        return (previous is not None and previous.source == self.source and previous.version == self.version
+                and previous.namespaces == self.namespaces)
+
+    def changes(self, previous: 'SchemaState') -> Set[str]:
+        """The tags of the global definitions added, removed or changed since the ``previous`` state.
+
+        A changed substitution group member also changes its head, as the members replace the head in the child
+        tables.
+        """
+        changed = {tag for tag in self.definitions.keys() | previous.definitions.keys()
+                   if self.definitions.get(tag) != previous.definitions.get(tag)}
+        heads = {state.groups[tag] for tag in changed for state in (self, previous) if tag in state.groups}
+        return changed | heads
+
+    def affected(self, changes: Set[str]) -> Set[str]:
+        """The tags of the global elements depending on any of the global definitions ``changes``."""
+        return {tag for tag, dependencies in self.dependencies.items() if not changes.isdisjoint(dependencies)}
+
+
+class IncrementalTransformer(Transformer):
+    """A :class:`Transformer` reusing the global elements of a previously processed schema.
+
+    All XSD files are parsed, which is cheap, but only the global elements depending on a definition added,
+    removed or changed since the ``previous`` state are transformed again. The other elements are taken from
+    ``elements``. Enumerators, simple types and global attributes are always transformed. Nothing is reused if
+    the ``previous`` state is of another schema ``source``.
+
+    The parser has no public interface to transform a subset of the global elements, so the transformer extends
+    ``Transformer._transform_objects``. It is only used with the parser releases it is tested with, see
+    :meth:`supports_parser`.
+
+    Args:
+        elements: The global elements of the previously processed schema
+        previous: The state of the previously processed schema
+        source: The url or the folder of the processed schema
+
+    Attributes:
+        state: The state of the processed schema
+        reprocessed: The tags of the transformed global elements
+    """
+
+    def __init__(self, elements: Iterable, previous: Optional[SchemaState], source: str = ''):
+        super().__init__()
+        self._previous = previous
+        self._elements = {ocx.get_tag(): ocx for ocx in elements}
+        self._folder: Optional[Path] = None
+        self._source = source
+        self.state: Optional[SchemaState] = None
+        self.reprocessed: Set[str] = set()
+
+    @staticmethod
+    def supports_parser() -> bool:
+        """True if the installed ocx-schema-parser is a release the transformer is tested with."""
+        try:
+            version = metadata.version('ocx-schema-parser')
+        except metadata.PackageNotFoundError:
+            return False
+        return version.startswith(PARSER_RELEASES)
+
+    def transform_schema_from_folder(self, folder: Path) -> bool:
+        self._folder = Path(folder)
+        return super().transform_schema_from_folder(folder)
+
+    def _transform_objects(self) -> None:
+        parser = self.parser
+        previous = self._previous
+        state = SchemaState.from_parser(self._folder, parser, previous)
+        state.source = self._source
+        tags = parser.get_schema_element_types()
+        if state.is_compatible(previous):
+            changes = state.changes(previous)
+            reused = {tag for tag in tags if tag in self._elements and tag in previous.dependencies}
+            reused -= previous.affected(changes)
+        else:
+            changes, reused = set(state.definitions), set()
+        dirty = [tag for tag in tags if tag not in reused]
+        # Let the base class transform the affected elements only
+        parser.get_schema_element_types = lambda: dirty
+        try:
+            super()._transform_objects()
+        finally:
+            del parser.get_schema_element_types
+        transformed = self._ocx_global_elements
+        self._ocx_global_elements = {tag: transformed[tag] if tag in transformed
+                                     else SchemaElement.from_element(self._elements[tag]) for tag in tags}
+        state.track(parser, self._ocx_global_elements.values(), previous)
+        self.state = state
+        self.reprocessed = set(dirty)
+        self._elements = {}
+        logger.debug(f'Transformed {len(dirty)} of {len(tags)} global elements, '
+                     f'{len(changes)} schema definitions changed')
@@ -0,0 +1,152 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Append-only checkpoint journal of publish runs."""
+
+# System imports
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+import datetime
+import json
+import time
+import uuid
+
+# Third party imports
+from loguru import logger
+
+# Module imports
+from ocxwiki import CACHE_FOLDER
+from ocxwiki.manifest import target_name
+
+FLUSH_RECORDS = 200  # Buffered item records written in one go
+FLUSH_INTERVAL = 1.0  # Maximum seconds an item record stays buffered
+
+CONFIRMED = ('written', 'unchanged')  # Item outcomes which need no publish when resuming
+
+
+class PublishJournal:
+    """The checkpoint journal of one publish run.
+
+    The journal is a JSON lines file. The first line describes the run (run id, schema version, namespace and wiki
+    url), followed by one line per finished item with the item key, content hash and outcome, and a last line when
+    the run completed. Item records are buffered and written in batches of :data:`FLUSH_RECORDS` records or every
+    :data:`FLUSH_INTERVAL` seconds so journaling does not slow down the upload loop.
+
+    Args:
+        path: The journal file
+        run_id: The run id
+        schema_version: The published schema version
+        namespace: The publish namespace
+        wiki_url: The wiki url
+    """
+
+    def __init__(self, path: Path, run_id: str, schema_version: str, namespace: str, wiki_url: str):
+        self._path = Path(path)
+        self.run_id = run_id
+        self.schema_version = schema_version
+        self.namespace = namespace
+        self.wiki_url = wiki_url
+        self._items: Dict[str, Dict] = {}
+        self._completed = False
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def folder(wiki_url: str, namespace: str, cache_folder: Union[Path, str] = CACHE_FOLDER) -> Path:
+        """The folder holding the journals of ``namespace`` on the wiki ``wiki_url``."""
+        return Path(cache_folder) / 'journals' / target_name(wiki_url, namespace)
+
+    @classmethod
+    def start(cls, wiki_url: str, namespace: str, schema_version: str,
+              cache_folder: Union[Path, str] = CACHE_FOLDER) -> 'PublishJournal':
+        """Start the journal of a new publish run."""
+        run_id = f'{datetime.datetime.now().strftime("%Y%m%dT%H%M%S")}-{uuid.uuid4().hex[:8]}'
+        path = cls.folder(wiki_url, namespace, cache_folder) / f'{run_id}.jsonl'
+        journal = cls(path, run_id, schema_version, namespace, wiki_url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        journal._buffer.append(json.dumps({'event': 'start', 'run': run_id, 'schema_version': schema_version,
+                                           'namespace': namespace, 'wiki_url': wiki_url,
+                                           'started': datetime.datetime.now().isoformat(timespec='seconds')}))
+        journal.flush()
+        return journal
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['PublishJournal']:
+        """Load a journal file. A truncated last line, e.g. after a crash, is ignored.
+
+        Returns:
+            The journal or None if the file is not a journal
+        """
+        journal = None
+        try:
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if journal is None:
+                        if record.get('event') != 'start':
+                            return None
+                        journal = cls(path, record['run'], record['schema_version'], record['namespace'],
+                                      record['wiki_url'])
+                    elif record.get('event') == 'complete':
+                        journal._completed = True
+                    elif 'key' in record:
+                        journal._items[record['key']] = record
+        except (OSError, KeyError) as e:
+            logger.warning(f'Cannot read the publish journal {path}: {e}')
+            return None
+        return journal
+
+    @classmethod
+    def latest(cls, wiki_url: str, namespace: str,
+               cache_folder: Union[Path, str] = CACHE_FOLDER) -> Optional['PublishJournal']:
+        """Return the journal of the latest publish run to ``namespace`` on the wiki ``wiki_url``, if any."""
+        folder = cls.folder(wiki_url, namespace, cache_folder)
+        for path in sorted(folder.glob('*.jsonl'), reverse=True) if folder.is_dir() else []:
+            journal = cls.load(path)
+            if journal is not None:
+                return journal
+        return None
+
+    @property
+    def path(self) -> Path:
+        """Return the journal file."""
+        return self._path
+
+    @property
+    def completed(self) -> bool:
+        """True if the run completed."""
+        return self._completed
+
+    def confirmed(self) -> Dict[str, str]:
+        """The content hash of the items confirmed on the wiki, keyed by the item key."""
+        return {key: record.get('hash', '') for key, record in self._items.items()
+                if record.get('outcome') in CONFIRMED}
+
+    def record(self, key: str, content_hash: str, outcome: str):
+        """Record the ``outcome`` of the item ``key``.
+
+        Arguments:
+            key: The item key
+            content_hash: The hash of the rendered content, empty if rendering failed
+            outcome: ``written``, ``unchanged`` or ``failed``
+        """
+        record = {'key': key, 'hash': content_hash, 'outcome': outcome}
+        self._items[key] = record
+        self._buffer.append(json.dumps(record))
+        if len(self._buffer) >= FLUSH_RECORDS or time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    def complete(self):
+        """Mark the run as completed and write all buffered records."""
+        self._completed = True
+        self._buffer.append(json.dumps({'event': 'complete'}))
+        self.flush()
+
+    def flush(self):
+        """Append the buffered records to the journal file."""
+        if self._buffer:
+            with open(self._path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(self._buffer) + '\n')
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
@@ -0,0 +1,98 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Index of the wiki link targets of the schema names."""
+
+# System imports
+from typing import Dict, List, Optional, Tuple
+import hashlib
+
+# Third party imports
+from lxml.etree import QName
+
+# Module imports
+from ocx_schema_parser.xelement import LxmlElement
+from ocx_schema_parser.transformer import Transformer
+
+
+class LinkIndex:
+    """The link targets of a transformed schema.
+
+    Maps the schema global names, by local name and by qualified name ``prefix:name``, to their wiki page and the
+    W3C builtin types to their external documentation. The index is built once per transform and every lookup is a
+    dict access, so linking a schema is linear in the number of children and attributes.
+
+    Args:
+        builtins: W3C builtin type names (e.g. ``xs:string``) mapped to their documentation url
+    """
+
+    def __init__(self, builtins: Optional[Dict[str, str]] = None):
+        self._builtins: Dict[str, str] = dict(builtins or {})
+        self._globals: List[Tuple[str, str]] = []
+        self._names: Dict[str, Tuple[str, str]] = {}
+        self._qnames: Dict[str, Tuple[str, str]] = {}
+        self._digest: Optional[str] = None
+
+    @classmethod
+    def from_transformer(cls, transformer: Transformer) -> 'LinkIndex':
+        """Build the index of the schema processed by ``transformer``."""
+        parser = transformer.parser
+        namespaces = parser.get_namespaces()
+        builtins = {}
+        for key, link in parser.get_xs_types().items():
+            qname = QName(key)
+            prefix = parser.get_prefix_from_namespace(qname.namespace)
+            builtins[f'{prefix}:{qname.localname}'] = link
+            # xsd and xs types are complementary
+            if prefix == 'xs':
+                builtins[f'xsd:{qname.localname}'] = link
+            elif prefix == 'xsd':
+                builtins[f'xs:{qname.localname}'] = link
+        index = cls(builtins)
+        for types in (parser.get_schema_element_types(), parser.get_schema_attribute_types(),
+                      parser.get_schema_attribute_group_types(), parser.get_schema_simple_types()):
+            for ocx in types:
+                qn = LxmlElement.replace_ns_tag_with_ns_prefix(ocx, namespaces)
+                index.add(LxmlElement.namespace_prefix(qn), LxmlElement.strip_namespace_prefix(qn))
+        for enum in transformer.get_enumerators().values():
+            index.add(enum.prefix, enum.name)
+        return index
+
+    @property
+    def builtins(self) -> Dict[str, str]:
+        """Return the W3C builtin types mapped to their documentation url."""
+        return self._builtins
+
+    @property
+    def globals(self) -> List[Tuple[str, str]]:
+        """Return the ``(prefix, name)`` of the schema globals in schema order."""
+        return self._globals
+
+    @property
+    def digest(self) -> str:
+        """Return the hash of the link targets, equal indexes link the same names to the same targets."""
+        if self._digest is None:
+            source = (self._globals, sorted(self._builtins.items()))
+            self._digest = hashlib.sha256(repr(source).encode('utf-8')).hexdigest()
+        return self._digest
+
+    def add(self, prefix: str, name: str):
+        """Add the schema global ``prefix:name``."""
+        self._digest = None
+        item = (prefix, name)
+        self._globals.append(item)
+        self._names.setdefault(name, item)
+        self._qnames.setdefault(f'{prefix}:{name}', item)
+
+    def is_global(self, name: str) -> bool:
+        """True if ``name``, with or without prefix, is the name of a schema global."""
+        return name in self._qnames if ':' in name else name in self._names
+
+    def target(self, name: str) -> Optional[Tuple[str, str]]:
+        """The ``(prefix, name)`` of the schema global ``name``, None if it is not a schema global."""
+        return self._qnames.get(name) if ':' in name else self._names.get(name)
+
+    def builtin(self, type_name: str) -> Optional[str]:
+        """The documentation url of the builtin ``type_name``, None if it is not a builtin."""
+        return self._builtins.get(type_name)
+
+    def __len__(self) -> int:
+        return len(self._globals)
@@ -0,0 +1,167 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Local record of the pages last published to a wiki namespace."""
+
+# System imports
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+import hashlib
+import json
+import os
+import re
+
+# Third party imports
+from loguru import logger
+
+# Module imports
+from ocxwiki import CACHE_FOLDER
+from ocxwiki.client import page_hash
+from ocxwiki.struct_data import struct_undated
+
+MANIFEST_VERSION = 2
+
+
+def content_hash(content: str) -> str:
+    """The hash of a published page recorded in a manifest, the :func:`~ocxwiki.client.page_hash` of ``content``
+    without the publish date.
+
+    Every processing of a schema sets a new publish date, pages published from the same schema by another process
+    have the same content hash.
+    """
+    return page_hash(struct_undated(content))
+
+
+def target_name(wiki_url: str, namespace: str) -> str:
+    """A file name identifying ``namespace`` on the wiki ``wiki_url``."""
+    target = f'{wiki_url.rstrip("/")}|{namespace.lower()}'
+    slug = re.sub(r'[^a-z0-9]+', '-', namespace.lower()).strip('-') or 'root'
+    return f'{slug}-{hashlib.sha1(target.encode("utf-8")).hexdigest()[:12]}'
+
+
+class ManifestEntry(NamedTuple):
+    """A published page.
+
+    Parameters:
+        hash: The hash of the published content, see :func:`content_hash`
+        rev: The wiki revision (unix time) of the published page
+    """
+    hash: str
+    rev: int
+
+
+class PublishManifest:
+    """The content hash and wiki revision of every page published to one namespace of one wiki.
+
+    The manifest lets a publish decide which pages to upload without listing the wiki namespace. Edits made on the
+    wiki by others are detected with the wiki recent changes since :attr:`last_sync`, see :meth:`apply_changes`.
+
+    Args:
+        path: The manifest file
+        wiki_url: The wiki url
+        namespace: The publish namespace
+    """
+
+    def __init__(self, path: Path, wiki_url: str = '', namespace: str = ''):
+        self._path = Path(path)
+        self._wiki_url = wiki_url
+        self._namespace = namespace
+        self._entries: Dict[str, ManifestEntry] = {}
+
+    @classmethod
+    def for_target(cls, wiki_url: str, namespace: str,
+                   folder: Union[Path, str] = CACHE_FOLDER) -> 'PublishManifest':
+        """Load the manifest of ``namespace`` on the wiki ``wiki_url`` from ``folder``."""
+        manifest = cls(Path(folder) / 'manifests' / f'{target_name(wiki_url, namespace)}.json', wiki_url, namespace)
+        manifest.load()
+        return manifest
+
+    @property
+    def path(self) -> Path:
+        """Return the manifest file."""
+        return self._path
+
+    @property
+    def last_sync(self) -> int:
+        """The latest recorded page revision, 0 if the manifest is empty."""
+        return max((entry.rev for entry in self._entries.values()), default=0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, page: str) -> bool:
+        return page.lower() in self._entries
+
+    def get(self, page: str) -> Optional[ManifestEntry]:
+        """Return the entry of ``page`` or None if the page is not recorded."""
+        return self._entries.get(page.lower())
+
+    def hashes(self) -> Dict[str, str]:
+        """Return the recorded content hashes keyed by the lower case page id."""
+        return {page: entry.hash for page, entry in self._entries.items()}
+
+    def record(self, page: str, content_hash: str, rev: int):
+        """Record that ``page`` with ``content_hash`` was published as revision ``rev``."""
+        self._entries[page.lower()] = ManifestEntry(content_hash, int(rev))
+
+    def discard(self, pages: Iterable[str]):
+        """Forget ``pages``."""
+        for page in pages:
+            self._entries.pop(page.lower(), None)
+
+    def clear(self):
+        """Forget all pages."""
+        self._entries.clear()
+
+    def apply_changes(self, changes: Iterable[Dict]) -> List[str]:
+        """Invalidate the pages changed on the wiki after they were published.
+
+        Arguments:
+            changes: The result of :meth:`ocxwiki.client.WikiClient.changes` since :attr:`last_sync`
+
+        Returns:
+            The invalidated pages
+        """
+        latest: Dict[str, int] = {}
+        for change in changes or []:
+            page = str(change.get('name', '')).lower()
+            if page in self._entries:
+                latest[page] = max(latest.get(page, 0), int(change.get('version', 0)))
+        stale = [page for page, rev in latest.items() if rev != self._entries[page].rev]
+        self.discard(stale)
+        if stale:
+            logger.info(f'{len(stale)} pages in {self._namespace} were changed on the wiki since the last publish')
+        return stale
+
+    def load(self) -> bool:
+        """Load the manifest file. A missing or unreadable file gives an empty manifest.
+
+        Returns:
+            True if the manifest file was loaded
+        """
+        self._entries.clear()
+        if not self._path.is_file():
+            return False
+        try:
+            data = json.loads(self._path.read_text(encoding='utf-8'))
+            if data.get('version') != MANIFEST_VERSION:
+                logger.info(f'Ignoring manifest {self._path} with version {data.get("version")}')
+                return False
+            for page, (content_hash, rev) in data.get('pages', {}).items():
+                self._entries[page] = ManifestEntry(content_hash, int(rev))
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f'Ignoring the unreadable manifest {self._path}: {e}')
+            self._entries.clear()
+            return False
+        return True
+
+    def save(self):
+        """Write the manifest file atomically."""
+        data = {
+            'version': MANIFEST_VERSION,
+            'wiki_url': self._wiki_url,
+            'namespace': self._namespace,
+            'pages': {page: list(entry) for page, entry in sorted(self._entries.items())},
+        }
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(data, indent=1), encoding='utf-8')
+        os.replace(tmp, self._path)
@@ -0,0 +1,188 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Streaming render and upload pipeline for publishing schema items."""
+
+# System imports
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+import asyncio
+import os
+
+# Third party imports
+from loguru import logger
+
+# Module imports
+from ocxwiki.client import WikiClient, PageWrite, MAX_BATCH_CALLS, page_hash
+from ocxwiki.concurrency import AdaptiveLimiter
+from ocxwiki.error import OcxWikiError
+from ocxwiki.manifest import content_hash
+from ocxwiki.struct_data import struct_undated
+
+DEFAULT_RENDER_WORKERS = min(4, os.cpu_count() or 1)  # Threads rendering wiki pages off the event loop
+
+
+class PublishOutcome(NamedTuple):
+    """The outcome of publishing one schema item.
+
+    Parameters:
+        kind: The item kind, one of ``pages``, ``enums``, ``attributes`` or ``simple_types``
+        write: The rendered page write, None if rendering failed
+        status: ``created``, ``updated`` or ``unchanged`` compared to the wiki, None if rendering failed
+        result: True if the page was written, None if an unchanged page was skipped,
+            otherwise the write result or the error
+    """
+    kind: str
+    write: Optional[PageWrite]
+    status: Optional[str]
+    result: Union[bool, None, Exception]
+
+
+class PublishPipeline:
+    """Render schema items in a worker pool and upload the pages while rendering continues.
+
+    A producer renders the items of all kinds off the event loop and packs the page writes into ``system.multicall``
+    batches. The batches pass through a bounded queue to a fixed set of upload workers. Rendering waits when the
+    uploads fall behind, and uploading starts as soon as the first batch is rendered.
+
+    Args:
+        client: A connected wiki client
+        render: Callable(kind, item) returning the :class:`PageWrite` of an item. Called on the worker threads.
+        max_uploads: The number of upload workers, i.e. the maximum number of requests in flight
+        render_workers: The number of rendering threads
+        queue_size: The maximum number of rendered batches waiting for an upload worker, default ``max_uploads``
+        limiter: Optional adaptive limit of the uploads in flight. The pipeline then runs ``limiter.ceiling`` upload
+            workers and ``max_uploads`` is ignored.
+    """
+
+    def __init__(self, client: WikiClient, render: Callable[[str, Any], PageWrite], max_uploads: int = 10,
+                 render_workers: Optional[int] = None, queue_size: Optional[int] = None,
+                 limiter: Optional[AdaptiveLimiter] = None):
+        self._client = client
+        self._render = render
+        self._limiter = limiter
+        self._max_uploads = limiter.ceiling if limiter is not None else max(1, max_uploads)
+        self._render_workers = max(1, render_workers or DEFAULT_RENDER_WORKERS)
+        self._queue_size = max(1, queue_size or self._max_uploads)
+
+    async def run(self, items: Sequence[Tuple[str, Any]], remote_hashes: Awaitable[Dict[str, str]],
+                  skip_unchanged: bool = False,
+                  done_callback: Optional[Callable[[int, PublishOutcome], None]] = None) -> List[PublishOutcome]:
+        """Render and upload ``items``.
+
+        Arguments:
+            items: ``(kind, item)`` pairs
+            remote_hashes: Resolves to the wiki page hashes keyed by the lower case page id. It is awaited once the
+                first item is rendered, so fetching the hashes overlaps with rendering.
+            skip_unchanged: Do not write pages whose hash equals the wiki page hash. The pages with a different hash
+                are read from the wiki and not written if they only differ in the publish date.
+            done_callback: Optional callable(index, outcome) called when an item is finished
+
+        Returns:
+            The outcome of each item
+        """
+        outcomes: List[Optional[PublishOutcome]] = [None] * len(items)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        hashes_task = asyncio.ensure_future(remote_hashes)
+        pool = ThreadPoolExecutor(self._render_workers, thread_name_prefix='ocxwiki-render')
+
+        def finish(index: int, outcome: PublishOutcome):
+            outcomes[index] = outcome
+            if done_callback is not None:
+                done_callback(index, outcome)
+
+        async def produce():
+            loop = asyncio.get_running_loop()
+            rendering = deque()
+            batch: List[Tuple[int, str, PageWrite, str]] = []
+            size = 0
+            # Pages with a different hash than the wiki page, compared with the wiki page text before writing
+            differing: List[Tuple[int, str, PageWrite]] = []
+
+            async def enqueue(index: int, kind: str, write: PageWrite, status: str):
+                nonlocal batch, size
+                write_size = write.payload_size()
+                if batch and (size + write_size > self._client.max_batch_bytes or len(batch) >= MAX_BATCH_CALLS):
+                    await queue.put(batch)
+                    batch, size = [], 0
+                batch.append((index, kind, write, status))
+                size += write_size
+
+            async def compare():
+                # The wiki hash covers the publish date, which changes with every processing of the schema
+                nonlocal differing
+                pending, differing = differing, []
+                texts = await self._client.get_pages_async([write.wiki_page for _, _, write in pending])
+                for (index, kind, write), text in zip(pending, texts, strict=True):
+                    if isinstance(text, str) and struct_undated(text) == struct_undated(write.content):
+                        finish(index, PublishOutcome(kind, write, 'unchanged', None))
+                    else:
+                        await enqueue(index, kind, write, 'updated')
+
+            async def collect():
+                index, kind, future = rendering.popleft()
+                try:
+                    write = await future
+                except Exception as e:
+                    logger.error(f'Failed to render {kind} item {index}: {e}')
+                    finish(index, PublishOutcome(kind, None, None, e))
+                    return
+                status = self._classify(write, await hashes_task)
+                if status == 'unchanged' and skip_unchanged:
+                    finish(index, PublishOutcome(kind, write, status, None))
+                elif status == 'updated' and skip_unchanged:
+                    differing.append((index, kind, write))
+                    if len(differing) >= MAX_BATCH_CALLS:
+                        await compare()
+                else:
+                    await enqueue(index, kind, write, status)
+
+            # Keep the render threads busy with a bounded number of items ahead of the collected ones
+            for index, (kind, item) in enumerate(items):
+                rendering.append((index, kind, loop.run_in_executor(pool, self._render, kind, item)))
+                if len(rendering) >= 2 * self._render_workers:
+                    await collect()
+            while rendering:
+                await collect()
+            if differing:
+                await compare()
+            if batch:
+                await queue.put(batch)
+            for _ in range(self._max_uploads):
+                await queue.put(None)
+
+        async def send(batch) -> List:
+            writes = [write for _, _, write, _ in batch]
+            if self._limiter is None:
+                return await self._client.set_pages_async(writes, max_concurrent=1)
+            async with self._limiter.slot() as slot:
+                results = await self._client.set_pages_async(writes, max_concurrent=1)
+                slot.size = len(batch)
+                slot.overload = any(isinstance(result, (OcxWikiError, OSError, asyncio.TimeoutError))
+                                    for result in results)
+            return results
+
+        async def upload():
+            while (batch := await queue.get()) is not None:
+                results = await send(batch)
+                for (index, kind, write, status), result in zip(batch, results, strict=True):
+                    finish(index, PublishOutcome(kind, write, status, result))
+
+        tasks = [asyncio.ensure_future(produce())] + [asyncio.ensure_future(upload())
+                                                      for _ in range(self._max_uploads)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks + [hashes_task]:
+                task.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+        return outcomes
+
+    @staticmethod
+    def _classify(write: PageWrite, remote_hashes: Dict[str, str]) -> str:
+        """Compare a rendered page with the wiki page hash or the content hash of its manifest entry."""
+        remote_hash = remote_hashes.get(write.wiki_page.lower())
+        if remote_hash is None:
+            return 'created'
+        if remote_hash != page_hash(write.content) and remote_hash != content_hash(write.content):
+            return 'updated'
+        return 'unchanged'
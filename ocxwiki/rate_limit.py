@@ -0,0 +1,142 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Client side token bucket rate limits of the requests to a wiki."""
+
+# System imports
+from typing import Callable, Dict, Optional
+import asyncio
+import threading
+import time
+
+# Module imports
+from ocxwiki import RATE_LIMITS
+
+
+class TokenBucket:
+    """A thread safe token bucket refilled at ``rate`` tokens per second up to ``burst`` tokens.
+
+    A reservation takes its tokens immediately, also when the bucket runs into debt, and returns how long the
+    caller has to wait. Callers are therefore served in the order of their reservations on any thread or event loop.
+
+    Args:
+        rate: Tokens per second
+        burst: The bucket capacity, default one second worth of tokens
+        clock: Callable returning the current time in seconds
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError(f'The token rate must be positive, not {rate}')
+        self._rate = float(rate)
+        self._burst = float(burst or rate)
+        self._clock = clock
+        self._tokens = self._burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Return the tokens per second."""
+        return self._rate
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take ``amount`` tokens.
+
+        Returns:
+            The seconds to wait before the tokens are available
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self._rate)
+
+
+class RateLimiter:
+    """Limit the requests and the request bytes per second sent to a wiki.
+
+    Args:
+        requests_per_second: The request rate, None for no limit
+        bytes_per_second: The request payload rate, None for no limit
+        burst_requests: The requests which may be sent at once, default one second worth
+        burst_bytes: The bytes which may be sent at once, default one second worth
+
+    Attributes:
+        requests: The number of rate limited requests
+        wait: The seconds requests were delayed
+    """
+
+    def __init__(self, requests_per_second: Optional[float] = None, bytes_per_second: Optional[float] = None,
+                 burst_requests: Optional[float] = None, burst_bytes: Optional[float] = None):
+        self._requests = TokenBucket(requests_per_second, burst_requests) if requests_per_second else None
+        self._bytes = TokenBucket(bytes_per_second, burst_bytes) if bytes_per_second else None
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.wait = 0.0
+
+    @classmethod
+    def from_config(cls, settings: Dict) -> 'RateLimiter':
+        """Create a limiter from a ``RATE_LIMITS`` entry of the wiki config."""
+        return cls(settings.get('requests_per_second'), settings.get('bytes_per_second'),
+                   settings.get('burst_requests'), settings.get('burst_bytes'))
+
+    def delay(self, size: int) -> float:
+        """Reserve one request of ``size`` bytes and return the seconds to wait before sending it."""
+        delay = 0.0
+        if self._requests is not None:
+            delay = self._requests.reserve(1)
+        if self._bytes is not None:
+            delay = max(delay, self._bytes.reserve(size))
+        with self._lock:
+            self.requests += 1
+            self.wait += delay
+        return delay
+
+    async def acquire(self, size: int):
+        """Wait until a request of ``size`` bytes may be sent."""
+        delay = self.delay(size)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def describe(self) -> str:
+        """A short description of the limits, e.g. ``5 req/s, 1.0 MB/s``."""
+        limits = []
+        if self._requests is not None:
+            limits.append(f'{self._requests.rate:g} req/s')
+        if self._bytes is not None:
+            rate = self._bytes.rate
+            limits.append(f'{rate / 1e6:.1f} MB/s' if rate >= 1e6 else f'{rate / 1e3:.1f} kB/s')
+        return ', '.join(limits) or 'unlimited'
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _normalise(url: str) -> str:
+    return (url or '').strip().rstrip('/').lower()
+
+
+def rate_limiter_for(url: str, limits: Optional[Dict] = None) -> Optional[RateLimiter]:
+    """Return the process wide rate limiter of the wiki ``url``.
+
+    All clients of the same wiki share one limiter, so the limits hold across all connections, threads and event
+    loops of the process.
+
+    Arguments:
+        url: The wiki url
+        limits: The rate limits keyed by wiki url, default the ``RATE_LIMITS`` of the wiki config
+
+    Returns:
+        The limiter or None if the wiki has no rate limit
+    """
+    key = _normalise(url)
+    with _limiters_lock:
+        if key not in _limiters:
+            configured = {_normalise(wiki): settings for wiki, settings in (RATE_LIMITS if limits is None
+                                                                              else limits).items()}
+            settings = configured.get(key)
+            if not settings:
+                return None
+            _limiters[key] = RateLimiter.from_config(settings)
+        return _limiters[key]
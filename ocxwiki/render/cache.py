@@ -0,0 +1,117 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Memoized rendering of DokuWiki pages keyed by the hash of the rendered data."""
+
+# System imports
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+import hashlib
+import os
+import threading
+
+# Third party imports
+from loguru import logger
+
+# Module imports
+from ocxwiki.render.wiki_render import RENDER_VERSION
+
+DEFAULT_MAX_ENTRIES = 4096  # Rendered pages kept in memory
+
+
+class RenderCache:
+    """Rendered pages kept in memory with LRU eviction, optionally backed by files in ``folder``.
+
+    A page is stored under the hash of everything it is rendered from, see :meth:`key`, so an entry never goes
+    stale: a changed item, namespace, link target or template has a new key. Pages evicted from memory are read back
+    from the folder. The cache is safe to use from the render worker threads.
+
+    Args:
+        max_entries: The number of pages kept in memory
+        folder: The folder of the on-disk store, None to keep the pages in memory only
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, folder: Union[Path, str, None] = None):
+        self._max_entries = max_entries
+        self._folder = Path(folder) if folder is not None else None
+        self._pages: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0  # Lookups finding the page
+        self.misses = 0  # Lookups not finding the page
+
+    @property
+    def folder(self) -> Optional[Path]:
+        """Return the folder of the on-disk store, None if the pages are kept in memory only."""
+        return self._folder
+
+    @staticmethod
+    def key(*parts) -> str:
+        """The key of a page rendered from ``parts`` by the current render templates.
+
+        The parts must have a stable ``repr``, like strings, numbers, tuples, lists and dataclasses.
+        """
+        return hashlib.sha256(repr((RENDER_VERSION, parts)).encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._folder / key[:2] / key
+
+    def get(self, key: str) -> Optional[str]:
+        """The page with ``key``, None if it is not cached."""
+        with self._lock:
+            page = self._pages.get(key)
+            if page is not None:
+                self._pages.move_to_end(key)
+                self.hits += 1
+                return page
+        if self._folder is not None:
+            try:
+                page = self._path(key).read_text(encoding='utf-8')
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f'Cannot read the rendered page {key[:12]}: {e}')
+        with self._lock:
+            if page is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._remember(key, page)
+        return page
+
+    def put(self, key: str, page: str):
+        """Store the ``page`` with ``key``."""
+        self._remember(key, page)
+        if self._folder is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f'{key}.{os.getpid()}.{threading.get_ident()}.tmp')
+            tmp.write_text(page, encoding='utf-8')
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f'Cannot store the rendered page {key[:12]}: {e}')
+
+    def _remember(self, key: str, page: str):
+        with self._lock:
+            self._pages[key] = page
+            self._pages.move_to_end(key)
+            while len(self._pages) > self._max_entries:
+                self._pages.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def clear(self) -> int:
+        """Remove all pages from memory and the on-disk store.
+
+        Returns:
+            The number of removed files
+        """
+        with self._lock:
+            self._pages.clear()
+        count = 0
+        if self._folder is not None and self._folder.is_dir():
+            for path in self._folder.glob('*/*'):
+                path.unlink(missing_ok=True)
+                count += not path.name.endswith('.tmp')
+        return count
@@ -0,0 +1,123 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Intermediate page model of the schema items, rendered by the DokuWiki and the Rich renderer."""
+
+# System imports
+from dataclasses import dataclass, fields
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+# Module imports
+from ocx_schema_parser.elements import OcxGlobalElement
+from ocx_schema_parser.data_classes import OcxEnumerator, SchemaAttribute
+
+PAGES = 'pages'
+ENUMS = 'enums'
+ATTRIBUTES = 'attributes'
+
+
+@dataclass(frozen=True)
+class Table:
+    """A column oriented table, one tuple of values per column.
+
+    Parameters:
+        names: The column names, the field names of the rows the table is built from
+        headers: The column headers
+        columns: The column values
+    """
+    names: Tuple[str, ...] = ()
+    headers: Tuple[str, ...] = ()
+    columns: Tuple[tuple, ...] = ()
+
+    @classmethod
+    def from_rows(cls, rows: Sequence) -> 'Table':
+        """The table of dataclass ``rows`` with a ``header`` in the metadata of their fields."""
+        if not rows:
+            return cls()
+        columns = fields(rows[0])
+        return cls(tuple(column.name for column in columns), tuple(column.metadata['header'] for column in columns),
+                   tuple(tuple(getattr(row, column.name) for row in rows) for column in columns))
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Sequence]) -> 'Table':
+        """The table of ``columns`` keyed by their header, the headers are also the column names."""
+        headers = tuple(columns)
+        return cls(headers, headers, tuple(tuple(values) for values in columns.values()))
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def __bool__(self) -> bool:
+        return bool(self.columns)
+
+    def __getitem__(self, header: str) -> list:
+        """The values of the column with ``header``, as in the columns keyed by the column header."""
+        return list(self.columns[self.headers.index(header)])
+
+    def column(self, name: str) -> tuple:
+        """The values of the column ``name``."""
+        return self.columns[self.names.index(name)]
+
+    def replace(self, **columns: Sequence) -> 'Table':
+        """A copy of the table with the values of the named ``columns`` replaced."""
+        return Table(self.names, self.headers,
+                     tuple(tuple(columns[name]) if name in columns else values
+                           for name, values in zip(self.names, self.columns, strict=True)))
+
+    def rows(self) -> Iterator[tuple]:
+        """The table rows."""
+        return zip(*self.columns, strict=True)
+
+    def to_dict(self) -> Dict[str, list]:
+        """The columns keyed by the column header."""
+        return {header: list(values) for header, values in zip(self.headers, self.columns, strict=True)}
+
+
+@dataclass(frozen=True)
+class PageModel:
+    """The content of the page of a schema item, extracted once and rendered by every backend.
+
+    The tables hold the schema values, links and escapes are added by the backends. The structured data of a page
+    changes with every processing and is passed to the backends separately.
+
+    Parameters:
+        kind: The item kind, ``pages``, ``enums`` or ``attributes``
+        prefix: The namespace prefix
+        name: The item name
+        tag: The qualified tag ``{namespace}name`` of an element, empty for other items
+        annotation: The annotation of an element
+        children: The child elements, ordered by prefix and name
+        attributes: The attributes of an element
+        values: The values and descriptions of an enumerator, the single row of an attribute
+        used_by: The ``prefix:name`` of the schema items referencing the item
+    """
+    kind: str
+    prefix: str
+    name: str
+    tag: str = ''
+    annotation: Optional[str] = None
+    children: Table = Table()
+    attributes: Table = Table()
+    values: Table = Table()
+    used_by: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_element(cls, ocx: OcxGlobalElement, used_by: Optional[Sequence[str]] = None) -> 'PageModel':
+        """The page model of the global element ``ocx``."""
+        children = sorted(ocx.get_children(), key=lambda child: (child.prefix, child.name))
+        return cls(PAGES, ocx.get_prefix(), ocx.get_name(), ocx.get_tag(), ocx.get_annotation(),
+                   Table.from_rows(children), Table.from_rows(ocx.get_attributes()),
+                   used_by=tuple(used_by or ()))
+
+    @classmethod
+    def from_enum(cls, enum: OcxEnumerator) -> 'PageModel':
+        """The page model of the enumerator ``enum``."""
+        return cls(ENUMS, enum.prefix, enum.name, values=Table.from_columns(enum.to_dict()))
+
+    @classmethod
+    def from_attribute(cls, attribute: SchemaAttribute) -> 'PageModel':
+        """The page model of the global attribute or simple type ``attribute``."""
+        return cls(ATTRIBUTES, attribute.prefix, attribute.name, values=Table.from_rows([attribute]))
+
+    @property
+    def qname(self) -> str:
+        """Return the item name ``prefix:name``."""
+        return f'{self.prefix}:{self.name}'
@@ -2,8 +2,7 @@
 """Rich terminal renderer – produces Rich renderables from OCX schema data."""
 
 # System imports
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import Dict, List, Optional, Union
 
 # Third party imports
 from rich.console import Console
@@ -16,19 +15,21 @@ from rich import box
 import ocxwiki.struct_data as struct_data
 from ocx_schema_parser.elements import OcxGlobalElement
 from ocx_schema_parser.data_classes import OcxEnumerator, BaseDataClass, SchemaAttribute
+from ocxwiki.render.page_model import PageModel, Table as PageTable
 
 
 class RichRender:
     """Render OCX schema element tables as Rich-formatted output for the terminal.
     """
 
+    _console = Console()
 
     @staticmethod
-    def make_table(clazz: BaseDataClass, title: str = "Table") -> Table:
+    def make_table(clazz: Union[BaseDataClass, PageTable, Dict], title: str = "Table") -> Table:
         """Build a :class:`rich.table.Table` from a plain *dict*.
 
         Arguments:
-            clazz: BaseDataClass instance to render as a table.
+            clazz: BaseDataClass instance, page model table or dict to render as a table.
             title: Optional table title rendered above the table.
 
         Returns:
@@ -38,7 +39,10 @@ class RichRender:
         if not clazz:
             return tbl
 
-        columns = clazz.to_dict().keys() if isinstance(clazz, BaseDataClass) else clazz.keys()
+        if isinstance(clazz, PageTable):
+            columns = clazz.headers
+        else:
+            columns = clazz.to_dict().keys() if isinstance(clazz, BaseDataClass) else clazz.keys()
         for col in columns:
             tbl.add_column(str(col), style="cyan", no_wrap=False)
 
@@ -74,34 +78,30 @@ class RichRender:
     # ------------------------------------------------------------------ #
 
     @staticmethod
-    def add_rows(table:Table, ocx:OcxGlobalElement) -> None:
-        """
-        Print schema information in a formatted table using Rich.
-
-        Args:
-            table: Dictionary containing table information
-                columns: Table headers
-                rows: list of row values
-        table dict format example:
-        {
-            "title": "Child Elements",
-            "columns": ["Name", "Type", "Description"],
-            "rows": [
-                {"Name": "child1", "Type": "string", "Description": "First child element"},
-                {"Name": "child2", "Type": "integer", "Description": "Second child element"},
-                {"Name": "child3", "Type": "boolean", "
-                    "Description": "Third child element"},
-            ]
-        }
+    def add_rows(table: Table, rows: PageTable) -> Table:
+        """Add the rows of a page model table to a Rich table.
+
+        Arguments:
+            table: The Rich table, with a column for every column of ``rows``
+            rows:  The page model table
+
         Returns:
-            None.
+            The Rich table.
         """
-        name = ocx.get_name()
+        for row in rows.rows():
+            table.add_row(*("" if value is None else str(value) for value in row))
+        return table
 
-        # Children table
-        tbl = ocx.children_to_dict()
-
-        return
+    @staticmethod
+    def _make_table(data: Union[PageTable, Dict], title: str = "") -> Table:
+        """Build a filled :class:`rich.table.Table` from a page model table or a dict of scalars or columns."""
+        if not isinstance(data, PageTable):
+            values = list(data.values())
+            if values and all(isinstance(value, (list, tuple)) for value in values):
+                data = PageTable.from_columns(data)
+            else:
+                data = PageTable.from_columns({key: (value,) for key, value in data.items()})
+        return RichRender.add_rows(RichRender.make_table(data, title=title), data)
 
     @staticmethod
     def dict(attribute: dict, title: str = "") -> Table:
@@ -148,7 +148,7 @@ class RichRender:
 
     @staticmethod
     def page(
-        ocx: OcxGlobalElement,
+        ocx: Union[OcxGlobalElement, PageModel],
         data: struct_data.WikiSchema,
         global_elements: List,
         builtins: Dict,
@@ -160,7 +160,7 @@ class RichRender:
         and structured-data table – all formatted with Rich.
 
         Arguments:
-            ocx:             The OCX element to render.
+            ocx:             The OCX element to render or its page model.
             data:            The wiki structured data.
             global_elements: OCX global element names.
             builtins:        Builtin W3C types.
@@ -168,80 +168,63 @@ class RichRender:
                              to the class-level shared console when *None*.
         """
         con = console or RichRender._console
-        name = ocx.get_name()
-
-        con.print(RichRender.page_header(name))
-        con.print(RichRender.page_text(ocx.get_annotation()))
-
-        children_tbl = ocx.children_to_dict()
-        if children_tbl:
-            con.print(f"[bold]{name}[/bold] has the following child elements:")
-            con.print(RichRender._make_table(children_tbl, title="Child Elements"))
-
-        attrs_tbl = ocx.attributes_to_dict()
-        if attrs_tbl:
-            con.print(f"[bold]{name}[/bold] has the following attributes:")
-            con.print(RichRender._make_table(attrs_tbl, title="Attributes"))
+        model = ocx if isinstance(ocx, PageModel) else PageModel.from_element(ocx)
 
+        con.print(RichRender.page_header(model.name))
+        con.print(RichRender.page_text(model.annotation))
+        RichRender._print_tables(model, con)
         con.print(RichRender.data_struct(data.to_dict(), title="Structured Data"))
 
     @staticmethod
     def enum(
-        enum: OcxEnumerator,
+        enum: Union[OcxEnumerator, PageModel],
         data: struct_data.WikiSchema,
         console: Optional[Console] = None,
     ) -> None:
         """Render an OCX enumerator to the terminal using Rich.
 
         Arguments:
-            enum:    The enumerator to render.
+            enum:    The enumerator to render or its page model.
             data:    The wiki structured data.
             console: Optional :class:`rich.console.Console`.
         """
         con = console or RichRender._console
-        name = enum.name
+        model = enum if isinstance(enum, PageModel) else PageModel.from_enum(enum)
+        name = model.name
 
         con.print(RichRender.page_header(name))
-
-        raw = enum.to_dict()
-        if raw:
-            table: dict = defaultdict(list)
-            for key, values in raw.items():
-                if "Description" in key:
-                    table[key] = values
-                elif "Value" in key:
-                    table[key] = list(values)  # no wiki %%-escaping needed for terminal output
-
-            if table:
-                con.print(f"[bold]{name}[/bold] has the following values:")
-                con.print(RichRender._make_table(table, title="Enum Values"))
+        # no wiki %%-escaping needed for terminal output
+        if model.values:
+            con.print(f"[bold]{name}[/bold] has the following values:")
+            con.print(RichRender._make_table(model.values, title="Enum Values"))
 
         con.print(RichRender.data_struct(data.to_dict(), title="Structured Data"))
 
     @staticmethod
     def attribute(
-        attribute: SchemaAttribute,
+        attribute: Union[SchemaAttribute, PageModel],
         data: struct_data.WikiSchema,
         console: Optional[Console] = None,
     ) -> None:
         """Render a schema attribute to the terminal using Rich.
 
         Arguments:
-            attribute: The attribute to render.
+            attribute: The attribute to render or its page model.
             data:      The wiki structured data.
             console:   Optional :class:`rich.console.Console`.
         """
         con = console or RichRender._console
-        name = attribute.name
+        model = attribute if isinstance(attribute, PageModel) else PageModel.from_attribute(attribute)
+        name = model.name
 
         con.print(RichRender.page_header(name))
         con.print(f"[bold]{name}[/bold] has the following values:")
-        con.print(RichRender.dict(attribute.to_dict(), title=name))
+        con.print(RichRender._make_table(model.values, title=name))
         con.print(RichRender.data_struct(data.to_dict(), title="Structured Data"))
 
     @staticmethod
     def element(
-        ocx: OcxGlobalElement,
+        ocx: Union[OcxGlobalElement, PageModel],
         console: Optional[Console] = None,
     ) -> None:
         """Render an OCX global element as Rich tables printed to the terminal.
@@ -252,27 +235,28 @@ class RichRender:
         with just the :class:`~ocx_schema_parser.elements.OcxGlobalElement`.
 
         Arguments:
-            ocx:     The OCX global element to render.
+            ocx:     The OCX global element to render or its page model.
             console: Optional :class:`rich.console.Console`; falls back to the
                      class-level shared console when *None*.
         """
         con = console or RichRender._console
-        name = ocx.get_name()
+        model = ocx if isinstance(ocx, PageModel) else PageModel.from_element(ocx)
 
-        con.print(RichRender.page_header(name))
-        annotation = ocx.get_annotation()
-        if annotation:
-            con.print(RichRender.page_text(annotation))
-
-        children_tbl = ocx.children_to_dict()
-        if children_tbl:
-            con.print(f"[bold]{name}[/bold] has the following child elements:")
-            con.print(RichRender._make_table(children_tbl, title="Child Elements"))
-
-        attrs_tbl = ocx.attributes_to_dict()
-        if attrs_tbl:
-            con.print(f"[bold]{name}[/bold] has the following attributes:")
-            con.print(RichRender._make_table(attrs_tbl, title="Attributes"))
+        con.print(RichRender.page_header(model.name))
+        if model.annotation:
+            con.print(RichRender.page_text(model.annotation))
+        RichRender._print_tables(model, con)
+
+    @staticmethod
+    def _print_tables(model: PageModel, console: Console) -> None:
+        """Print the children and attributes tables of an element page model."""
+        name = model.name
+        if model.children:
+            console.print(f"[bold]{name}[/bold] has the following child elements:")
+            console.print(RichRender._make_table(model.children, title="Child Elements"))
+        if model.attributes:
+            console.print(f"[bold]{name}[/bold] has the following attributes:")
+            console.print(RichRender._make_table(model.attributes, title="Attributes"))
 
     # ------------------------------------------------------------------ #
     # Link helpers (return Rich markup strings)                            #
@@ -2,38 +2,99 @@
 """DokuWiki content renderer – produces dokuwiki markup strings."""
 
 # System imports
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Sequence, Union
 from collections import defaultdict
-
-# Third party imports
-from tabulate import tabulate
+from itertools import zip_longest
 
 # Module imports
 import ocxwiki.struct_data as struct_data
+from ocxwiki.links import LinkIndex
+from ocxwiki.render.page_model import PageModel, Table
+from ocxwiki.schema_diff import ChangeSet, MODIFIED, REMOVED, STATUSES
 from ocx_schema_parser.elements import OcxGlobalElement
 from ocx_schema_parser.data_classes import OcxEnumerator, BaseDataClass, SchemaAttribute
 
+RENDER_VERSION = 3  # Increase when a change of the templates changes the rendered pages
+_NUMBER_START = frozenset('0123456789+-.iInN')  # The first character of the numbers, including inf and nan
+
+
+def _cell(value) -> str:
+    """The text of a table cell on one line.
+
+    DokuWiki merges an empty cell into the previous cell, so empty cells hold a space, and line breaks are forced
+    line breaks as a table row must be on one line.
+    """
+    if value is None:
+        return ' '
+    text = value if isinstance(value, str) else str(value)
+    if '\n' in text:
+        text = ' \\\\ '.join(line.strip() for line in text.splitlines())
+    return text.strip() or ' '
+
+
+def _number(value) -> Optional[type]:
+    """The number type of a table value, ``int`` or ``float``, None if the value is not a number."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return type(value)
+    if isinstance(value, str) and value.lstrip()[:1] in _NUMBER_START:
+        for kind in (int, float):
+            try:
+                kind(value)
+            except ValueError:
+                continue
+            return kind
+    return None
+
+
+def _numbers(column: Sequence) -> Sequence:
+    """The values of a table ``column`` with the numbers written as the tables have always been written.
+
+    In a column of numbers holding a number with a fraction all numbers are written in the shortest notation,
+    ``1.0`` as ``1``. Other columns are written as they are.
+    """
+    fraction = False
+    for value in column:
+        if value is None or value == '':
+            continue
+        kind = _number(value)
+        if kind is None:
+            return column
+        fraction = fraction or kind is float
+    if not fraction:
+        return column
+    return [value if value is None or value == '' else format(float(value), 'g') for value in column]
+
+
+def _rows(headers: Iterable, columns: Iterable[Sequence]) -> str:
+    """The dokuwiki table of the ``columns`` with ``headers``, one unpadded line per row."""
+    # protect the table headers (keys) from being linked
+    lines = [f'^%%{"%%^%%".join(map(str, headers))}%%^']
+    lines += [f'|{"|".join(map(_cell, row))}|' for row in zip_longest(*columns)]
+    return '\n'.join(lines)
+
 
 class Render:
     """Render OCX schema data as DokuWiki markup strings."""
 
     @staticmethod
-    def table(table: dict) -> str:
-        """Render dict to dokuwiki table.
+    def table(table: Union[Table, dict]) -> str:
+        """Render a table to dokuwiki table.
+
+        The rows are written unpadded, DokuWiki does not need aligned columns. Numbers with a fraction are written
+        in the shortest notation, see :func:`_numbers`.
 
         Arguments:
-            table: The input table data
+            table: The input table data, a page model table or the columns keyed by the column header
 
         Returns:
             dokuwiki table
         """
-        # protect the table headers (keys) from being linked
-        table = {f'%%{key}%%': table[key] for key in table}
-        # Jira format is closest to the dokuwiki table format
-        result = tabulate(table, headers="keys", tablefmt="jira")
-        # Just need to replace header separators
-        content = result.replace('||', '^')
-        return content
+        if not table:
+            return ''
+        headers, columns = (table.headers, table.columns) if isinstance(table, Table) else (table, table.values())
+        return _rows(headers, map(_numbers, columns))
 
     @staticmethod
     def dict(attribute: dict) -> str:
@@ -45,93 +106,127 @@ class Render:
         Returns:
             dokuwiki table
         """
-        # protect the table headers (keys) to be linked
-        attribute = {f'%%{key}%%': attribute[key] for key in attribute}
-        # Header
-        content = '^'
-        for col in attribute:
-            content += f'{col}^'
-        content += '\n|'
-        for col in attribute.values():
-            content += f'{col}|'
-        content += '\n\n'
-        return content
+        if not attribute:
+            return '\n\n'
+        return f'{_rows(attribute, ((value,) for value in attribute.values()))}\n\n'
 
     @staticmethod
-    def page(ocx: OcxGlobalElement, data: struct_data.WikiSchema, global_elements: List, builtins: Dict) -> str:
+    def page(ocx: Union[OcxGlobalElement, PageModel], data: Union[struct_data.WikiSchema, struct_data.DataEntryHeader],
+             links: LinkIndex, publish_ns: str, used_by: Optional[List[str]] = None) -> str:
         """Render an OCX global element to a dokuwiki page.
 
+        The children and attributes are linked while rendering, the schema objects are left unchanged.
+
         Arguments:
-            ocx:             The OCX element to render
-            data:            The dokuwiki structured data
-            global_elements: OCX global element names
-            builtins:        Builtin W3C types
+            ocx:        The OCX element to render or its page model
+            data:       The dokuwiki structured data
+            links:      The link targets of the schema globals and the W3C builtins
+            publish_ns: The publishing namespace the internal links point to
+            used_by:    The ``prefix:name`` of the schema items referencing the element, taken from the page model
+                        if ``ocx`` is a page model
 
         Returns:
             dokuwiki page
         """
-        name = ocx.get_name()
-        prefix = ocx.get_prefix()
+        model = ocx if isinstance(ocx, PageModel) else PageModel.from_element(ocx, used_by)
+        name = model.name
         content = Render.page_header(name)
-        content += Render.page_text(ocx.get_annotation())
+        content += Render.page_text(model.annotation)
         # Children table
-        tbl = ocx.children_to_dict()
+        tbl = Render.children_table(model, links, publish_ns)
         if tbl:
             content += f'%%{name}%% has the following child elements:\n'
             content += f'\n{Render.table(tbl)}\n\n'
         # Attributes table
-        tbl = ocx.attributes_to_dict()
+        tbl = Render.attributes_table(model, links, publish_ns)
         if tbl:
             content += f'%%{name}%% has the following attributes:\n'
             content += f'\n{Render.table(tbl)}\n\n'
+        # Used by table
+        if tbl := Render.used_by_table(model.used_by, publish_ns):
+            content += f'%%{name}%% is used by:\n'
+            content += f'\n{Render.table(tbl)}\n\n'
         content += struct_data.struct_gen('version', data.to_dict())
         return content
 
     @staticmethod
-    def enum(enum: OcxEnumerator, data: struct_data.WikiSchema) -> str:
+    def enum(enum: Union[OcxEnumerator, PageModel],
+             data: Union[struct_data.WikiSchema, struct_data.DataEntryHeader]) -> str:
         """Render an OCX enumerator to a dokuwiki page.
 
         Arguments:
-            enum: The enumerator to publish
+            enum: The enumerator to publish or its page model
             data: The dokuwiki structured data
 
         Returns:
             dokuwiki page
         """
-        name = enum.name
+        model = enum if isinstance(enum, PageModel) else PageModel.from_enum(enum)
+        name = model.name
         content = Render.page_header(name)
-        if tbl := enum.to_dict():
+        if tbl := model.values:
             # Protect enum values from being linked
-            table = defaultdict(list)
-            for key in tbl:
-                if 'Description' in key:
-                    table[key] = tbl[key]
-                if 'Value' in key:
-                    for v in tbl[key]:
-                        table[key].append(f'%%{v}%%')
+            columns = {name: tuple(f'%%{v}%%' for v in values)
+                       for name, values in zip(tbl.names, tbl.columns, strict=True) if 'Value' in name}
             content += f'%%{name}%% has the following values:\n'
-            content += f'\n{Render.table(table)}\n\n'
+            content += f'\n{Render.table(tbl.replace(**columns))}\n\n'
         content += struct_data.struct_gen('version', data.to_dict())
         return content
 
     @staticmethod
-    def attribute(attribute: SchemaAttribute, data: struct_data.WikiSchema) -> str:
+    def attribute(attribute: Union[SchemaAttribute, PageModel],
+                  data: Union[struct_data.WikiSchema, struct_data.DataEntryHeader]) -> str:
         """Render a schema attribute to a dokuwiki page.
 
         Arguments:
-            attribute: The attribute to publish
+            attribute: The attribute to publish or its page model
             data:      The dokuwiki structured data
 
         Returns:
             dokuwiki page
         """
-        name = attribute.name
+        model = attribute if isinstance(attribute, PageModel) else PageModel.from_attribute(attribute)
+        name = model.name
         content = Render.page_header(name)
         content += f'%%{name}%% has the following values:\n'
-        content += f'\n{Render.dict(attribute.to_dict())}\n\n'
+        # The values of one attribute are written as they are, the numbers are only unified in the rows of a table
+        content += f'\n{_rows(model.values.headers, model.values.columns)}\n\n\n\n'
         content += struct_data.struct_gen('version', data.to_dict())
         return content
 
+    @staticmethod
+    def changelog(change_set: ChangeSet, publish_ns: str) -> str:
+        """Render a schema change set to a dokuwiki changelog page.
+
+        Added and modified items link to their page, removed items are not linked as their pages are not
+        published anymore.
+
+        Arguments:
+            change_set: The changes between two schema versions
+            publish_ns: The publishing namespace the internal links point to
+
+        Returns:
+            dokuwiki page
+        """
+        content = Render.page_header(f'Schema changes from {change_set.from_version} to {change_set.to_version}')
+        if not change_set.changes:
+            return content + Render.page_text('There are no changes.')
+        content += f'\n{Render.table(change_set.tbl_summary())}\n\n'
+        for status in STATUSES:
+            changes = change_set.with_status(status)
+            if not changes:
+                continue
+            table = defaultdict(list)
+            for change in changes:
+                prefix, name = change.name.split(':', 1)
+                table['Kind'].append(change.kind)
+                table['Name'].append(name if status == REMOVED else Render.link_internal(prefix, name, publish_ns))
+                table['Changes'].append(', '.join(change.details))
+            if status != MODIFIED:
+                del table['Changes']
+            content += f'====={status.capitalize()}=====\n\n{Render.table(table)}\n\n'
+        return content
+
     @staticmethod
     def page_header(name: str) -> str:
         """Render a dokuwiki header with level 3.
@@ -181,6 +276,87 @@ class Render:
         """
         return struct_data.struct_gen('version', data)
 
+    @staticmethod
+    def children_table(ocx: Union[OcxGlobalElement, PageModel], links: LinkIndex, publish_ns: str) -> Table:
+        """The children table of an OCX element with the child names and types linked.
+
+        Arguments:
+            ocx:        The OCX element or its page model
+            links:      The link targets of the schema globals and the W3C builtins
+            publish_ns: The publishing namespace
+
+        Returns:
+            The linked children table
+        """
+        table = (ocx if isinstance(ocx, PageModel) else PageModel.from_element(ocx)).children
+        if not table:
+            return table
+        names, prefixes, types = table.column('name'), table.column('prefix'), table.column('type')
+        return table.replace(
+            name=[Render.link_internal(prefix, name, publish_ns) for prefix, name in zip(prefixes, names, strict=True)],
+            type=[Render.link_type(type_name, prefix, links, publish_ns) for type_name, prefix in zip(types, prefixes, strict=True)])
+
+    @staticmethod
+    def attributes_table(ocx: Union[OcxGlobalElement, PageModel], links: LinkIndex, publish_ns: str) -> Table:
+        """The attributes table of an OCX element with the attributes named like a schema global and the types linked.
+
+        Arguments:
+            ocx:        The OCX element or its page model
+            links:      The link targets of the schema globals and the W3C builtins
+            publish_ns: The publishing namespace
+
+        Returns:
+            The linked attributes table
+        """
+        table = (ocx if isinstance(ocx, PageModel) else PageModel.from_element(ocx)).attributes
+        if not table:
+            return table
+        names, prefixes, types = table.column('name'), table.column('prefix'), table.column('type')
+        return table.replace(
+            name=[Render.link_internal(prefix, name, publish_ns) if links.is_global(name) else name
+                  for prefix, name in zip(prefixes, names, strict=True)],
+            type=[Render.link_type(type_name, prefix, links, publish_ns) for type_name, prefix in zip(types, prefixes, strict=True)])
+
+    @staticmethod
+    def used_by_table(used_by: List[str], publish_ns: str) -> Dict:
+        """The table of the schema items referencing an item, with the item names linked.
+
+        Arguments:
+            used_by:    The ``prefix:name`` of the referencing items
+            publish_ns: The publishing namespace
+
+        Returns:
+            The table columns keyed by the column header
+        """
+        table = defaultdict(list)
+        for qname in used_by:
+            prefix, name = qname.split(':', 1)
+            table['Used by'].append(Render.link_internal(prefix, name, publish_ns))
+        return table
+
+    @staticmethod
+    def link_type(type_name: Optional[str], prefix: str, links: LinkIndex, publish_ns: str) -> Optional[str]:
+        """Return a dokuwiki link to a type, an external link for W3C builtins and a page link otherwise.
+
+        Arguments:
+            type_name:  The type name with or without prefix
+            prefix:     The namespace prefix of an unqualified type name
+            links:      The link targets of the schema globals and the W3C builtins
+            publish_ns: The publishing namespace
+
+        Returns:
+            dokuwiki link string, or the type name if it cannot be linked
+        """
+        if not type_name:
+            return type_name
+        if links.builtin(type_name) is not None:
+            return Render.link_external(type_name, links.builtins)
+        type_parts = type_name.split(':') if ':' in type_name else [prefix, type_name]
+        if len(type_parts) != 2:
+            return type_name
+        type_prefix, name = type_parts
+        return f'[[{publish_ns}:{type_prefix}:{name}]]'
+
     @staticmethod
     def link_internal(prefix: str, name: str, publish_ns: str) -> str:
         """Return a dokuwiki internal link to a global element.
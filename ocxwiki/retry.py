@@ -0,0 +1,220 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Retry policy with exponential backoff and a circuit breaker for wiki requests."""
+
+# System imports
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Optional
+import asyncio
+import datetime
+import random
+import time
+
+# Third party imports
+from loguru import logger
+
+# Module imports
+from ocxwiki.error import WikiTransportError, WikiUnavailableError
+
+RETRY_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})  # HTTP status codes worth a retry
+
+
+def is_retryable(error: BaseException) -> bool:
+    """True if ``error`` is transient: a connection failure, a timeout or a retryable HTTP status.
+
+    XML-RPC faults and rejected credentials are answers of the wiki and are never retried.
+    """
+    if isinstance(error, WikiTransportError):
+        return error.status in RETRY_STATUS
+    return isinstance(error, (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError))
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """The delay in seconds requested by the ``Retry-After`` header of an HTTP error response, if any."""
+    value = getattr(error, 'headers', {}).get('retry-after') if isinstance(error, WikiTransportError) else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryStats:
+    """Counters of the retried requests.
+
+    Parameters:
+        retries: The number of retried requests
+        wait: The seconds spent waiting for a retry or for the circuit breaker to close
+        breaker_opened: The number of times the circuit breaker opened
+    """
+    retries: int = 0
+    wait: float = 0.0
+    breaker_opened: int = 0
+
+    def since(self, earlier: 'RetryStats') -> 'RetryStats':
+        """The counters accumulated after the snapshot ``earlier``."""
+        return RetryStats(self.retries - earlier.retries, self.wait - earlier.wait,
+                          self.breaker_opened - earlier.breaker_opened)
+
+    def snapshot(self) -> 'RetryStats':
+        """A copy of the current counters."""
+        return RetryStats(self.retries, self.wait, self.breaker_opened)
+
+
+class CircuitBreaker:
+    """Pause all requests while the wiki is down.
+
+    After ``threshold`` consecutive transient failures the breaker opens and requests wait instead of being sent.
+    After ``reset_timeout`` seconds one probe request is let through. If it succeeds the breaker closes, otherwise
+    it opens again for twice as long, up to ``max_reset_timeout``. Requests fail with a
+    :class:`~ocxwiki.error.WikiUnavailableError` once the breaker has been open for ``give_up_after`` seconds.
+
+    Args:
+        threshold: Consecutive transient failures opening the breaker
+        reset_timeout: Seconds before the first probe request
+        max_reset_timeout: The maximum seconds between probe requests
+        give_up_after: Seconds the wiki may be down before requests fail
+        clock: Callable returning the current time in seconds
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 5.0, max_reset_timeout: float = 60.0,
+                 give_up_after: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self._threshold = max(1, threshold)
+        self._base_timeout = reset_timeout
+        self._max_timeout = max_reset_timeout
+        self._give_up_after = give_up_after
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._timeout = reset_timeout
+        self._opened_at = 0.0
+        self._open_until = 0.0
+
+    @property
+    def state(self) -> str:
+        """Return the breaker state: ``closed``, ``open`` or ``half-open``."""
+        return self._state
+
+    async def wait(self, stats: Optional[RetryStats] = None):
+        """Wait until a request may be sent.
+
+        Raises:
+            WikiUnavailableError: If the wiki has been down for longer than ``give_up_after`` seconds.
+        """
+        while self._state != self.CLOSED:
+            now = self._clock()
+            if now - self._opened_at >= self._give_up_after:
+                raise WikiUnavailableError(f'The wiki has been unavailable for {now - self._opened_at:.0f} seconds')
+            if self._state == self.OPEN and now >= self._open_until:
+                # This request is the probe
+                self._state = self.HALF_OPEN
+                return
+            # Wait for the probe time, or for the result of the probe in flight
+            delay = self._open_until - now if self._state == self.OPEN else min(0.5, self._base_timeout)
+            delay = min(delay, self._opened_at + self._give_up_after - now)
+            if stats is not None:
+                stats.wait += delay
+            await asyncio.sleep(delay)
+
+    def success(self):
+        """Record a request answered by the wiki."""
+        if self._state != self.CLOSED:
+            logger.info('The wiki is available again, resuming requests')
+        self._state = self.CLOSED
+        self._failures = 0
+        self._timeout = self._base_timeout
+
+    def failure(self, stats: Optional[RetryStats] = None):
+        """Record a transient request failure."""
+        now = self._clock()
+        if self._state == self.HALF_OPEN:
+            self._timeout = min(self._max_timeout, 2 * self._timeout)
+            self._open(now)
+        elif self._state == self.CLOSED:
+            self._failures += 1
+            if self._failures >= self._threshold:
+                self._opened_at = now
+                self._open(now)
+                if stats is not None:
+                    stats.breaker_opened += 1
+
+    def _open(self, now: float):
+        self._state = self.OPEN
+        self._open_until = now + self._timeout
+        logger.warning(f'The wiki seems to be down, pausing requests for {self._timeout:.1f} seconds')
+
+
+class RetryPolicy:
+    """Retry transient failures of idempotent requests with exponential backoff and full jitter.
+
+    The delay before retry ``n`` is a random value up to ``base_delay * 2**(n-1)`` seconds, capped at ``max_delay``.
+    A ``Retry-After`` header of the wiki response is honoured if it asks for a longer delay.
+
+    Args:
+        attempts: The maximum number of attempts of a request
+        base_delay: The backoff delay in seconds before the first retry
+        max_delay: The maximum backoff delay in seconds
+        breaker: The circuit breaker shared by all requests to the wiki, None for no breaker
+        jitter: Callable returning the random backoff fraction in [0, 1)
+
+    Attributes:
+        stats: The retry counters
+    """
+
+    def __init__(self, attempts: int = 4, base_delay: float = 0.5, max_delay: float = 30.0,
+                 breaker: Optional[CircuitBreaker] = None, jitter: Callable[[], float] = random.random):
+        self._attempts = max(1, attempts)
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._jitter = jitter
+        self.breaker = breaker
+        self.stats = RetryStats()
+
+    def delay(self, retry: int, requested: Optional[float] = None) -> float:
+        """The delay in seconds before ``retry`` (starting at 1), at least the ``requested`` delay."""
+        backoff = self._jitter() * min(self._max_delay, self._base_delay * 2 ** (retry - 1))
+        return max(backoff, min(requested, self._max_delay)) if requested is not None else backoff
+
+    async def run(self, request: Callable[[], Awaitable[Any]], idempotent: bool = True) -> Any:
+        """Run ``request``, retrying transient failures if the request is ``idempotent``.
+
+        Arguments:
+            request: Callable returning a new awaitable for each attempt
+            idempotent: False for requests which must not be repeated, e.g. appending to a page
+        """
+        attempt = 1
+        while True:
+            if self.breaker is not None:
+                await self.breaker.wait(self.stats)
+            try:
+                result = await request()
+            except Exception as e:
+                if not is_retryable(e):
+                    if self.breaker is not None:
+                        self.breaker.success()
+                    raise
+                if self.breaker is not None:
+                    self.breaker.failure(self.stats)
+                if not idempotent or attempt >= self._attempts:
+                    raise
+                delay = self.delay(attempt, retry_after(e))
+                logger.debug(f'Retry {attempt} in {delay:.2f} seconds after: {e}')
+                self.stats.retries += 1
+                self.stats.wait += delay
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            if self.breaker is not None:
+                self.breaker.success()
+            return result
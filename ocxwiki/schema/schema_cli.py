@@ -1,6 +1,10 @@
 #  Copyright (c) 2023-2026. OCX Consortium https://3docx.org. See the LICENSE
 """Schema CLI commands for processing and summarising OCX schema files."""
 
+# System imports
+import textwrap
+import time
+
 # Third party imports
 import typer
 from loguru import logger
@@ -11,6 +15,10 @@ from tabulate import tabulate
 
 # Module imports
 from ocxwiki import WORKING_DRAFT, SCHEMA_FOLDER
+from ocxwiki.async_helper import run_async
+from ocxwiki.error import OcxWikiError
+from ocxwiki.render import RichRender
+from ocxwiki.watcher import SchemaWatcher, DEFAULT_INTERVAL, DEFAULT_DEBOUNCE
 from ocxwiki.wiki_manager import WikiManager
 
 schema = typer.Typer(
@@ -53,11 +61,18 @@ def process_url(
         folder: Annotated[Path, typer.Option(
             help='The schema download folder.',
         )] = Path(SCHEMA_FOLDER),
+        cache: Annotated[bool, typer.Option(
+            help='Reuse the processed schema from the schema cache if the schema is unchanged.',
+        )] = True,
+        incremental: Annotated[bool, typer.Option(
+            help='Transform only the schema elements affected by changes since the last processed schema '
+                 'from the same source.',
+        )] = False,
 ):
     """Download and process a schema from a URL before publishing."""
     wiki_manager = _get_wiki_manager(ctx)
     if wiki_manager:
-        if wiki_manager.process_schema(url, folder):
+        if wiki_manager.process_schema(url, folder, use_cache=cache, incremental=incremental):
             summary(ctx)
 
 
@@ -68,15 +83,205 @@ def process_folder(
             help='The folder containing the schema files.',
             prompt=True,
         )] = Path(SCHEMA_FOLDER),
+        cache: Annotated[bool, typer.Option(
+            help='Reuse the processed schema from the schema cache if the schema files are unchanged.',
+        )] = True,
+        incremental: Annotated[bool, typer.Option(
+            help='Transform only the schema elements affected by changes since the last processed schema '
+                 'from the same source.',
+        )] = False,
 ):
     """Process a schema from a local folder before publishing."""
     wiki_manager = _get_wiki_manager(ctx)
     if wiki_manager:
-        result = wiki_manager.process_schema_folder(folder)
+        result = wiki_manager.process_schema_folder(folder, use_cache=cache, incremental=incremental)
         if result:
             summary(ctx)
 
 
+@schema.command()
+def watch(
+        ctx: typer.Context,
+        folder: Annotated[Path, typer.Option(
+            help='The folder containing the schema files.',
+        )] = Path(SCHEMA_FOLDER),
+        interval: Annotated[float, typer.Option(
+            help='Seconds between the scans of the schema folder.',
+        )] = DEFAULT_INTERVAL,
+        debounce: Annotated[float, typer.Option(
+            help='Seconds the schema files must be unchanged before a change is processed.',
+        )] = DEFAULT_DEBOUNCE,
+        publish: Annotated[bool, typer.Option(
+            help='Republish the changed pages to the draft namespace.',
+        )] = True,
+        max_concurrent: Annotated[int, typer.Option(
+            help='Maximum number of concurrent publish operations.',
+        )] = 10,
+):
+    """Watch a schema folder, reprocess the schema when it changes and republish the changed pages.
+
+    Runs until interrupted with Ctrl-C. In the TUI, toggle the watch with F2 instead.
+    """
+    if (ctx.obj or {}).get('confirm_callback') is not None:
+        print('In the TUI, toggle the schema watch with [bold]F2[/bold].')
+        return
+    wiki_manager = _get_wiki_manager(ctx)
+    watcher = SchemaWatcher(wiki_manager, folder, interval=interval, debounce=debounce, publish=publish,
+                            max_concurrent=max_concurrent)
+    print(f'Watching the schema in {folder}, press Ctrl-C to stop')
+    try:
+        run_async(watcher.run(on_update=lambda update: print(f'Schema changed: {update.summary()}')))
+    except OcxWikiError as e:
+        print(f'[bold red]Error:[/bold red] {e}')
+    except KeyboardInterrupt:
+        print('Stopped watching')
+
+
+@schema.command()
+def diff(
+        ctx: typer.Context,
+        from_: Annotated[str, typer.Option(
+            '--from',
+            help='The url or folder of the schema to compare from.',
+            prompt=True,
+        )],
+        to: Annotated[str, typer.Option(
+            help='The url or folder of the schema to compare to, default the processed schema.',
+        )] = '',
+        details: Annotated[bool, typer.Option(
+            help='List the changed items and their changed parts.',
+        )] = True,
+):
+    """Compare two schema versions and print the added, modified and removed items."""
+    wiki_manager = _get_wiki_manager(ctx)
+    try:
+        change_set = wiki_manager.diff_schema(from_, to or None)
+    except OcxWikiError as e:
+        print(f'[bold red]Error:[/bold red] {e}')
+        return
+    print(f'Schema changes from {change_set.from_version} to {change_set.to_version}:\n')
+    print(tabulate(change_set.tbl_summary(), headers='keys'), '\n')
+    if details:
+        for change in change_set.changes:
+            changed = f' ({", ".join(change.details)})' if change.details else ''
+            print(f'  {change.status:8} {change.kind:12} {change.name}{changed}')
+
+
+@schema.command()
+def impact(
+        ctx: typer.Context,
+        name: Annotated[str, typer.Option(
+            help='The schema item prefix:name, e.g. ocx:Vessel.',
+            prompt=True,
+        )],
+):
+    """Print the items using a schema item and the pages to republish when it changes."""
+    wiki_manager = _get_wiki_manager(ctx)
+    if wiki_manager.transformer is None:
+        print('Process a schema first')
+        return
+    graph = wiki_manager.graph
+    if name not in graph:
+        print(f'[yellow]No schema item [bold]{name}[/bold] found.[/yellow]')
+        return
+    print(f'{name} uses {len(graph.uses(name))} and is used by {len(graph.used_by(name))} schema items:')
+    for user in graph.used_by(name):
+        print(f'  {user}')
+    items = wiki_manager.impacted_items([name])
+    print(f'\nA change of {name} republishes {len(items)} pages:')
+    for kind, item in items:
+        print(f'  {wiki_manager._item_key(kind, item)}')
+
+
+@schema.command()
+def export(ctx: typer.Context):
+    """Export the processed schema to the schema database, replacing a stored schema of the same version."""
+    wiki_manager = _get_wiki_manager(ctx)
+    if wiki_manager.transformer is None:
+        print('Process a schema first')
+        return
+    count = wiki_manager.export_schema(force=True)
+    print(f'Exported {count} schema items to {wiki_manager.schema_db.path}')
+
+
+@schema.command()
+def query(
+        ctx: typer.Context,
+        name: Annotated[str, typer.Option(
+            help='Find the schema items with a name containing the text, case-insensitive, e.g. ocx:Plate.',
+        )] = '',
+        type_name: Annotated[str, typer.Option(
+            '--type',
+            help='Find the children and attributes declared with the type, e.g. ocx:guid.',
+        )] = '',
+        used_by: Annotated[str, typer.Option(
+            help='Find the schema items referencing the item, e.g. ocx:Vessel.',
+        )] = '',
+        children: Annotated[str, typer.Option(
+            help='List the children of the schema element.',
+        )] = '',
+        version: Annotated[str, typer.Option(
+            help='The schema version, default all versions in the schema database.',
+        )] = '',
+        kind: Annotated[str, typer.Option(
+            help='Restrict --name to one kind: pages, enums, attributes or simple_types.',
+        )] = '',
+        exact: Annotated[bool, typer.Option(
+            help='Match the whole name with --name.',
+        )] = False,
+):
+    """Query the schema database by name, type or where-used without processing the schema.
+
+    The processed schema is exported to the database first. Without a query, the stored schema versions are listed.
+    """
+    wiki_manager = _get_wiki_manager(ctx)
+    if wiki_manager.transformer is not None:
+        wiki_manager.export_schema()
+    database = wiki_manager.schema_db
+    version = version or None
+    if name:
+        rows = database.find(name, version, kind or None, exact)
+    elif type_name:
+        rows = database.typed(type_name, version)
+    elif used_by:
+        rows = database.used_by(used_by, version)
+    elif children:
+        rows = database.children(children, version)
+    else:
+        rows = database.versions()
+    if rows:
+        print(tabulate(rows, headers='keys'))
+    print(f'\n{len(rows)} rows from {database.path}')
+
+
+@schema.command()
+def search(
+        ctx: typer.Context,
+        text: Annotated[str, typer.Option(
+            help='The search text, matching names, annotations, attribute names and enum values, e.g. plate cut.',
+            prompt=True,
+        )],
+        limit: Annotated[int, typer.Option(
+            help='The maximum number of results.',
+        )] = 20,
+        kind: Annotated[str, typer.Option(
+            help='Only return one kind: pages, enums, attributes or simple_types.',
+        )] = '',
+):
+    """Search the processed schema, the best matching items first."""
+    wiki_manager = _get_wiki_manager(ctx)
+    if wiki_manager.transformer is None:
+        print('Process a schema first')
+        return
+    start = time.perf_counter()
+    hits = wiki_manager.search_index.search(text, limit, kind or None)
+    elapsed = (time.perf_counter() - start) * 1000
+    if hits:
+        print(tabulate([(hit.score, hit.kind, hit.name, textwrap.shorten(hit.description, 80)) for hit in hits],
+                       headers=['Score', 'Kind', 'Name', 'Description']))
+    print(f'\n{len(hits)} results in {elapsed:.1f} ms')
+
+
 @schema.command()
 def element_table(
         ctx: typer.Context,
@@ -113,22 +318,19 @@ def element_table(
     version = wiki_manager.transformer.parser.get_schema_version()
     print(f'[bold cyan]Global schema elements[/bold cyan] ({len(filtered)} of {len(elements)} total) – schema v{version}\n')
     for ocx in filtered:
-        print(f'[bold magenta]{ocx.get_name()}[/bold magenta]')
-        annotation = ocx.get_annotation()
-        if annotation:
-            print(annotation)
-        children = ocx.children_to_dict()
-        if children:
-            print(f'  [bold]Child elements:[/bold]')
-            print(children)
-        attrs = ocx.attributes_to_dict()
-        if attrs:
-            print(f'  [bold]Attributes:[/bold]')
-            print(attrs)
+        RichRender.element(wiki_manager.page_model('pages', ocx))
         print()
 
 
 
+@schema.command()
+def cache_clear(ctx: typer.Context):
+    """Remove all processed schemas from the schema cache."""
+    wiki_manager = _get_wiki_manager(ctx)
+    removed = wiki_manager.schema_cache.clear()
+    print(f'Removed {removed} processed schemas from the cache in {wiki_manager.schema_cache.folder}')
+
+
 @schema.command()
 def summary(ctx: typer.Context):
     """Print a summary of the processed schema."""
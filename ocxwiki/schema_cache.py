@@ -0,0 +1,292 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Persistent cache of processed schemas keyed by the content hash of the XSD files."""
+
+# System imports
+from collections import defaultdict
+from dataclasses import dataclass, field
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Union
+import hashlib
+import os
+import pickle
+
+# Third party imports
+from loguru import logger
+
+# Module imports
+import ocxwiki
+from ocxwiki import SCHEMA_FOLDER
+from ocxwiki.links import LinkIndex
+from ocx_schema_parser.data_classes import OcxEnumerator, OcxSchemaAttribute, OcxSchemaChild, SchemaAttribute
+from ocx_schema_parser.xelement import LxmlElement
+from ocx_schema_parser.transformer import Transformer
+
+if TYPE_CHECKING:
+    from ocxwiki.incremental import SchemaState
+
+CACHE_FORMAT = 4  # Bump when the pickled snapshot classes change
+MAX_ENTRIES = 8  # Processed schemas kept in the cache
+DEFAULT_CACHE_FOLDER = Path(SCHEMA_FOLDER or '.') / 'cache'
+
+
+def _parser_version() -> str:
+    try:
+        return metadata.version('ocx-schema-parser')
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+def schema_files(folder: Union[Path, str]) -> List[Path]:
+    """The XSD files in ``folder`` and its sub folders, in a stable order."""
+    folder = Path(folder)
+    return sorted(folder.glob('**/*.xsd'), key=lambda p: p.relative_to(folder).as_posix())
+
+
+def schema_digest(folder: Union[Path, str]) -> Optional[str]:
+    """The sha256 hash of the names and content of all XSD files in ``folder``, None if there are none."""
+    folder = Path(folder)
+    files = schema_files(folder)
+    if not files:
+        return None
+    digest = hashlib.sha256()
+    for file in files:
+        digest.update(file.relative_to(folder).as_posix().encode('utf-8') + b'\0')
+        digest.update(hashlib.sha256(file.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+@dataclass
+class SchemaElement:
+    """The processed content of a global schema element, a picklable stand-in for ``OcxGlobalElement``."""
+    name: str
+    prefix: str
+    tag: str
+    namespace: str
+    annotation: Optional[str]
+    children: List[OcxSchemaChild] = field(default_factory=list)
+    attributes: List[OcxSchemaAttribute] = field(default_factory=list)
+
+    @classmethod
+    def from_element(cls, ocx) -> 'SchemaElement':
+        """Copy the processed content of the ``OcxGlobalElement`` ``ocx``."""
+        return cls(ocx.get_name(), ocx.get_prefix(), ocx.get_tag(), ocx.get_namespace(), ocx.get_annotation(),
+                   list(ocx.get_children()), list(ocx.get_attributes()))
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_prefix(self) -> str:
+        return self.prefix
+
+    def get_tag(self) -> str:
+        return self.tag
+
+    def get_namespace(self) -> str:
+        return self.namespace
+
+    def get_annotation(self) -> Optional[str]:
+        return self.annotation
+
+    def get_children(self) -> List[OcxSchemaChild]:
+        return self.children
+
+    def get_attributes(self) -> List[OcxSchemaAttribute]:
+        return self.attributes
+
+    def children_to_dict(self) -> Dict:
+        """The children table keyed by the column header, as ``OcxGlobalElement.children_to_dict``."""
+        table = defaultdict(list)
+        for child in sorted(self.children, key=lambda x: x.name):
+            for key, value in child.to_dict().items():
+                table[key].append(value)
+        return table
+
+    def attributes_to_dict(self) -> Dict:
+        """The attributes table keyed by the column header, as ``OcxGlobalElement.attributes_to_dict``."""
+        table = defaultdict(list)
+        for attribute in self.attributes:
+            for key, value in attribute.to_dict().items():
+                table[key].append(value)
+        return table
+
+
+@dataclass
+class SchemaInfo:
+    """The schema metadata of a processed schema, a picklable stand-in for the ``OcxParser``."""
+    version: str
+    namespaces: Dict
+    schema_namespaces: Dict[str, str]
+    summary: Dict
+
+    def get_schema_version(self) -> str:
+        return self.version
+
+    def get_schema_namespace(self, version: str) -> str:
+        return self.schema_namespaces.get(version, 'Missing')
+
+    def get_namespaces(self) -> Dict:
+        return self.namespaces
+
+    def tbl_summary(self, short: bool = True) -> Dict:
+        return self.summary
+
+
+class SchemaSnapshot:
+    """A processed schema restored without parsing, offering the read interface of the ``Transformer``.
+
+    Args:
+        parser: The schema metadata
+        elements: The global elements keyed by tag
+        enumerators: The enumerators keyed by name
+        simple_types: The global simple types
+        global_attributes: The global attributes
+        links: The link index of the schema
+        state: The content hashes and element dependencies for incremental processing
+    """
+
+    def __init__(self, parser: SchemaInfo, elements: Dict[str, SchemaElement], enumerators: Dict[str, OcxEnumerator],
+                 simple_types: List[SchemaAttribute], global_attributes: List[SchemaAttribute], links: LinkIndex,
+                 state: Optional['SchemaState'] = None):
+        self.parser = parser
+        self._elements = elements
+        self._enumerators = enumerators
+        self._simple_types = simple_types
+        self._global_attributes = global_attributes
+        self.links = links
+        self.state = state
+
+    @classmethod
+    def from_transformer(cls, transformer: Transformer, links: LinkIndex,
+                         state: Optional['SchemaState'] = None) -> 'SchemaSnapshot':
+        """Copy the processed content of ``transformer``."""
+        parser = transformer.parser
+        version = parser.get_schema_version()
+        info = SchemaInfo(version, dict(parser.get_namespaces()), {version: parser.get_schema_namespace(version)},
+                          parser.tbl_summary())
+        elements = {ocx.get_tag(): SchemaElement.from_element(ocx) for ocx in transformer.get_ocx_elements()}
+        return cls(info, elements, dict(transformer.get_enumerators()), list(transformer.get_simple_types()),
+                   list(transformer.get_global_attributes()), links, state)
+
+    def is_transformed(self) -> bool:
+        return True
+
+    def get_ocx_elements(self) -> List[SchemaElement]:
+        return list(self._elements.values())
+
+    def ocx_iterator(self) -> Iterator[SchemaElement]:
+        return iter(self._elements.values())
+
+    def get_ocx_element_from_type(self, schema_type: str) -> Optional[SchemaElement]:
+        """The global element with the type ``prefix:name``."""
+        name = LxmlElement.strip_namespace_prefix(schema_type)
+        prefix = LxmlElement.namespace_prefix(schema_type)
+        result = None
+        for ocx in self._elements.values():
+            if ocx.name == name and ocx.prefix == prefix:
+                result = ocx
+        return result
+
+    def get_enumerators(self) -> Dict[str, OcxEnumerator]:
+        return self._enumerators
+
+    def get_simple_types(self) -> List[SchemaAttribute]:
+        return self._simple_types
+
+    def get_global_attributes(self) -> List[SchemaAttribute]:
+        return self._global_attributes
+
+
+class SchemaCache:
+    """Processed schemas pickled to ``folder``, keyed by the :func:`schema_digest` of their XSD files.
+
+    An entry is only used by the same cache format, ocxwiki version and schema parser version that wrote it. At most
+    :data:`MAX_ENTRIES` schemas are kept, the least recently used are removed.
+
+    Args:
+        folder: The cache folder
+    """
+
+    def __init__(self, folder: Union[Path, str] = DEFAULT_CACHE_FOLDER):
+        self._folder = Path(folder)
+
+    @property
+    def folder(self) -> Path:
+        """Return the cache folder."""
+        return self._folder
+
+    def _path(self, digest: str) -> Path:
+        return self._folder / f'schema-v{CACHE_FORMAT}-{digest}.pickle'
+
+    @staticmethod
+    def _stamp() -> Dict:
+        return {'format': CACHE_FORMAT, 'ocxwiki': ocxwiki.__version__, 'parser': _parser_version()}
+
+    def load(self, digest: Optional[str]) -> Optional[SchemaSnapshot]:
+        """Return the processed schema with ``digest``, None if it is not cached or the entry is stale."""
+        path = self._path(digest) if digest else None
+        if path is None or not path.is_file():
+            return None
+        snapshot = self._read(path)
+        if snapshot is not None:
+            os.utime(path)
+            logger.debug(f'Loaded the processed schema {digest[:12]} from the cache')
+        return snapshot
+
+    def _read(self, path: Path) -> Optional[SchemaSnapshot]:
+        try:
+            with open(path, 'rb') as f:
+                stamp = pickle.load(f)
+                if stamp != self._stamp():
+                    logger.debug(f'Ignoring the schema cache entry {path.name} written by {stamp}')
+                    return None
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f'Cannot read the schema cache entry {path}: {e}')
+            return None
+
+    def latest(self, source: Optional[str] = None) -> Optional[SchemaSnapshot]:
+        """Return the most recently used processed schema, None if the cache is empty.
+
+        Arguments:
+            source: Only return a schema processed from this url or folder, see
+                :class:`~ocxwiki.incremental.SchemaState`
+        """
+        entries = sorted(self._folder.glob(f'schema-v{CACHE_FORMAT}-*.pickle'), key=lambda p: p.stat().st_mtime,
+                         reverse=True) if self._folder.is_dir() else []
+        for path in entries:
+            snapshot = self._read(path)
+            if snapshot is not None and (source is None or
+                                         (snapshot.state is not None and snapshot.state.source == source)):
+                os.utime(path)
+                return snapshot
+        return None
+
+    def store(self, digest: str, snapshot: SchemaSnapshot):
+        """Write the processed schema with ``digest`` atomically."""
+        self._folder.mkdir(parents=True, exist_ok=True)
+        path = self._path(digest)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            pickle.dump(self._stamp(), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self._prune()
+
+    def _prune(self):
+        entries = sorted(self._folder.glob('schema-v*.pickle'), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in entries[MAX_ENTRIES:]:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> int:
+        """Remove all cached schemas.
+
+        Returns:
+            The number of removed entries
+        """
+        count = 0
+        if self._folder.is_dir():
+            for path in list(self._folder.glob('schema-v*.pickle')) + list(self._folder.glob('*.tmp')):
+                path.unlink(missing_ok=True)
+                count += path.suffix == '.pickle'
+        return count
@@ -0,0 +1,251 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Indexed SQLite database of processed schemas for name, type and where-used lookups."""
+
+# System imports
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+import datetime
+import sqlite3
+
+# Third party imports
+from loguru import logger
+
+# Module imports
+from ocx_schema_parser.transformer import Transformer
+from ocx_schema_parser.xelement import LxmlElement
+from ocxwiki import SCHEMA_FOLDER
+from ocxwiki.graph import ReferenceGraph
+
+DEFAULT_DATABASE = Path(SCHEMA_FOLDER or '.') / 'schemas.sqlite'
+
+_TABLES = """
+CREATE TABLE IF NOT EXISTS schemas (
+    id INTEGER PRIMARY KEY, version TEXT NOT NULL UNIQUE, namespace TEXT, exported TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS namespaces (
+    schema_id INTEGER NOT NULL REFERENCES schemas(id) ON DELETE CASCADE, prefix TEXT, uri TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY, schema_id INTEGER NOT NULL REFERENCES schemas(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL, prefix TEXT NOT NULL, name TEXT NOT NULL COLLATE NOCASE, type TEXT, description TEXT);
+CREATE INDEX IF NOT EXISTS items_name ON items(name, schema_id);
+CREATE TABLE IF NOT EXISTS children (
+    item_id INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE, name TEXT NOT NULL, prefix TEXT,
+    type TEXT, type_name TEXT COLLATE NOCASE, use TEXT, cardinality TEXT, is_choice INTEGER, description TEXT);
+CREATE INDEX IF NOT EXISTS children_item ON children(item_id);
+CREATE INDEX IF NOT EXISTS children_type ON children(type_name);
+CREATE TABLE IF NOT EXISTS attributes (
+    item_id INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE, name TEXT NOT NULL, prefix TEXT,
+    type TEXT, type_name TEXT COLLATE NOCASE, use TEXT, default_value TEXT, fixed TEXT, description TEXT);
+CREATE INDEX IF NOT EXISTS attributes_item ON attributes(item_id);
+CREATE INDEX IF NOT EXISTS attributes_type ON attributes(type_name);
+CREATE TABLE IF NOT EXISTS enum_values (
+    item_id INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE, position INTEGER NOT NULL, value TEXT,
+    description TEXT);
+CREATE INDEX IF NOT EXISTS enum_values_item ON enum_values(item_id);
+CREATE TABLE IF NOT EXISTS refs (
+    source_id INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+    target_id INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+    PRIMARY KEY (source_id, target_id)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS refs_target ON refs(target_id);
+"""
+
+# The item columns returned by the lookups
+_ITEM = "s.version, i.kind, i.prefix || ':' || i.name AS name, i.type, i.description"
+
+
+def _split(name: str) -> tuple:
+    """The prefix and local name of ``name``, the prefix is None for an unqualified name."""
+    return (LxmlElement.namespace_prefix(name), LxmlElement.strip_namespace_prefix(name)) if ':' in name \
+        else (None, name)
+
+
+class SchemaDatabase:
+    """Processed schemas exported to an indexed SQLite database.
+
+    Each schema version is stored once, exporting a version again replaces it, so several versions sit side by
+    side in the same file. The lookups use the indices on the names, the types and the references, and take
+    milliseconds without processing the schema. Every call opens its own connection, so the database can be used
+    from any thread.
+
+    Args:
+        path: The database file
+    """
+
+    def __init__(self, path: Union[Path, str] = DEFAULT_DATABASE):
+        self._path = Path(path)
+
+    @property
+    def path(self) -> Path:
+        """Return the database file."""
+        return self._path
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path)
+        connection.row_factory = sqlite3.Row
+        connection.execute('PRAGMA foreign_keys = ON')
+        try:
+            with connection:
+                connection.executescript(_TABLES)
+                yield connection
+        finally:
+            connection.close()
+
+    def _rows(self, sql: str, parameters=()) -> List[Dict]:
+        with self._connect() as connection:
+            return [dict(row) for row in connection.execute(sql, parameters)]
+
+    def export(self, transformer: Transformer, graph: Optional[ReferenceGraph] = None) -> int:
+        """Store the schema processed by ``transformer``, replacing a stored schema of the same version.
+
+        Arguments:
+            transformer: The processed schema
+            graph: The references between the schema items, built from ``transformer`` if not given
+
+        Returns:
+            The number of stored schema items
+        """
+        parser = transformer.parser
+        version = str(parser.get_schema_version())
+        graph = graph if graph is not None else ReferenceGraph.from_transformer(transformer)
+        with self._connect() as db:
+            db.execute('DELETE FROM schemas WHERE version = ?', (version,))
+            schema_id = db.execute('INSERT INTO schemas (version, namespace, exported) VALUES (?, ?, ?)',
+                                   (version, parser.get_schema_namespace(version),
+                                    datetime.datetime.now().isoformat(timespec='seconds'))).lastrowid
+            db.executemany('INSERT INTO namespaces VALUES (?, ?, ?)',
+                           [(schema_id, prefix, uri) for prefix, uri in parser.get_namespaces().items()])
+            ids: Dict[str, int] = {}
+            count = 0
+
+            def insert(kind: str, prefix: str, name: str, type_name: Optional[str], description: Optional[str]):
+                nonlocal count
+                count += 1
+                item_id = db.execute('INSERT INTO items (schema_id, kind, prefix, name, type, description) '
+                                     'VALUES (?, ?, ?, ?, ?, ?)',
+                                     (schema_id, kind, prefix, name, type_name, description)).lastrowid
+                ids.setdefault(f'{prefix}:{name}', item_id)
+                return item_id
+
+            children, attributes, values = [], [], []
+            for ocx in transformer.get_ocx_elements():
+                item_id = insert('pages', ocx.get_prefix(), ocx.get_name(), None, ocx.get_annotation())
+                children += [(item_id, c.name, c.prefix, c.type, _split(c.type or '')[1], c.use, c.cardinality,
+                              int(bool(c.is_choice)), c.description) for c in ocx.get_children()]
+                attributes += [(item_id, a.name, a.prefix, a.type, _split(a.type or '')[1], a.use, a.default,
+                                a.fixed, a.description) for a in ocx.get_attributes()]
+            for enum in transformer.get_enumerators().values():
+                item_id = insert('enums', enum.prefix, enum.name, None, None)
+                values += [(item_id, position, value, description) for position, (value, description)
+                           in enumerate(zip(enum.values, enum.descriptions, strict=True))]
+            for kind, items in (('attributes', transformer.get_global_attributes()),
+                                ('simple_types', transformer.get_simple_types())):
+                for attribute in items:
+                    insert(kind, attribute.prefix, attribute.name, attribute.type, attribute.description)
+            db.executemany('INSERT INTO children VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', children)
+            db.executemany('INSERT INTO attributes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', attributes)
+            db.executemany('INSERT INTO enum_values VALUES (?, ?, ?, ?)', values)
+            db.executemany('INSERT OR IGNORE INTO refs VALUES (?, ?)',
+                           [(ids[name], ids[target]) for name in ids for target in graph.uses(name) if target in ids])
+        logger.debug(f'Exported {count} items of schema version {version} to {self._path}')
+        return count
+
+    def versions(self) -> List[Dict]:
+        """The stored schema versions with their namespace, number of items and export date."""
+        return self._rows('SELECT s.version, s.namespace, COUNT(i.id) AS items, s.exported FROM schemas s '
+                          'LEFT JOIN items i ON i.schema_id = s.id GROUP BY s.id ORDER BY s.version')
+
+    def find(self, name: str, version: Optional[str] = None, kind: Optional[str] = None,
+             exact: bool = False) -> List[Dict]:
+        """The schema items with a name matching ``name``, case-insensitive.
+
+        Arguments:
+            name: The item name, optionally with its prefix
+            version: The schema version, default all stored versions
+            kind: The item kind, one of ``pages``, ``enums``, ``attributes`` or ``simple_types``
+            exact: Match the whole name, otherwise any name containing ``name``
+
+        Returns:
+            The matching items
+        """
+        prefix, local = _split(name)
+        sql = f'SELECT {_ITEM} FROM items i JOIN schemas s ON s.id = i.schema_id WHERE '
+        if exact:
+            sql += 'i.name = ?'
+            parameters = [local]
+        else:
+            sql += "i.name LIKE ? ESCAPE '\\'"
+            parameters = ['%' + local.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%']
+        sql, parameters = self._filter(sql, parameters, prefix, version, kind)
+        return self._rows(sql + ' ORDER BY s.version, i.name, i.kind', parameters)
+
+    def typed(self, type_name: str, version: Optional[str] = None) -> List[Dict]:
+        """The children and attributes of the schema elements declared with the type ``type_name``.
+
+        Arguments:
+            type_name: The type name, optionally with its prefix
+            version: The schema version, default all stored versions
+
+        Returns:
+            The declarations with the element declaring them
+        """
+        prefix, local = _split(type_name)
+        rows = []
+        for kind, table in (('child', 'children'), ('attribute', 'attributes')):
+            sql = (f"SELECT s.version, '{kind}' AS kind, i.prefix || ':' || i.name AS element, d.name, d.type, d.use "
+                   f'FROM {table} d JOIN items i ON i.id = d.item_id JOIN schemas s ON s.id = i.schema_id '
+                   f'WHERE d.type_name = ?')
+            parameters = [local]
+            if prefix is not None:
+                sql += " AND d.type LIKE ? ESCAPE '\\'"
+                parameters.append(prefix.replace('_', '\\_') + ':%')
+            if version is not None:
+                sql += ' AND s.version = ?'
+                parameters.append(version)
+            rows += self._rows(sql, parameters)
+        return sorted(rows, key=lambda row: (row['version'], row['element'], row['kind'], row['name']))
+
+    def used_by(self, name: str, version: Optional[str] = None) -> List[Dict]:
+        """The schema items referencing the item ``name``, see :class:`~ocxwiki.graph.ReferenceGraph`.
+
+        Arguments:
+            name: The item name, optionally with its prefix
+            version: The schema version, default all stored versions
+
+        Returns:
+            The referencing items
+        """
+        prefix, local = _split(name)
+        sql = (f'SELECT DISTINCT {_ITEM} FROM items t JOIN refs r ON r.target_id = t.id '
+               f'JOIN items i ON i.id = r.source_id JOIN schemas s ON s.id = i.schema_id WHERE t.name = ?')
+        parameters = [local]
+        if prefix is not None:
+            sql += ' AND t.prefix = ?'
+            parameters.append(prefix)
+        sql, parameters = self._filter(sql, parameters, None, version, None)
+        return self._rows(sql + ' ORDER BY s.version, i.name', parameters)
+
+    def children(self, name: str, version: Optional[str] = None) -> List[Dict]:
+        """The children of the schema element ``name``."""
+        prefix, local = _split(name)
+        sql = ("SELECT s.version, i.prefix || ':' || i.name AS element, c.name, c.type, c.use, c.cardinality "
+               'FROM children c JOIN items i ON i.id = c.item_id JOIN schemas s ON s.id = i.schema_id '
+               "WHERE i.name = ? AND i.kind = 'pages'")
+        sql, parameters = self._filter(sql, [local], prefix, version, None)
+        return self._rows(sql + ' ORDER BY s.version, c.name', parameters)
+
+    @staticmethod
+    def _filter(sql: str, parameters: List, prefix: Optional[str], version: Optional[str],
+                kind: Optional[str]) -> tuple:
+        """Restrict the items ``i`` of ``sql`` to the ``prefix``, schema ``version`` and ``kind`` given."""
+        for column, value in (('i.prefix', prefix), ('s.version', version), ('i.kind', kind)):
+            if value is not None:
+                sql += f' AND {column} = ?'
+                parameters.append(value)
+        return sql, parameters
+
+    def remove(self, version: str) -> bool:
+        """Remove the stored schema ``version``, True if it was stored."""
+        with self._connect() as db:
+            return db.execute('DELETE FROM schemas WHERE version = ?', (version,)).rowcount > 0
@@ -0,0 +1,159 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Compare two processed schemas by their hashed canonical forms."""
+
+# System imports
+from collections import defaultdict
+from dataclasses import astuple, dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+import hashlib
+
+# Module imports
+from ocx_schema_parser.transformer import Transformer
+from ocxwiki.graph import ReferenceGraph
+
+ADDED = 'added'
+MODIFIED = 'modified'
+REMOVED = 'removed'
+STATUSES = (ADDED, MODIFIED, REMOVED)
+KINDS = ('pages', 'enums', 'attributes', 'simple_types')  # The schema item kinds, as published by the WikiManager
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(repr(value).encode('utf-8')).hexdigest()
+
+
+@dataclass(frozen=True)
+class ItemForm:
+    """The hashed canonical form of a schema item.
+
+    Parameters:
+        digest: The hash of the item
+        parts: The hash of each part of the item (annotation, children, attributes, values or fields) in item order
+    """
+    digest: str
+    parts: Dict[str, str]
+
+    @classmethod
+    def from_parts(cls, parts: Iterable[Tuple[str, object]]) -> 'ItemForm':
+        """The form of an item made of the named ``parts``; repeated names are numbered."""
+        hashes = {}
+        for name, value in parts:
+            key, count = name, 1
+            while key in hashes:
+                count += 1
+                key = f'{name} #{count}'
+            hashes[key] = _digest(value)
+        return cls(_digest(tuple(hashes.items())), hashes)
+
+
+def canonical_forms(transformer: Transformer) -> Dict[Tuple[str, str], ItemForm]:
+    """The canonical forms of all items of a processed schema keyed by ``(kind, prefix:name)``.
+
+    The form of an element includes the items using it, as they are listed on its page.
+    """
+    graph = ReferenceGraph.from_transformer(transformer)
+    forms = {}
+    for ocx in transformer.get_ocx_elements():
+        name = f'{ocx.get_prefix()}:{ocx.get_name()}'
+        parts = [('annotation', ocx.get_annotation())]
+        parts += [(f'child {child.name}', astuple(child)) for child in ocx.get_children()]
+        parts += [(f'attribute {attribute.name}', astuple(attribute)) for attribute in ocx.get_attributes()]
+        parts.append(('used by', tuple(graph.used_by(name))))
+        forms[('pages', name)] = ItemForm.from_parts(parts)
+    for enum in transformer.get_enumerators().values():
+        parts = [(f'value {value}', description)
+                 for value, description in zip(enum.values, enum.descriptions, strict=True)]
+        forms[('enums', f'{enum.prefix}:{enum.name}')] = ItemForm.from_parts(parts)
+    for kind, attributes in (('attributes', transformer.get_global_attributes()),
+                             ('simple_types', transformer.get_simple_types())):
+        for attribute in attributes:
+            parts = [('type', attribute.type), ('restriction', attribute.restriction),
+                     ('description', attribute.description)]
+            forms[(kind, f'{attribute.prefix}:{attribute.name}')] = ItemForm.from_parts(parts)
+    return forms
+
+
+@dataclass
+class Change:
+    """A schema item added, modified or removed between two schema versions.
+
+    Parameters:
+        kind: The item kind, one of :data:`KINDS`
+        name: The item name ``prefix:name``
+        status: One of :data:`STATUSES`
+        details: The added, modified or removed parts of a modified item
+    """
+    kind: str
+    name: str
+    status: str
+    details: List[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """The key of the item in a publish journal, see ``WikiManager._item_key``."""
+        return f'{self.kind}:{self.name}'
+
+
+@dataclass
+class ChangeSet:
+    """The changes between two schema versions, ordered by status, kind and name.
+
+    Parameters:
+        from_version: The schema version compared from
+        to_version: The schema version compared to
+        changes: The changed items
+    """
+    from_version: str
+    to_version: str
+    changes: List[Change] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def with_status(self, *statuses: str) -> List[Change]:
+        """The changes with any of the ``statuses``."""
+        return [change for change in self.changes if change.status in statuses]
+
+    def keys(self, *statuses: str) -> Set[str]:
+        """The item keys of the changes with any of the ``statuses``, all changes if none are given."""
+        return {change.key for change in self.changes if not statuses or change.status in statuses}
+
+    def tbl_summary(self) -> Dict[str, List]:
+        """The number of changes per kind and status, as a table keyed by column."""
+        counts = defaultdict(int)
+        for change in self.changes:
+            counts[(change.kind, change.status)] += 1
+        table = defaultdict(list)
+        for kind in KINDS:
+            table['Kind'].append(kind)
+            for status in STATUSES:
+                table[status.capitalize()].append(counts[(kind, status)])
+        return table
+
+
+def diff_schemas(old: Transformer, new: Transformer) -> ChangeSet:
+    """The changes from the processed schema ``old`` to the processed schema ``new``.
+
+    Items are compared by the hash of their canonical form, the parts of modified items are compared to detail
+    the change.
+    """
+    old_forms = canonical_forms(old)
+    new_forms = canonical_forms(new)
+    changes = []
+    for key, form in new_forms.items():
+        previous = old_forms.get(key)
+        if previous is None:
+            changes.append(Change(*key, ADDED))
+        elif previous.digest != form.digest:
+            changes.append(Change(*key, MODIFIED, _details(previous, form)))
+    changes += [Change(*key, REMOVED) for key in old_forms.keys() - new_forms.keys()]
+    changes.sort(key=lambda c: (STATUSES.index(c.status), KINDS.index(c.kind), c.name))
+    return ChangeSet(str(old.parser.get_schema_version()), str(new.parser.get_schema_version()), changes)
+
+
+def _details(old: ItemForm, new: ItemForm) -> List[str]:
+    """The parts added, modified or removed from ``old`` to ``new``."""
+    details = [f'{part} {ADDED}' if part not in old.parts else f'{part} {MODIFIED}'
+               for part, digest in new.parts.items() if old.parts.get(part) != digest]
+    details += [f'{part} {REMOVED}' for part in old.parts if part not in new.parts]
+    return details or ['order modified']
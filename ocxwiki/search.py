@@ -0,0 +1,189 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Inverted full-text index over the schema item names, annotations, attribute names and enum values."""
+
+# System imports
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import math
+import re
+
+# Module imports
+from ocx_schema_parser.transformer import Transformer
+
+NAME_WEIGHT = 8.0  # The weight of the words of an item name
+MEMBER_WEIGHT = 3.0  # The weight of the child and attribute names and the enum values of an item
+TEXT_WEIGHT = 1.0  # The weight of the words of an annotation or description
+PREFIX_FACTOR = 0.7  # The score of a token starting with a search term relative to the term, times the length ratio
+FUZZY_FACTOR = 0.5  # The score of a similar token relative to the term itself, times the similarity
+MAX_EXPANSIONS = 100  # Tokens a search term is expanded to by prefix or similarity
+MIN_SIMILARITY = 0.4  # The trigram similarity of a misspelled term and a token
+
+_WORD = re.compile(r'[A-Za-z0-9]+')
+_CAMEL = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """The lower case words of ``text``, followed by their parts if they are camel case."""
+    tokens = []
+    for word in _WORD.findall(text or ''):
+        tokens.append(word.lower())
+        parts = _CAMEL.findall(word)
+        if len(parts) > 1:
+            tokens += [part.lower() for part in parts]
+    return tokens
+
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f'${token}$'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A schema item matching a search.
+
+    Parameters:
+        kind: The item kind, ``pages``, ``enums``, ``attributes`` or ``simple_types``
+        name: The item name ``prefix:name``
+        score: The relevance, higher is better
+        description: The annotation or description of the item
+    """
+    kind: str
+    name: str
+    score: float
+    description: str = ''
+
+
+class SearchIndex:
+    """An inverted index of the schema items, built once per transform.
+
+    Every token maps to the items containing it with a field weight, names weigh most, then the child and attribute
+    names and the enum values, then the words of the annotations. A search term matches the token itself, the tokens
+    it is a prefix of, found by bisecting the sorted tokens, and, if there are neither, the tokens sharing most of
+    its trigrams, so a misspelled term still finds the item. The scores are weighted by the inverse document
+    frequency of the tokens and summed over the terms, every term must match.
+    """
+
+    def __init__(self):
+        self._hits: List[SearchHit] = []
+        self._keys: Set[Tuple[str, str]] = set()
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._idf: Dict[str, float] = {}
+        self._tokens: List[str] = []
+        self._trigrams: Dict[str, List[str]] = defaultdict(list)
+
+    @classmethod
+    def from_transformer(cls, transformer: Transformer) -> 'SearchIndex':
+        """Build the index of the schema processed by ``transformer``."""
+        index = cls()
+        for ocx in transformer.get_ocx_elements():
+            members = [child.name for child in ocx.get_children()] + [a.name for a in ocx.get_attributes()]
+            index.add('pages', f'{ocx.get_prefix()}:{ocx.get_name()}', ocx.get_annotation(), members)
+        for enum in transformer.get_enumerators().values():
+            index.add('enums', f'{enum.prefix}:{enum.name}', ' '.join(d for d in enum.descriptions if d),
+                      [v for v in enum.values if v])
+        for kind, attributes in (('attributes', transformer.get_global_attributes()),
+                                 ('simple_types', transformer.get_simple_types())):
+            for attribute in attributes:
+                index.add(kind, f'{attribute.prefix}:{attribute.name}', attribute.description)
+        index.build()
+        return index
+
+    def add(self, kind: str, name: str, text: Optional[str] = None, members: Iterable[str] = ()):
+        """Add the schema item ``name`` of ``kind``, call :meth:`build` after adding all items.
+
+        Arguments:
+            kind: The item kind
+            name: The item name ``prefix:name``
+            text: The annotation or description of the item
+            members: The child and attribute names or the enum values of the item
+        """
+        if (kind, name) in self._keys:
+            return
+        self._keys.add((kind, name))
+        doc = len(self._hits)
+        self._hits.append(SearchHit(kind, name, 0.0, ' '.join((text or '').split())))
+        for weight, tokens in ((NAME_WEIGHT, tokenize(name.split(':', 1)[-1])),
+                               (MEMBER_WEIGHT, [t for member in members for t in tokenize(member)]),
+                               (TEXT_WEIGHT, tokenize(text))):
+            for token in tokens:
+                postings = self._postings[token]
+                postings[doc] = max(postings.get(doc, 0.0), weight)
+
+    def build(self):
+        """Derive the token order, the token frequencies and the trigrams of the added items."""
+        count = len(self._hits)
+        self._tokens = sorted(self._postings)
+        self._idf = {token: math.log(1 + count / len(docs)) for token, docs in self._postings.items()}
+        self._trigrams = defaultdict(list)
+        for token in self._tokens:
+            for trigram in _trigrams(token):
+                self._trigrams[trigram].append(token)
+
+    def __len__(self) -> int:
+        return len(self._hits)
+
+    def _expand(self, term: str) -> List[Tuple[str, float]]:
+        """The tokens matching the search ``term`` with their score factor."""
+        tokens = self._tokens
+        matches = []
+        start = bisect_left(tokens, term)
+        for token in tokens[start:start + MAX_EXPANSIONS]:
+            if not token.startswith(term):
+                break
+            matches.append((token, 1.0 if token == term else PREFIX_FACTOR * len(term) / len(token)))
+        if matches or len(term) < 3:
+            return matches
+        trigrams = _trigrams(term)
+        shared = defaultdict(int)
+        for trigram in trigrams:
+            for token in self._trigrams.get(trigram, ()):
+                shared[token] += 1
+        similar = [(count / (len(trigrams) + len(token) + 2 - count), token) for token, count in shared.items()]
+        similar = sorted((s, t) for s, t in similar if s >= MIN_SIMILARITY)[-MAX_EXPANSIONS:]
+        return [(token, FUZZY_FACTOR * similarity) for similarity, token in similar]
+
+    def search(self, query: str, limit: int = 20, kind: Optional[str] = None) -> List[SearchHit]:
+        """The schema items matching all words of ``query``, best first.
+
+        Arguments:
+            query: The search text
+            limit: The maximum number of hits
+            kind: Only return items of this kind
+
+        Returns:
+            The hits ordered by decreasing score and name
+        """
+        terms = [word.lower() for word in _WORD.findall(query)]
+        scores: Optional[Dict[int, float]] = None
+        for term in terms:
+            term_scores: Dict[int, float] = {}
+            for token, factor in self._expand(term):
+                idf = self._idf[token] * factor
+                for doc, weight in self._postings[token].items():
+                    score = weight * idf
+                    if score > term_scores.get(doc, 0.0):
+                        term_scores[doc] = score
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc: score + term_scores[doc] for doc, score in scores.items() if doc in term_scores}
+            if not scores:
+                return []
+        if not scores:
+            return []
+        typed = ''.join(terms)
+        hits = []
+        for doc, score in scores.items():
+            hit = self._hits[doc]
+            if kind is not None and hit.kind != kind:
+                continue
+            # Items named like the query come first, the shorter the name the better
+            name = hit.name.split(':', 1)[-1].lower()
+            if name.startswith(typed):
+                score *= 1 + 2 * len(typed) / len(name)
+            hits.append(SearchHit(hit.kind, hit.name, round(score, 3), hit.description))
+        hits.sort(key=lambda h: (-h.score, h.name, h.kind))
+        return hits[:limit]
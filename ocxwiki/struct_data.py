@@ -3,9 +3,9 @@
 """Manage structured data on wiki pages."""
 
 # System imports
-from typing import Dict, OrderedDict
+from typing import Dict, OrderedDict, Optional
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
 # Third party imports
 from loguru import logger
@@ -93,3 +93,61 @@ class WikiSchema(BaseDataClass):
     date: str = field(metadata={"header": "Date "})
     status: str = field(metadata={"header": "Statuss "}) # For some strange reason the last character disappear when rendered on the wiki
     wiki_version:str = field(metadata={"header": "Publisher version "})
+
+
+def struct_undated(content: str) -> str:
+    """Remove the publish date from the dataentry of *content*.
+
+    Every processing of a schema sets a new publish date, pages published from the same schema compare equal
+    without it.
+    """
+    date = next(item.metadata['header'] for item in fields(WikiSchema) if item.name == 'date').strip()
+    lines = []
+    found = False
+    for line in content.replace('\r\n', '\n').split('\n'):
+        if line.strip().startswith('---- dataentry'):
+            found = True
+        elif line == '----':
+            found = False
+        elif found and line.split(':')[0].strip() == date:
+            continue
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+@dataclass(frozen=True, slots=True)
+class DataEntryHeader:
+    """Immutable structured data header of the published pages of one schema type namespace.
+
+        The header is derived once per namespace from the ``WikiSchema`` with :meth:`from_schema` and can be shared
+        by pages rendered concurrently on several threads.
+
+        Parameters:
+            ocx_version: OCX Schema version
+            ocx_location: The uri of the schema location
+            namespace: The schema type namespace
+            author: Publishing author
+            date: Publish date
+            status: The schema status (draft or published)
+            wiki_version: The wiki CLI version
+
+    """
+    ocx_version: str
+    ocx_location: str
+    namespace: str
+    author: str
+    date: str
+    status: str
+    wiki_version: str
+
+    @classmethod
+    def from_schema(cls, schema: WikiSchema, namespace: Optional[str] = None) -> 'DataEntryHeader':
+        """The header of ``schema`` for pages in the schema type ``namespace``, default the schema namespace."""
+        values = {item.name: getattr(schema, item.name) for item in fields(WikiSchema)}
+        if namespace is not None:
+            values['namespace'] = namespace
+        return cls(**values)
+
+    def to_dict(self) -> Dict:
+        """Output the header as a dict with the ``WikiSchema`` field headers as keys."""
+        return {item.metadata["header"]: getattr(self, item.name) for item in fields(WikiSchema)}
@@ -66,3 +66,51 @@ class CommandProvider(Provider):
             self.app.add_output(result.stdout)
         if result.stderr:
             self.app.add_output(f"[red]Error:[/red] {result.stderr}")
+
+
+class SchemaSearchProvider(Provider):
+    """Provides the items of the processed schema matching the search text to the Textual command palette."""
+
+    MIN_QUERY = 2  # Characters typed before the schema is searched
+    MAX_HITS = 10
+
+    @property
+    def app(self) -> "CLIApp":
+        return super().app
+
+    async def search(self, query: str) -> Hits:
+        """Search the full-text index of the processed schema, the scores are relative to the best hit."""
+        from ocxwiki.wiki_cli import get_wiki_manager
+
+        wiki_manager = get_wiki_manager()
+        if wiki_manager.transformer is None or len(query.strip()) < self.MIN_QUERY:
+            return
+        hits = wiki_manager.search_index.search(query, self.MAX_HITS)
+        best = hits[0].score if hits else 1.0
+        for hit in hits:
+            yield Hit(
+                hit.score / best,
+                f"{hit.name} [dim]({hit.kind})[/dim]",
+                self._create_show_callback(hit.kind, hit.name),
+                help=hit.description[:120],
+            )
+
+    def _create_show_callback(self, kind: str, name: str) -> Callable[[], None]:
+        """Create a callback showing the schema item in the output log."""
+        if kind == "pages":
+            cmd_parts = ["schema", "element-table", "--name", name.split(":", 1)[-1]]
+        else:
+            cmd_parts = ["schema", "search", "--text", name, "--kind", kind, "--limit", "1"]
+
+        def callback() -> None:
+            self.app.run_worker(self._show(cmd_parts))
+
+        return callback
+
+    async def _show(self, cmd_parts: list[str]) -> None:
+        self.app.add_output(f"[bold cyan]>[/bold cyan] {' '.join(cmd_parts)}")
+        result = await dispatch_typer_command(cli, cmd_parts)
+        if result.stdout:
+            self.app.add_output(result.stdout)
+        if result.stderr:
+            self.app.add_output(f"[red]Error:[/red] {result.stderr}")
@@ -0,0 +1,193 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Watch a schema folder, reprocess the schema when it changes and republish the changed pages."""
+
+# System imports
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import asyncio
+import time
+
+# Third party imports
+from loguru import logger
+
+# Module imports
+from ocxwiki.error import OcxWikiError
+from ocxwiki.schema_cache import schema_files
+from ocxwiki.wiki_manager import PublishState, WikiManager
+
+DEFAULT_INTERVAL = 1.0  # Seconds between the scans of the schema folder
+DEFAULT_DEBOUNCE = 0.5  # Seconds the schema files must be unchanged before a change is processed
+
+
+@dataclass
+class WatchUpdate:
+    """The outcome of processing a change of the watched schema folder.
+
+    Parameters:
+        processed: True if the schema was processed
+        changed: The keys of the pages whose content changed
+        removed: The keys of the pages no longer in the schema, they are not deleted from the wiki
+        published: The number of pages written to the wiki
+        errors: The failed page writes
+        seconds: The seconds spent processing and publishing
+    """
+    processed: bool = False
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    published: int = 0
+    errors: List = field(default_factory=list)
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        """A one line summary of the update."""
+        if not self.processed:
+            return 'The changed schema could not be processed'
+        text = f'{len(self.changed)} pages changed, {self.published} published'
+        if self.removed:
+            text += f', {len(self.removed)} removed from the schema'
+        if self.errors:
+            text += f', {len(self.errors)} failed'
+        return f'{text} in {self.seconds:.2f} s'
+
+
+class SchemaWatcher:
+    """Reprocess the schema in ``folder`` whenever its XSD files change and republish the changed pages.
+
+    The folder is polled every ``interval`` seconds for the modification time and size of its XSD files. A change
+    is processed once the files have been unchanged for ``debounce`` seconds, so a burst of saves results in one
+    update. The schema is reprocessed incrementally by :meth:`WikiManager.process_schema_folder` and only the
+    pages whose rendered content changed are written to the draft namespace. The pages of the schema in the
+    folder when the watch starts are assumed to be published.
+
+    Args:
+        wiki_manager: The wiki manager processing and publishing the schema
+        folder: The schema folder
+        interval: Seconds between the scans of the folder
+        debounce: Seconds the schema files must be unchanged before a change is processed
+        publish: Write the changed pages to the wiki, otherwise only reprocess the schema
+        max_concurrent: Maximum number of concurrent page writes
+    """
+
+    def __init__(self, wiki_manager: WikiManager, folder: Union[Path, str], interval: float = DEFAULT_INTERVAL,
+                 debounce: float = DEFAULT_DEBOUNCE, publish: bool = True, max_concurrent: int = 10):
+        self._manager = wiki_manager
+        self._folder = Path(folder)
+        self._interval = interval
+        self._debounce = debounce
+        self._publish = publish
+        self._max_concurrent = max_concurrent
+        self._fingerprints: Dict[str, Tuple[str, object, str]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    @property
+    def folder(self) -> Path:
+        """Return the watched schema folder."""
+        return self._folder
+
+    @property
+    def running(self) -> bool:
+        """True while the folder is watched."""
+        return self._stop is not None and not self._stop.is_set()
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        """The modification time and size of the XSD files in the folder keyed by their path."""
+        files = {}
+        for file in schema_files(self._folder):
+            try:
+                stat = file.stat()
+            except OSError:  # Removed while scanning
+                continue
+            files[file.as_posix()] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def stop(self):
+        """Stop watching, from any thread."""
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+
+    async def run(self, on_update: Optional[Callable[[WatchUpdate], None]] = None):
+        """Watch the folder until :meth:`stop` is called.
+
+        Arguments:
+            on_update: Called with the outcome of every processed change
+
+        Raises:
+            OcxWikiError: If the pages are published but the wiki is not connected or not in the draft state
+        """
+        manager = self._manager
+        if self._publish:
+            if not manager.client.is_connected():
+                raise OcxWikiError('Not connected to the wiki. Call connect() first.')
+            if manager.get_publish_state() != PublishState.DRAFT:
+                raise OcxWikiError('Watch mode only publishes to the draft namespace.')
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        files = self.scan()
+        if not await asyncio.to_thread(manager.process_schema_folder, self._folder, incremental=True):
+            self._stop.set()
+            raise OcxWikiError(f'Cannot process the schema in {self._folder}')
+        self._fingerprints = manager.page_fingerprints()
+        logger.info(f'Watching {len(files)} schema files in {self._folder}')
+        try:
+            while not await self._wait(self._interval):
+                current = self.scan()
+                if current == files:
+                    continue
+                # Wait for a burst of saves to settle
+                while not await self._wait(self._debounce):
+                    latest = self.scan()
+                    if latest == current:
+                        break
+                    current = latest
+                else:
+                    break
+                files = current
+                update = await self.update()
+                logger.info(f'Schema changed: {update.summary()}')
+                if on_update is not None:
+                    on_update(update)
+        finally:
+            self._stop.set()
+            logger.info(f'Stopped watching {self._folder}')
+
+    async def _wait(self, seconds: float) -> bool:
+        """Sleep ``seconds``, True if the watch was stopped meanwhile."""
+        try:
+            await asyncio.wait_for(self._stop.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+        return self._stop.is_set()
+
+    async def update(self) -> WatchUpdate:
+        """Reprocess the schema and republish the pages whose content changed."""
+        manager = self._manager
+        start = time.monotonic()
+        update = WatchUpdate()
+        if not await asyncio.to_thread(manager.process_schema_folder, self._folder, incremental=True):
+            update.seconds = time.monotonic() - start
+            return update
+        update.processed = True
+        previous = self._fingerprints
+        current = manager.page_fingerprints()
+        items = [(key, kind, item) for key, (kind, item, digest) in current.items()
+                 if key not in previous or previous[key][2] != digest]
+        update.changed = [key for key, _, _ in items]
+        update.removed = sorted(previous.keys() - current.keys())
+        if self._publish and items:
+            results = await manager.publish_items_async([(kind, item) for _, kind, item in items],
+                                                        self._max_concurrent)
+            for (key, _, _), result in zip(items, results, strict=True):
+                if result is True:
+                    update.published += 1
+                else:
+                    update.errors.append(result)
+                    # Keep the previous fingerprint so the page is written again with the next change
+                    if key in previous:
+                        current[key] = previous[key]
+                    else:
+                        current.pop(key)
+        self._fingerprints = current
+        update.seconds = time.monotonic() - start
+        return update
@@ -14,8 +14,10 @@ from typing_extensions import Annotated
 
 # Module imports
 from ocxwiki import __app_name__, __version__, WIKI_URL, USER, PSWD
-from ocxwiki.wiki_manager import WikiManager, PublishState
+from ocxwiki.wiki_manager import WikiManager, PublishState, CHANGELOG_PAGE
 from ocxwiki.async_helper import run_async
+from ocxwiki.error import OcxWikiError
+from ocxwiki.schema_diff import STATUSES
 from tabulate import tabulate
 
 wiki = typer.Typer()
@@ -132,11 +134,63 @@ def publish_all(ctx: typer.Context):
     else:
         print('Process a schema first')
 
+def _print_publish_summary(ctx: typer.Context, results: dict):
+    """Print the result summary of an async publish and send it to the TUI if a summary callback was injected."""
+    summary_cb = (ctx.obj or {}).get('summary_callback')
+    summary_lines = [
+        f'\n[green]✓[/green] Publishing complete!',
+        f'  Pages published:       {results["pages"]}',
+        f'  Enums published:       {results["enums"]}',
+        f'  Attributes published:  {results["attributes"]}',
+        f'  Simple types published:{results["simple_types"]}',
+        f'  Total published:       {results.get("total", "?")}',
+        f'  Created / updated / unchanged: '
+        f'{results.get("created", 0)} / {results.get("updated", 0)} / {results.get("unchanged", 0)}',
+    ]
+    if 'concurrency' in results:
+        summary_lines.append(f'  Concurrent requests:   {results["concurrency"]}')
+    if results.get('retries'):
+        summary_lines.append(f'  Retried requests:      {results["retries"]} '
+                             f'({results.get("retry_wait", 0)} seconds waiting)')
+    if results.get('rate_limit_wait'):
+        summary_lines.append(f'  Delayed by rate limit: {results["rate_limit_wait"]} seconds')
+    if results.get('resumed'):
+        summary_lines.append(f'  Confirmed by the interrupted run: {results["resumed"]}')
+    if results['errors']:
+        summary_lines.append(f'\n[red]⚠[/red] Errors encountered: {len(results["errors"])}')
+        for i, error in enumerate(results['errors'][:5], 1):
+            summary_lines.append(f'  {i}. {error}')
+        if len(results['errors']) > 5:
+            summary_lines.append(f'  ... and {len(results["errors"]) - 5} more errors')
+        if results.get('journal'):
+            summary_lines.append('  Run [bold]wiki publish-resume[/bold] to retry the failed items.')
+
+    for line in summary_lines:
+        print(line)
+
+    # Send summary to TUI main window if a callback was provided
+    if callable(summary_cb):
+        try:
+            summary_cb('\n'.join(summary_lines))
+        except Exception:
+            pass
+
+
 @wiki.command()
 def publish_all_async(
         ctx: typer.Context,
         max_concurrent: Annotated[int, typer.Option(
-            help='Maximum number of concurrent publish operations')] = 10
+            help='Maximum number of concurrent publish operations')] = 10,
+        adaptive: Annotated[bool, typer.Option(
+            help='Start with max-concurrent operations and reduce them when the wiki slows down or fails')] = True,
+        min_concurrent: Annotated[int, typer.Option(
+            help='Minimum number of concurrent publish operations when adaptive')] = 1,
+        skip_unchanged: Annotated[bool, typer.Option(
+            help='Only write pages whose content differs from the wiki page')] = False,
+        manifest: Annotated[bool, typer.Option(
+            help='Decide what to write from the local publish manifest instead of listing the wiki')] = False,
+        journal: Annotated[bool, typer.Option(
+            help='Write a checkpoint journal so an interrupted run can be resumed with publish-resume')] = False,
 ):
     """Publish the complete schema to the ocxwiki using async operations for better performance."""
     wiki_manager = (ctx.obj or {}).get('wiki_manager') or get_wiki_manager()
@@ -159,7 +213,10 @@ def publish_all_async(
               f'{markup()}{version}{markup_end()}\nwith {markup()}{pages}{markup_end()} pages to namespace ' \
               f'{markup()}{namespace}{markup_end()} ' \
               f'to the ocxwiki with url {wikiurl}\n' \
-              f'Using async mode with max {markup()}{max_concurrent}{markup_end()} concurrent operations\n'
+              f'Using async mode with {"adaptive, " if adaptive else ""}max ' \
+              f'{markup()}{max_concurrent}{markup_end()} concurrent operations\n'
+        if wiki_manager.client.rate_limiter is not None:
+            msg += f'Rate limited to {markup()}{wiki_manager.client.rate_limiter.describe()}{markup_end()}\n'
         print(msg)
         prompt = wiki_confirm(ctx, 'OK to proceed?')
 
@@ -167,38 +224,88 @@ def publish_all_async(
             print('Publishing schema asynchronously...')
             # Extract optional TUI callbacks injected by dispatch_typer_command / app.py
             progress_cb = (ctx.obj or {}).get('progress_callback')
-            summary_cb = (ctx.obj or {}).get('summary_callback')
             results = run_async(wiki_manager.publish_complete_schema_async(max_concurrent,
-                                                                           progress_callback=progress_cb))
-
-            # Build summary lines
-            summary_lines = [
-                f'\n[green]✓[/green] Publishing complete!',
-                f'  Pages published:       {results["pages"]}',
-                f'  Enums published:       {results["enums"]}',
-                f'  Attributes published:  {results["attributes"]}',
-                f'  Simple types published:{results["simple_types"]}',
-                f'  Total published:       {results.get("total", "?")}',
-            ]
-            if results['errors']:
-                summary_lines.append(f'\n[red]⚠[/red] Errors encountered: {len(results["errors"])}')
-                for i, error in enumerate(results['errors'][:5], 1):
-                    summary_lines.append(f'  {i}. {error}')
-                if len(results['errors']) > 5:
-                    summary_lines.append(f'  ... and {len(results["errors"]) - 5} more errors')
-
-            for line in summary_lines:
-                print(line)
-
-            # Send summary to TUI main window if a callback was provided
-            if callable(summary_cb):
-                try:
-                    summary_cb('\n'.join(summary_lines))
-                except Exception:
-                    pass
+                                                                           progress_callback=progress_cb,
+                                                                           skip_unchanged=skip_unchanged,
+                                                                           use_manifest=manifest,
+                                                                           journal=journal,
+                                                                           adaptive=adaptive,
+                                                                           min_concurrent=min_concurrent))
+
+            _print_publish_summary(ctx, results)
     else:
         print('Process a schema first')
 
+@wiki.command()
+def publish_resume(
+        ctx: typer.Context,
+        max_concurrent: Annotated[int, typer.Option(
+            help='Maximum number of concurrent publish operations')] = 10,
+):
+    """Resume an interrupted publish-all-async run, skipping the items it already published."""
+    wiki_manager = (ctx.obj or {}).get('wiki_manager') or get_wiki_manager()
+    if not wiki_manager._client.is_connected():
+        print('[bold red]Error:[/bold red] Not connected to the wiki. Please run [bold]wiki connect[/bold] first.')
+        return
+    if wiki_manager.transformer is None:
+        print('Process a schema first')
+        return
+    print(f'Resuming the publishing to namespace {markup()}{wiki_manager.get_publish_namespace()}{markup_end()}...')
+    progress_cb = (ctx.obj or {}).get('progress_callback')
+    try:
+        results = run_async(wiki_manager.publish_complete_schema_async(max_concurrent,
+                                                                       progress_callback=progress_cb,
+                                                                       skip_unchanged=True,
+                                                                       resume=True,
+                                                                       adaptive=True))
+    except OcxWikiError as e:
+        print(f'[bold red]Error:[/bold red] {e}')
+        return
+    _print_publish_summary(ctx, results)
+
+
+@wiki.command()
+def publish_changes(
+        ctx: typer.Context,
+        from_: Annotated[str, typer.Option(
+            '--from',
+            help='The url or folder of the previously published schema.',
+            prompt=True,
+        )],
+        max_concurrent: Annotated[int, typer.Option(
+            help='Maximum number of concurrent publish operations')] = 10,
+        changelog: Annotated[bool, typer.Option(
+            help='Write the changelog page listing the changes')] = True,
+):
+    """Publish only the pages changed since a previous schema version and the changelog page."""
+    wiki_manager = _get_wiki_manager(ctx)
+    if not wiki_manager._client.is_connected():
+        print('[bold red]Error:[/bold red] Not connected to the wiki. Please run [bold]wiki connect[/bold] first.')
+        return
+    if wiki_manager.transformer is None:
+        print('Process a schema first')
+        return
+    try:
+        change_set = wiki_manager.diff_schema(from_)
+    except OcxWikiError as e:
+        print(f'[bold red]Error:[/bold red] {e}')
+        return
+    counts = {status: len(change_set.with_status(status)) for status in STATUSES}
+    print(f'Schema changes from {markup()}{change_set.from_version}{markup_end()} to '
+          f'{markup()}{change_set.to_version}{markup_end()}: {counts["added"]} added, {counts["modified"]} modified, '
+          f'{counts["removed"]} removed\n'
+          f'The added and modified pages will be published to namespace '
+          f'{markup()}{wiki_manager.get_publish_namespace()}{markup_end()}\n')
+    if not wiki_confirm(ctx, 'OK to proceed?'):
+        return
+    progress_cb = (ctx.obj or {}).get('progress_callback')
+    results = run_async(wiki_manager.publish_changes_async(change_set, max_concurrent,
+                                                           progress_callback=progress_cb, changelog=changelog))
+    _print_publish_summary(ctx, results)
+    if results['changelog']:
+        print(f'  Changelog page:        {wiki_manager.get_publish_namespace()}:{CHANGELOG_PAGE}')
+
+
 @wiki.command()
 def publish_state(
         ctx: typer.Context,
@@ -4,26 +4,45 @@
 # System imports
 from pathlib import Path
 from enum import Enum
-from typing import Dict, OrderedDict, List, Tuple, Union, Optional
+from typing import Callable, Dict, OrderedDict, List, Tuple, Union, Optional
 import re
+import hashlib
 from dataclasses import dataclass, field
+import dataclasses
 import asyncio
 
 # Third party imports
 from loguru import logger
+from dokuwiki import DokuWikiError
 import datetime
 from lxml.etree import QName
 
 # Module imports
-from ocx_schema_parser.xelement import LxmlElement
 from ocx_schema_parser.transformer import Transformer
 from ocx_schema_parser.elements import OcxGlobalElement
 from ocx_schema_parser.data_classes import OcxEnumerator, SchemaAttribute
 import ocxwiki
-from ocxwiki.client import WikiClient
+from ocxwiki import CACHE_FOLDER
+from ocxwiki.client import WikiClient, PageWrite, DEFAULT_POOL_SIZE, page_hash
 from ocxwiki.render import Render
-from ocxwiki.error import OcxWikiError
-from ocxwiki.struct_data import WikiSchema
+from ocxwiki.error import OcxWikiError, SchemaDownloadError
+from ocxwiki.struct_data import WikiSchema, DataEntryHeader
+from ocxwiki.manifest import PublishManifest, content_hash
+from ocxwiki.journal import PublishJournal
+from ocxwiki.pipeline import PublishPipeline, PublishOutcome
+from ocxwiki.concurrency import AdaptiveLimiter
+from ocxwiki.links import LinkIndex
+from ocxwiki.graph import ReferenceGraph
+from ocxwiki.schema_db import SchemaDatabase
+from ocxwiki.render.cache import RenderCache
+from ocxwiki.render.page_model import PageModel
+from ocxwiki.search import SearchIndex
+from ocxwiki.schema_cache import SchemaCache, SchemaSnapshot, schema_digest
+from ocxwiki.downloader import SchemaDownloader
+from ocxwiki.incremental import IncrementalTransformer, SchemaState
+from ocxwiki.schema_diff import ChangeSet, ADDED, MODIFIED, diff_schemas
+
+CHANGELOG_PAGE = 'changelog'  # The page listing the schema changes in the publish namespace
 
 class PublishState(Enum):
     DRAFT = 0
@@ -31,37 +50,89 @@ class PublishState(Enum):
 
 class WikiManager:
 
-    def __init__(self, wiki_url,  schema_url:str = None):
+    def __init__(self, wiki_url,  schema_url:str = None, pool_size: int = DEFAULT_POOL_SIZE,
+                 cache_folder: Union[Path, str] = CACHE_FOLDER, schema_cache: Optional[SchemaCache] = None,
+                 downloader: Optional[SchemaDownloader] = None, schema_db: Optional[SchemaDatabase] = None,
+                 render_cache: Optional[RenderCache] = None):
         """Manage updates of ocxwiki pages.
         Arguments:
             wiki_url: ocxwiki url
             schema_url: The url of the OCX schema
+            pool_size: The number of concurrent wiki sessions held by the client
+            cache_folder: The folder holding the publish manifests
+            schema_cache: The cache of processed schemas, default a cache under ``SCHEMA_FOLDER``
+            downloader: The schema downloader, default storing the schema files under ``SCHEMA_FOLDER``
+            schema_db: The database of exported schemas, default a database under ``SCHEMA_FOLDER``
+            render_cache: The cache of rendered pages, default a cache in memory
 
         Parameters:
             self.client: The wiki client
             self.reader: The schema reader
             self._schema: The url to the OCX schema
             self._draft: Whether the schema is in draft or published mode. Default is draft mode (True)
+            self._links: The link targets of the schema globals and the XML schema builtins
+            self._graph: The references between the schema items
+            self._search_index: The full-text index of the schema items
+            self._models: The page models of the schema items keyed by the item key, extracted once per transform
+            self._exported: Whether the processed schema has been exported to the schema database
+            self._schema_state: The content hashes and element dependencies of the processed schema
             self._ocx_elements: List of schema global elements
             self._xs_types: dict of XML schema builtins
             self._wiki_user: Wiki login username
 
         """
-        self._client: WikiClient = WikiClient(url=wiki_url)
-        self._transformer: Union[Transformer, None] = None
+        self._client: WikiClient = WikiClient(url=wiki_url, pool_size=pool_size)
+        self._transformer: Union[Transformer, SchemaSnapshot, None] = None
+        self._schema_cache = schema_cache if schema_cache is not None else SchemaCache()
+        self._downloader = downloader if downloader is not None else SchemaDownloader()
+        self._schema_db = schema_db if schema_db is not None else SchemaDatabase()
+        self._render_cache = render_cache if render_cache is not None else RenderCache()
         self._schema_url = schema_url
         self._state:PublishState  = PublishState.DRAFT
         self._publish_ns = {PublishState.PUBLIC: 'public:schema:', PublishState.DRAFT: 'ocx-if:draft-schema'}
         self._wiki_schema: Union[WikiSchema, None] = None
+        self._headers: Dict[Optional[str], DataEntryHeader] = {}  # Page headers per schema type namespace
+        self._links = LinkIndex()
+        self._graph = ReferenceGraph([], [])
+        self._search_index = SearchIndex()
+        self._models: Dict[str, PageModel] = {}
+        self._exported = False
+        self._schema_state: Optional[SchemaState] = None
         self._ocx_elements: List[Tuple] = []
         self._xs_types:Dict = {}
         self._wiki_user: str = "Unknown"  # Default user, will be set when connecting to wiki
+        self._cache_folder = Path(cache_folder)
 
     @property
-    def transformer(self) -> Union[Transformer, None]:
-        """Return the schema transformer."""
+    def transformer(self) -> Union[Transformer, SchemaSnapshot, None]:
+        """Return the schema transformer, or the processed schema restored from the schema cache."""
         return self._transformer
 
+    @property
+    def graph(self) -> ReferenceGraph:
+        """Return the references between the items of the processed schema."""
+        return self._graph
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Return the full-text index of the items of the processed schema."""
+        return self._search_index
+
+    @property
+    def schema_cache(self) -> SchemaCache:
+        """Return the cache of processed schemas."""
+        return self._schema_cache
+
+    @property
+    def schema_db(self) -> SchemaDatabase:
+        """Return the database of exported schemas."""
+        return self._schema_db
+
+    @property
+    def render_cache(self) -> RenderCache:
+        """Return the cache of rendered pages."""
+        return self._render_cache
+
     @property
     def client(self) -> WikiClient:
         """Return the wiki client."""
@@ -72,40 +143,69 @@ class WikiManager:
         return self._schema_url
 
 
-    def process_schema(self, url: str, download_folder: Path) -> bool:
+    def process_schema(self, url: str, download_folder: Path, use_cache: bool = True, incremental: bool = False) -> bool:
         """Process the schema given by the url.
+
+        The schema and its imports are revalidated against the stored copies and only changed files are
+        transferred. The processed schema is restored from the schema cache if the schema files are unchanged.
+
         Arguments:
             url: Schema url
+            download_folder: The schema download folder
+            use_cache: Use and update the schema cache
+            incremental: Reuse the unaffected elements of the previously processed schema from ``url``
 
         """
-        # Create a fresh schema transformer
-        if self._transformer is not None:
-            del self._transformer
-        self._transformer = Transformer()
         logger.debug(f'Processing schema from url: {url} with download folder: {download_folder}')
-        result =  self.transformer.transform_schema_from_url(url,download_folder)
-        if result:
-            self.transform()
-            if self.transformer:
-                logger.debug(f'Transformed schema version: {self.transformer.parser.get_schema_version()}')
-            else:
-                logger.debug('No transformer available after processing schema.')
-        return result
-
-    def process_schema_folder(self, folder: Path)->bool:
+        try:
+            self._downloader.download(url, download_folder)
+        except SchemaDownloadError as e:
+            logger.error(e)
+            return False
+        return self._process_folder(download_folder, url, use_cache, incremental)
+
+    def process_schema_folder(self, folder: Path, use_cache: bool = True, incremental: bool = False)->bool:
         """Process the schema in the ```folder```.
+
+        The processed schema is restored from the schema cache if the XSD files are unchanged. Otherwise, in
+        incremental mode, only the global elements affected by the changed schema definitions are transformed again
+        and the other elements are reused from the previously processed schema of the same folder, or else from the
+        most recently used schema of the folder in the schema cache.
+
         Arguments:
             folder: The folder containing the schema
+            use_cache: Use and update the schema cache
+            incremental: Reuse the unaffected elements of the previously processed schema in ``folder``
 
         """
+        return self._process_folder(folder, Path(folder).resolve().as_posix(), use_cache, incremental)
+
+    def _process_folder(self, folder: Path, source: str, use_cache: bool, incremental: bool) -> bool:
+        """Process the schema from ``source`` in the ``folder``, see :meth:`process_schema_folder`."""
+        digest = schema_digest(folder) if use_cache else None
+        if digest is not None and self._restore_schema(digest, source):
+            return True
+        if incremental and not IncrementalTransformer.supports_parser():
+            logger.warning('Incremental processing is not supported by the installed ocx-schema-parser, '
+                           'processing the complete schema')
+            incremental = False
+        previous = self._previous_schema(source, use_cache) if incremental else None
         # Create a fresh schema transformer
         if self.transformer is not None:
             del self._transformer
-        self._transformer = Transformer()
+        self._schema_state = None
+        self._transformer = Transformer() if previous is None else IncrementalTransformer(*previous, source)
         logger.debug(f'Processing schema from url: {folder}')
         result =  self.transformer.transform_schema_from_folder(folder)
         if result:
+             if previous is not None:
+                 self._schema_state = self.transformer.state
+             elif incremental:
+                 self._schema_state = SchemaState.from_transformer(folder, self.transformer)
+                 self._schema_state.source = source
              self.transform()
+             if digest is not None:
+                 self._cache_schema(digest)
              if self.transformer:
                 logger.debug(f'Transformed schema version: {self.transformer.parser.get_schema_version()}')
         return result
@@ -117,99 +217,211 @@ class WikiManager:
         Args:
             self:
         """
-        # Build the known schema names providing the basis for the wiki page linking
-        # w3c builtins
-        namespaces = self.transformer.parser.get_namespaces()
-        builtins = self.transformer.parser.get_xs_types()
-        for key in builtins:
-            qns = QName(key).namespace
-            qname = QName(key).localname
-            link = builtins[key]
-            prefix = self.transformer.parser.get_prefix_from_namespace(qns)
-            self._xs_types[f'{prefix}:{qname}'] = link
-            # xsd and xs types are complementary
-            if prefix == 'xs':
-                self._xs_types[f'xsd:{qname}'] = link
-            elif prefix == 'xsd':
-                self ._xs_types[f'xs:{qname}'] = link
+        # Build the known schema names providing the basis for the wiki page linking.
+        # The index is rebuilt from scratch and the schema objects are not modified, links are applied when rendering
+        self._links = LinkIndex.from_transformer(self.transformer)
+        self._update_schema_info()
+
+    def _update_schema_info(self):
+        """Derive the link tables and the wiki structured data of the processed schema."""
+        self._ocx_elements = self._links.globals
+        self._xs_types = self._links.builtins
+        self._graph = ReferenceGraph.from_transformer(self.transformer)
+        self._search_index = SearchIndex.from_transformer(self.transformer)
+        self._models = {}
+        self._exported = False
         version = self.transformer.parser.get_schema_version()
         author = self._wiki_user
         date = datetime.datetime.now().strftime("%b %d %Y %H:%M:%S")
         target_namespace = self.transformer.parser.get_schema_namespace(version)
-        publish_ns = self.get_publish_namespace()
         parser_version = ocxwiki.__version__
         self._wiki_schema = WikiSchema(author=author, namespace=target_namespace, ocx_location=target_namespace,
                                        ocx_version=version,
                                        date=date, status=str(self._state), wiki_version= parser_version)
-        # The known schema types
-        for ocx in self.transformer.parser.get_schema_element_types():
-            qn = LxmlElement.replace_ns_tag_with_ns_prefix(ocx, namespaces)
-            self._ocx_elements.append((LxmlElement.namespace_prefix(qn), LxmlElement.strip_namespace_prefix(qn)))
-        for ocx in self.transformer.parser.get_schema_attribute_types():
-            qn = LxmlElement.replace_ns_tag_with_ns_prefix(ocx, namespaces)
-            self._ocx_elements.append(((LxmlElement.namespace_prefix(qn), LxmlElement.strip_namespace_prefix(qn))))
-        for ocx in self.transformer.parser.get_schema_attribute_group_types():
-            qn = LxmlElement.replace_ns_tag_with_ns_prefix(ocx, namespaces)
-            self._ocx_elements.append(((LxmlElement.namespace_prefix(qn), LxmlElement.strip_namespace_prefix(qn))))
-        for ocx in self.transformer.parser.get_schema_simple_types():
-            qn = LxmlElement.replace_ns_tag_with_ns_prefix(ocx, namespaces)
-            self._ocx_elements.append(((LxmlElement.namespace_prefix(qn), LxmlElement.strip_namespace_prefix(qn))))
-        # Add enums to the global name list
-        for name, enum in self.transformer.get_enumerators().items():
-            name = enum.name
-            prefix = enum.prefix
-            self._ocx_elements.append((prefix, name))
-        # ToDo: fix missing link to id
-        self.apply_wiki_links(self._ocx_elements, self._xs_types, publish_ns)
-
-    def apply_wiki_links(self, global_elements: List, builtins: Dict, publish_ns: str)-> None:
-        """Apply wiki page links and external links.
+        self._headers = {}
 
-        Args:
-            global_elements: All OCX globals element names
-            builtins: W3C types
-            publish_ns: The wiki namespace
-
-        """
-
-        for ocx in self.transformer.get_ocx_elements():
-            # Apply wiki page links to OCX globals
-            for child in ocx.get_children():
-                name = child.name
-                prefix = child.prefix
-                type = child.type
-                child.name = Render.link_internal(prefix, name, publish_ns)
-                # Link to any builtins
-                if type and type in builtins:
-                    child.type = Render.link_external(type, builtins)
-                elif type:
-                    # Create internal wiki link for non-builtin types
-                    # Check if type corresponds to a known element
-                    type_parts = type.split(':') if ':' in type else [prefix, type]
-                    if len(type_parts) == 2:
-                        type_prefix, type_name = type_parts
-                        child.type = f'[[{publish_ns}:{type_prefix}:{type_name}]]'
-            # Apply links to attributes
-            for attribute in ocx.get_attributes():
-                name = attribute.name
-                prefix = attribute.prefix
-                type = attribute.type
-                # Internal page links
-                search = filter(lambda x: x[1]==name, global_elements)
-                for item in search:
-                    attribute.name = Render.link_internal(prefix, name, publish_ns)
-                # External links
-                if attribute.type and attribute.type in builtins:
-                    attribute.type = Render.link_external(type, builtins)
-                elif type:
-                    # Create internal wiki link for non-builtin types
-                    # Check if type corresponds to a known element
-                    type_parts = type.split(':') if ':' in type else [prefix, type]
-                    if len(type_parts) == 2:
-                        type_prefix, type_name = type_parts
-                        attribute.type = f'[[{publish_ns}:{type_prefix}:{type_name}]]'
-
-        return
+    def _restore_schema(self, digest: str, source: str) -> bool:
+        """Restore the processed schema with ``digest`` from the schema cache as the schema from ``source``.
+
+        Returns:
+            True if the schema was cached
+        """
+        snapshot = self._schema_cache.load(digest)
+        if snapshot is None:
+            return False
+        self._transformer = snapshot
+        self._links = snapshot.links
+        self._schema_state = dataclasses.replace(snapshot.state, source=source) if snapshot.state is not None \
+            else None
+        self._update_schema_info()
+        logger.debug(f'Restored schema version {snapshot.parser.get_schema_version()} from the schema cache')
+        return True
+
+    def _previous_schema(self, source: str, use_cache: bool) -> Optional[Tuple[List, SchemaState]]:
+        """The global elements and the state of the schema to process a changed schema from ``source``
+        incrementally from.
+
+        Returns:
+            The processed schema if it is from ``source``, else the most recently used schema from ``source`` in the
+            schema cache, None if there is neither
+        """
+        state = self._schema_state
+        if self.transformer is not None and state is not None and state.source == source:
+            return self.transformer.get_ocx_elements(), state
+        snapshot = self._schema_cache.latest(source) if use_cache else None
+        if snapshot is not None and snapshot.state is not None:
+            return snapshot.get_ocx_elements(), snapshot.state
+        return None
+
+    def _cache_schema(self, digest: str):
+        """Store the processed schema in the schema cache."""
+        try:
+            self._schema_cache.store(digest, SchemaSnapshot.from_transformer(self.transformer, self._links,
+                                                                             self._schema_state))
+        except Exception as e:
+            logger.warning(f'Cannot cache the processed schema: {e}')
+
+    def export_schema(self, force: bool = False) -> int:
+        """Export the processed schema to the schema database, replacing a stored schema of the same version.
+
+        Arguments:
+            force: Export the schema also if it was exported since it was processed
+
+        Returns:
+            The number of exported schema items, 0 if the schema was already exported
+        """
+        if self.transformer is None:
+            raise OcxWikiError('No schema url has been processed.')
+        if self._exported and not force:
+            return 0
+        count = self._schema_db.export(self.transformer, self._graph)
+        self._exported = True
+        return count
+
+    _KIND_LABELS = {'pages': 'Page', 'enums': 'Enum', 'attributes': 'Attribute', 'simple_types': 'SimpleType'}
+
+    def _page_write(self, kind: str, item, namespace: str) -> PageWrite:
+        """Render a schema item of ``kind`` to the page write publishing it in ``namespace``."""
+        cache = self._render_cache
+        if kind == 'pages':
+            page_name = f'{item.get_prefix()}:{item.get_name()}'
+            header = self._header(QName(item.get_tag()).namespace)
+            used_by = self._graph.used_by(page_name)
+            key = cache.key(kind, namespace, self._links.digest, page_name, item.get_annotation(),
+                            item.get_children(), item.get_attributes(), used_by)
+            # Links are resolved against the namespace the page is published to
+            content = self._render(key, header, lambda: Render.page(item, header, self._links, namespace, used_by))
+            summary = f'Publish schema version {header.ocx_version}' if header is not None else 'Publish schema'
+        elif kind == 'enums':
+            page_name = f'{item.prefix}:{item.name}'
+            header = self._header()
+            content = self._render(cache.key(kind, item), header, lambda: Render.enum(item, header))
+            summary = 'Bumped schema version'
+        else:
+            page_name = f'{item.prefix}:{item.name}'
+            header = self._header()
+            content = self._render(cache.key(kind, item), header, lambda: Render.attribute(item, header))
+            summary = 'Bumped schema version'
+        return PageWrite(page_name, content, summary, namespace, False)
+
+    def _render(self, key: str, header: Optional[DataEntryHeader], render: Callable[[], str]) -> str:
+        """The page with the render cache ``key``, calling ``render`` if the page body is not cached.
+
+        The structured data header holds the processing date, so only the page body in front of it is cached and
+        the current header is appended to a cached body.
+        """
+        data = Render.data_struct(header.to_dict()) if header is not None else ''
+        body = self._render_cache.get(key)
+        if body is not None:
+            return body + data
+        content = render()
+        if content.endswith(data):
+            self._render_cache.put(key, content[:len(content) - len(data)])
+        return content
+
+    def _header(self, namespace: Optional[str] = None) -> Optional[DataEntryHeader]:
+        """The structured data header of pages in the schema type ``namespace``, default the schema namespace.
+
+        Headers are immutable and derived once per namespace, so pages can be rendered concurrently.
+        None if no schema has been transformed.
+        """
+        if self._wiki_schema is None:
+            return None
+        headers = self._headers
+        header = headers.get(namespace)
+        if header is None:
+            header = headers[namespace] = DataEntryHeader.from_schema(self._wiki_schema, namespace)
+        return header
+
+    def schema_items(self) -> List[Tuple[str, object]]:
+        """The ``(kind, item)`` of every page of the processed schema, in publish order."""
+        transformer = self.transformer
+        items = [('pages', ocx) for ocx in transformer.get_ocx_elements()]
+        items += [('enums', enum) for enum in transformer.get_enumerators().values()]
+        items += [('attributes', attribute) for attribute in transformer.get_global_attributes()]
+        items += [('simple_types', simple_type) for simple_type in transformer.get_simple_types()]
+        return items
+
+    def page_model(self, kind: str, item) -> PageModel:
+        """The page model of the schema item of ``kind``, extracted once per transform and shared by the renderers."""
+        key = self._item_key(kind, item)
+        model = self._models.get(key)
+        if model is None:
+            if kind == 'pages':
+                model = PageModel.from_element(item, self._graph.used_by(f'{item.get_prefix()}:{item.get_name()}'))
+            elif kind == 'enums':
+                model = PageModel.from_enum(item)
+            else:
+                model = PageModel.from_attribute(item)
+            self._models[key] = model
+        return model
+
+    def page_fingerprints(self) -> Dict[str, Tuple[str, object, str]]:
+        """The ``(kind, item, hash)`` of every page of the processed schema keyed by the item key.
+
+        The hash covers what the page is rendered from, with the links resolved against the publish namespace, but
+        not the structured data header, which changes with every processing. Pages with equal hashes differ at most
+        in the publish date. Hashing does not render the page tables, so it is cheap compared to rendering.
+        """
+        namespace = self.get_publish_namespace()
+        links = self._links
+        fingerprints = {}
+        for kind, item in self.schema_items():
+            if kind == 'pages':
+                model = self.page_model(kind, item)
+                source = (model.name, model.annotation, Render.children_table(model, links, namespace),
+                          Render.attributes_table(model, links, namespace), model.used_by)
+            else:
+                source = item
+            digest = hashlib.sha256(repr(source).encode('utf-8')).hexdigest()
+            fingerprints[self._item_key(kind, item)] = (kind, item, digest)
+        return fingerprints
+
+    def impacted_items(self, names: List[str], previous: Optional[ReferenceGraph] = None) -> List[Tuple[str, object]]:
+        """The ``(kind, item)`` of the pages to republish when the schema items ``names`` change.
+
+        Arguments:
+            names: The ``prefix:name`` of the changed items
+            previous: The reference graph of the schema before the change, see :meth:`ReferenceGraph.impacted`
+
+        Returns:
+            The impacted items in publish order
+        """
+        impacted = self._graph.impacted(names, previous)
+        return [(kind, item) for kind, item in self.schema_items()
+                if self._item_key(kind, item).split(':', 1)[1] in impacted]
+
+    @staticmethod
+    def _item_name(kind: str, item) -> str:
+        """The name of a schema item of ``kind``."""
+        return item.get_name() if kind == 'pages' else item.name
+
+    @staticmethod
+    def _item_key(kind: str, item) -> str:
+        """The key identifying a schema item of ``kind`` in a publish journal."""
+        if kind == 'pages':
+            return f'{kind}:{item.get_prefix()}:{item.get_name()}'
+        return f'{kind}:{item.prefix}:{item.name}'
 
     def publish_page(self, ocx: OcxGlobalElement) -> bool:
         """Publish a dokuwiki page with ``name`` to the ocxwiki. This will create a new version of the page in the
@@ -223,16 +435,8 @@ class WikiManager:
         """
         if self.transformer is None:
             raise OcxWikiError('No schema url has been processed.')
-        wiki_namespace = self.get_publish_namespace()
-        page_name = f'{ocx.get_prefix()}:{ocx.get_name()}'
-        ocx_namespace = QName(ocx.get_tag()).namespace
-        self._wiki_schema.namespace = ocx_namespace
-        content = Render.page(ocx, self._wiki_schema, self._ocx_elements, self._xs_types)
-        # add internal and external links
-        #content = Render.links(content, self._ocx_elements, self._xs_types, namespace)
-        summary = f'Publish schema version {self._wiki_schema.ocx_version}'
-        result = self.client.set_page(page_name, content, summary, wiki_namespace, False)
-        return result
+        write = self._page_write('pages', ocx, self.get_publish_namespace())
+        return self.client.set_page(*write)
 
     async def publish_page_async(self, ocx: OcxGlobalElement) -> bool:
         """Async version of publish_page. Publish a dokuwiki page with ``name`` to the ocxwiki.
@@ -245,15 +449,8 @@ class WikiManager:
         """
         if self.transformer is None:
             raise OcxWikiError('No schema url has been processed.')
-        wiki_namespace = self.get_publish_namespace()
-        page_name = f'{ocx.get_prefix()}:{ocx.get_name()}'
-        ocx_namespace = QName(ocx.get_tag()).namespace
-        self._wiki_schema.namespace = ocx_namespace
-        content = Render.page(ocx, self._wiki_schema, self._ocx_elements, self._xs_types)
-        summary = f'Publish schema version {self._wiki_schema.ocx_version}'
-        result = await self.client.set_page_async(page_name, content, summary, wiki_namespace, False)
-        return result
-
+        write = self._page_write('pages', ocx, self.get_publish_namespace())
+        return await self.client.set_page_async(*write)
 
     def publish_enum(self, enum: OcxEnumerator) -> bool:
         """Publish a schema enum page with ``name`` to the ocxwiki. This will create a new version of the page in the
@@ -267,11 +464,8 @@ class WikiManager:
         """
         if self.transformer is None:
             raise OcxWikiError('No schema url has been processed.')
-        namespace = self.get_publish_namespace()
-        page_name = f'{enum.prefix}:{enum.name}'
-        content = Render.enum(enum, self._wiki_schema)
-        summary = 'Bumped schema version'
-        return self.client.set_page(page_name, content, summary, namespace, False)
+        write = self._page_write('enums', enum, self.get_publish_namespace())
+        return self.client.set_page(*write)
 
     async def publish_enum_async(self, enum: OcxEnumerator) -> bool:
         """Async version of publish_enum. Publish a schema enum page to the ocxwiki.
@@ -284,11 +478,8 @@ class WikiManager:
         """
         if self.transformer is None:
             raise OcxWikiError('No schema url has been processed.')
-        namespace = self.get_publish_namespace()
-        page_name = f'{enum.prefix}:{enum.name}'
-        content = Render.enum(enum, self._wiki_schema)
-        summary = 'Bumped schema version'
-        return await self.client.set_page_async(page_name, content, summary, namespace, False)
+        write = self._page_write('enums', enum, self.get_publish_namespace())
+        return await self.client.set_page_async(*write)
 
     def publish_simple_type(self, attribute: SchemaAttribute) -> bool:
         """Publish a schema simpleType page with ``name`` to the ocxwiki. This will create a new version of the page in the
@@ -302,13 +493,8 @@ class WikiManager:
         """
         if self.transformer is None:
             raise OcxWikiError('No schema url has been processed.')
-        namespace = self.get_publish_namespace()
-        page_name = f'{attribute.prefix}:{attribute.name}'
-        content = Render.attribute(attribute, self._wiki_schema)
-        # add internal and external links
-        #content = Render.links(content, self._ocx_elements, self._xs_types, namespace)
-        summary = 'Bumped schema version'
-        return self.client.set_page(page_name, content, summary, namespace, False)
+        write = self._page_write('simple_types', attribute, self.get_publish_namespace())
+        return self.client.set_page(*write)
 
     async def publish_simple_type_async(self, attribute: SchemaAttribute) -> bool:
         """Async version of publish_simple_type. Publish a schema simpleType page to the ocxwiki.
@@ -321,11 +507,8 @@ class WikiManager:
         """
         if self.transformer is None:
             raise OcxWikiError('No schema url has been processed.')
-        namespace = self.get_publish_namespace()
-        page_name = f'{attribute.prefix}:{attribute.name}'
-        content = Render.attribute(attribute, self._wiki_schema)
-        summary = 'Bumped schema version'
-        return await self.client.set_page_async(page_name, content, summary, namespace, False)
+        write = self._page_write('simple_types', attribute, self.get_publish_namespace())
+        return await self.client.set_page_async(*write)
 
     def publish_attribute(self, attribute: SchemaAttribute) -> bool:
         """Publish a schema global attribute page with ``name`` to the ocxwiki. This will create a new version of the page in the
@@ -339,12 +522,8 @@ class WikiManager:
         """
         if self.transformer is None:
             raise OcxWikiError('No schema url has been processed.')
-        namespace = self.get_publish_namespace()
-        page_name = f'{attribute.prefix}:{attribute.name}'
-        content = Render.attribute(attribute, self._wiki_schema)
-        summary = 'Bumped schema version'
-        result = self.client.set_page(page_name, content, summary, namespace, False)
-        return result
+        write = self._page_write('attributes', attribute, self.get_publish_namespace())
+        return self.client.set_page(*write)
 
     async def publish_attribute_async(self, attribute: SchemaAttribute) -> bool:
         """Async version of publish_attribute. Publish a schema global attribute page to the ocxwiki.
@@ -357,12 +536,8 @@ class WikiManager:
         """
         if self.transformer is None:
             raise OcxWikiError('No schema url has been processed.')
-        namespace = self.get_publish_namespace()
-        page_name = f'{attribute.prefix}:{attribute.name}'
-        content = Render.attribute(attribute, self._wiki_schema)
-        summary = 'Bumped schema version'
-        result = await self.client.set_page_async(page_name, content, summary, namespace, False)
-        return result
+        write = self._page_write('attributes', attribute, self.get_publish_namespace())
+        return await self.client.set_page_async(*write)
 
     def set_publish_state(self, state: PublishState = PublishState.DRAFT):
         """Set the publish state to DRAFT or PUBLIC.
@@ -372,7 +547,8 @@ class WikiManager:
             """
         self._state = state
         if self._wiki_schema is not None:
-            self._wiki_schema.status = str(state)
+            self._wiki_schema = dataclasses.replace(self._wiki_schema, status=str(state))
+            self._headers = {}
 
 
     def get_publish_state(self) -> PublishState:
@@ -395,6 +571,11 @@ class WikiManager:
         else:
             return self._publish_ns[self._state]
 
+    def publish_manifest(self) -> PublishManifest:
+        """Return the manifest of the pages published to the current publish namespace of the wiki."""
+        return PublishManifest.for_target(self._client.current_url(), self.get_publish_namespace(),
+                                          self._cache_folder)
+
     def get_wiki_data_struct(self) -> WikiSchema:
         """Return the current ``WikiSchema`` data."""
         return self._wiki_schema
@@ -525,29 +706,252 @@ class WikiManager:
         tasks = [publish_with_semaphore(st) for st in simple_types]
         return await asyncio.gather(*tasks, return_exceptions=True)
 
+    async def publish_items_async(self, items: List[Tuple[str, object]], max_concurrent: int = 10,
+                                  progress_callback: Optional[callable] = None) -> List:
+        """Publish the pages of schema items of any kind concurrently.
+
+        Arguments:
+            items: The ``(kind, item)`` of the pages to publish, see :meth:`schema_items`
+            max_concurrent: Maximum number of concurrent publish operations
+            progress_callback: Optional callable(advance, total, description) for progress updates
+
+        Returns:
+            List of results (True/False or the raised exception) for each item
+        """
+        publish = {'pages': self.publish_page_async, 'enums': self.publish_enum_async,
+                   'attributes': self.publish_attribute_async, 'simple_types': self.publish_simple_type_async}
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def publish_with_semaphore(kind: str, item):
+            async with semaphore:
+                result = await publish[kind](item)
+                if progress_callback is not None:
+                    try:
+                        progress_callback(1, None, f'{self._KIND_LABELS[kind]}: {self._item_name(kind, item)}')
+                    except Exception:
+                        pass
+                return result
+
+        tasks = [publish_with_semaphore(kind, item) for kind, item in items]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def load_schema(self, source: Union[Path, str], use_cache: bool = True) -> Union[Transformer, SchemaSnapshot]:
+        """Process the schema at an url or in a folder without replacing the processed schema.
+
+        Arguments:
+            source: The schema url, or the folder containing the schema
+            use_cache: Use and update the schema cache
+
+        Returns:
+            The processed schema
+
+        Raises:
+            OcxWikiError: If the schema cannot be processed
+        """
+        other = WikiManager(self._client.current_url(), schema_cache=self._schema_cache, downloader=self._downloader,
+                            cache_folder=self._cache_folder, schema_db=self._schema_db)
+        source = str(source)
+        if '://' in source:
+            # Each schema url has its own download folder, so comparing two versions does not mix their files
+            folder = self._cache_folder / 'schemas' / hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]
+            result = other.process_schema(source, folder, use_cache=use_cache)
+        else:
+            result = Path(source).is_dir() and other.process_schema_folder(Path(source), use_cache=use_cache)
+        if not result:
+            raise OcxWikiError(f'Cannot process the schema {source}')
+        return other.transformer
+
+    def diff_schema(self, from_source: Union[Path, str], to_source: Union[Path, str, None] = None,
+                    use_cache: bool = True) -> ChangeSet:
+        """Compare two schema versions.
+
+        Arguments:
+            from_source: The url or folder of the schema compared from
+            to_source: The url or folder of the schema compared to, default the processed schema
+            use_cache: Use and update the schema cache
+
+        Returns:
+            The changes from ``from_source`` to ``to_source``
+
+        Raises:
+            OcxWikiError: If a schema cannot be processed
+        """
+        if to_source is None and self.transformer is None:
+            raise OcxWikiError('No schema url has been processed.')
+        old = self.load_schema(from_source, use_cache)
+        new = self.load_schema(to_source, use_cache) if to_source is not None else self.transformer
+        return diff_schemas(old, new)
+
+    async def publish_changes_async(self, change_set: ChangeSet, max_concurrent: int = 10,
+                                    progress_callback: Optional[callable] = None,
+                                    changelog: bool = True) -> Dict[str, Union[int, bool, List]]:
+        """Publish only the pages of the items added or modified in ``change_set``.
+
+        The change set must compare to the processed schema, see :meth:`diff_schema`. The pages of removed items
+        are not deleted from the wiki, they are listed on the changelog page.
+
+        Arguments:
+            change_set: The changes to publish
+            max_concurrent: Maximum number of concurrent publish operations
+            progress_callback: Optional callable(advance, total, description) for progress updates
+            changelog: Write the changelog page :data:`CHANGELOG_PAGE` to the publish namespace
+
+        Returns:
+            Dictionary with the number of published pages of each kind, the ``errors`` and whether the
+            ``changelog`` was written
+        """
+        if self.transformer is None:
+            raise OcxWikiError('No schema url has been processed.')
+        keys = change_set.keys(ADDED, MODIFIED)
+        items = [(kind, item) for kind, item in self.schema_items() if self._item_key(kind, item) in keys]
+        if progress_callback is not None:
+            try:
+                progress_callback(0, len(items) + changelog, 'Starting…')
+            except Exception:
+                pass
+        results = {'pages': 0, 'enums': 0, 'attributes': 0, 'simple_types': 0, 'errors': [], 'changelog': False}
+        for (kind, item), result in zip(items, await self.publish_items_async(items, max_concurrent,
+                                                                                progress_callback), strict=True):
+            if result is True:
+                results[kind] += 1
+            elif isinstance(result, Exception):
+                results['errors'].append(result)
+            else:
+                results['errors'].append(f'Failed to publish {self._item_key(kind, item)}')
+        if changelog:
+            namespace = self.get_publish_namespace()
+            summary = f'Schema changes from {change_set.from_version} to {change_set.to_version}'
+            results['changelog'] = await self._client.set_page_async(
+                *PageWrite(CHANGELOG_PAGE, Render.changelog(change_set, namespace), summary, namespace))
+            if not results['changelog']:
+                results['errors'].append(f'Failed to publish the {CHANGELOG_PAGE} page')
+            if progress_callback is not None:
+                try:
+                    progress_callback(1, None, f'Page: {CHANGELOG_PAGE}')
+                except Exception:
+                    pass
+        results['total'] = len(items)
+        return results
+
+    async def _remote_page_hashes(self, namespace: str, manifest: Optional[PublishManifest],
+                                  skip_unchanged: bool) -> Dict[str, str]:
+        """The content hashes of the pages in the wiki ``namespace`` keyed by the lower case page id.
+
+        A non-empty ``manifest`` provides the hashes, invalidated by the wiki changes since its last sync.
+        Otherwise the namespace is listed and the listing is recorded in ``manifest``. Without ``skip_unchanged``
+        and ``manifest`` the wiki is not asked, and neither if the listing fails: every page is then written as
+        created.
+        """
+        if manifest is None and not skip_unchanged:
+            return {}
+        if manifest is not None and len(manifest) > 0:
+            try:
+                stale = manifest.apply_changes(await self._client.changes_async(manifest.last_sync))
+                # An empty hash never matches, so pages changed by others are rewritten as updated
+                return {**manifest.hashes(), **{page: '' for page in stale}}
+            except (DokuWikiError, OcxWikiError, OSError) as e:
+                logger.warning(f'Cannot validate the publish manifest, listing the namespace instead: {e}')
+                manifest.clear()
+        try:
+            pages = await self._client.list_pages_async(namespace, md5_hash=True) or []
+        except (DokuWikiError, OcxWikiError, OSError) as e:
+            logger.warning(f'Cannot list the namespace {namespace}, writing all pages: {e}')
+            return {}
+        if manifest is not None:
+            for page in pages:
+                manifest.record(page['id'], page.get('hash', ''), page.get('rev', 0))
+        return {page['id'].lower(): page.get('hash', '') for page in pages}
+
+    async def _update_manifest(self, manifest: PublishManifest, outcomes: List[Tuple[PageWrite, object]]):
+        """Record the content hash and revision of the written and unchanged pages of ``outcomes`` in ``manifest``
+        and save it.
+
+        The content hash leaves out the publish date, see :func:`~ocxwiki.manifest.content_hash`.
+        """
+        for write, result in outcomes:
+            entry = manifest.get(write.wiki_page)
+            if result is None and entry is not None:
+                manifest.record(write.wiki_page, content_hash(write.content), entry.rev)
+            elif result is not True and result is not None:
+                manifest.discard([write.wiki_page])
+        published = [write for write, result in outcomes
+                     if result is True or (result is None and write.wiki_page not in manifest)]
+        infos = await self._client.get_pages_info_async([write.wiki_page for write in published]) if published else []
+        for write, info in zip(published, infos, strict=True):
+            if isinstance(info, dict) and info.get('version'):
+                manifest.record(write.wiki_page, content_hash(write.content), info['version'])
+            else:
+                manifest.discard([write.wiki_page])
+        manifest.save()
+
     async def publish_complete_schema_async(self, max_concurrent: int = 10,
-                                           progress_callback: Optional[callable] = None) -> Dict[str, Union[int, List]]:
+                                           progress_callback: Optional[callable] = None,
+                                           skip_unchanged: bool = False,
+                                           use_manifest: bool = False,
+                                           render_workers: Optional[int] = None,
+                                           journal: bool = False,
+                                           resume: bool = False,
+                                           adaptive: bool = False,
+                                           min_concurrent: int = 1) -> Dict[str, Union[int, List]]:
         """Publish the complete schema asynchronously.
 
+        The publish namespace is listed with page hashes first. Each rendered page is hashed locally and
+        classified as created, updated or unchanged. With ``use_manifest`` the hashes come from the local
+        publish manifest instead and only the wiki changes since the last publish are requested.
+
         Arguments:
-            max_concurrent: Maximum number of concurrent publish operations
+            max_concurrent: The number of upload workers, i.e. the maximum number of concurrent
+                ``system.multicall`` requests. The ceiling of the adaptive limit if ``adaptive``.
             progress_callback: Optional callable(advance, total, description) called after each
                 published item. ``advance`` is always 1; ``total`` is set once at the start
                 with the grand total so the TUI can initialise the progress bar.
+            skip_unchanged: Do not write pages whose wiki content equals the rendered content apart from the
+                publish date. This avoids a new page revision for every unchanged page.
+            use_manifest: Use and update the local publish manifest, see :meth:`publish_manifest`
+            render_workers: The number of threads rendering pages, see :class:`~ocxwiki.pipeline.PublishPipeline`
+            journal: Write a checkpoint journal of the run, see :class:`~ocxwiki.journal.PublishJournal`
+            resume: Resume the interrupted latest run to the publish namespace, skipping the items its journal
+                confirmed. The resumed run appends to the same journal.
+            adaptive: Start with ``max_concurrent`` requests and adapt their number to the wiki latency and errors,
+                down to ``min_concurrent``, see :class:`~ocxwiki.concurrency.AdaptiveLimiter`
+            min_concurrent: The floor of the adaptive limit
 
         Returns:
-            Dictionary with counts of published items
+            Dictionary with counts of published items, the ``created``, ``updated`` and ``unchanged`` pages,
+            the ``resumed`` items confirmed by an earlier run, the ``concurrency`` the run ended with and the
+            ``retries`` of failed requests and seconds spent waiting for them (``retry_wait``) and the seconds
+            requests were delayed by the rate limit (``rate_limit_wait``). ``journal`` is True if the run wrote a
+            journal to resume from.
+
+        Raises:
+            OcxWikiError: If there is no interrupted run of the processed schema version to resume.
         """
         if self.transformer is None:
             raise OcxWikiError('No schema url has been processed.')
         if not self._client.is_connected():
             raise OcxWikiError('Not connected to the wiki. Call connect() first.')
+        namespace = self.get_publish_namespace()
+        version = str(self.transformer.parser.get_schema_version())
+        run = None
+        if resume:
+            run = PublishJournal.latest(self._client.current_url(), namespace, self._cache_folder)
+            if run is None or run.completed:
+                raise OcxWikiError(f'There is no interrupted publish run to {namespace} to resume.')
+            if run.schema_version != version:
+                raise OcxWikiError(f'The interrupted publish run is for schema version {run.schema_version}, '
+                                   f'not {version}.')
+        elif journal:
+            run = PublishJournal.start(self._client.current_url(), namespace, version, self._cache_folder)
 
         results = {
             'pages': 0,
             'enums': 0,
             'attributes': 0,
             'simple_types': 0,
+            'created': 0,
+            'updated': 0,
+            'unchanged': 0,
+            'resumed': 0,
             'errors': []
         }
 
@@ -565,26 +969,73 @@ class WikiManager:
             except Exception:
                 pass
 
-        # Publish all pages
-        page_results = await self.publish_all_pages_async(pages, max_concurrent, progress_callback)
-        results['pages'] = sum(1 for r in page_results if r is True)
-        results['errors'].extend([r for r in page_results if isinstance(r, Exception)])
-
-        # Publish all enums
-        enum_results = await self.publish_all_enums_async(enums, max_concurrent, progress_callback)
-        results['enums'] = sum(1 for r in enum_results if r is True)
-        results['errors'].extend([r for r in enum_results if isinstance(r, Exception)])
-
-        # Publish all attributes
-        attr_results = await self.publish_all_attributes_async(attributes, max_concurrent, progress_callback)
-        results['attributes'] = sum(1 for r in attr_results if r is True)
-        results['errors'].extend([r for r in attr_results if isinstance(r, Exception)])
-
-        # Publish all simple types
-        st_results = await self.publish_all_simple_types_async(simple_types, max_concurrent, progress_callback)
-        results['simple_types'] = sum(1 for r in st_results if r is True)
-        results['errors'].extend([r for r in st_results if isinstance(r, Exception)])
-
+        # Render the items of all kinds in a worker pool while the upload workers drain the rendered batches
+        items = self.schema_items()
+        manifest = self.publish_manifest() if use_manifest else None
+
+        rate_limiter = self._client.rate_limiter
+        rate_wait = rate_limiter.wait if rate_limiter is not None else 0.0
+        rate_info = f' (rate limit {rate_limiter.describe()})' if rate_limiter is not None else ''
+
+        def report(kind: str, item):
+            if progress_callback is not None:
+                try:
+                    progress_callback(1, None, f'{self._KIND_LABELS[kind]}: {self._item_name(kind, item)}{rate_info}')
+                except Exception:
+                    pass
+
+        if resume:
+            confirmed = run.confirmed()
+            remaining = []
+            for kind, item in items:
+                if self._item_key(kind, item) in confirmed:
+                    results['resumed'] += 1
+                    report(kind, item)
+                else:
+                    remaining.append((kind, item))
+            items = remaining
+
+        def item_done(index: int, outcome: PublishOutcome):
+            if outcome.result is True:
+                results[outcome.kind] += 1
+                results[outcome.status] += 1
+            elif outcome.result is None:
+                results['unchanged'] += 1
+            elif isinstance(outcome.result, Exception):
+                results['errors'].append(outcome.result)
+            kind, item = items[index]
+            if run is not None:
+                state = 'written' if outcome.result is True else 'unchanged' if outcome.result is None else 'failed'
+                run.record(self._item_key(kind, item), page_hash(outcome.write.content) if outcome.write else '',
+                           state)
+            report(kind, item)
+
+        retry_stats = self._client.retry_stats.snapshot()
+        limiter = AdaptiveLimiter(floor=min_concurrent, ceiling=max_concurrent, initial=max_concurrent) \
+            if adaptive else None
+        pipeline = PublishPipeline(self._client, lambda kind, item: self._page_write(kind, item, namespace),
+                                   max_uploads=max_concurrent, render_workers=render_workers, limiter=limiter)
+        try:
+            outcomes = await pipeline.run(items, self._remote_page_hashes(namespace, manifest, skip_unchanged),
+                                          skip_unchanged, done_callback=item_done)
+        finally:
+            if run is not None:
+                run.flush()
+        if run is not None and not results['errors'] and all(outcome.result is not False for outcome in outcomes):
+            run.complete()
+        if manifest is not None:
+            await self._update_manifest(manifest, [(outcome.write, outcome.result) for outcome in outcomes
+                                                   if outcome.write is not None])
+
+        results['concurrency'] = limiter.limit if limiter is not None else max_concurrent
+        retry_stats = self._client.retry_stats.since(retry_stats)
+        results['retries'] = retry_stats.retries
+        results['retry_wait'] = round(retry_stats.wait, 1)
+        results['rate_limit_wait'] = round(rate_limiter.wait - rate_wait, 1) if rate_limiter is not None else 0.0
+        if limiter is not None:
+            logger.info(f'Publishing converged on {limiter.limit} concurrent requests (peak {limiter.peak}, '
+                        f'{limiter.decreases} decreases)')
+        results['journal'] = run is not None
         results['total'] = grand_total
         return results
 
@@ -1,7 +1,18 @@
 #  Copyright (c) 2023-2026. OCX Consortium https://3docx.org. See the LICENSE
 """Pytest configuration and fixtures for ocxwiki tests."""
 
+import hashlib
+import shutil
+import socketserver
+import threading
+import time
+import xmlrpc.client
+from pathlib import Path
+from xmlrpc.server import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
+
+import ocx
 import pytest
+import xsdata
 from dokuwiki import DokuWikiError
 from ocxwiki import WIKI_URL, USER, PSWD
 from ocxwiki.client import WikiClient
@@ -71,3 +82,172 @@ def wiki_manager_fixture():
 
     # Teardown: You can add logout or cleanup here if needed
     # client.logout()  # if such method exists
+
+
+class FakeDokuWiki:
+    """In-memory stand-in for the DokuWiki XML-RPC API served over HTTP/1.1 keep-alive connections.
+
+    Attributes:
+        pages: page id -> dict(content, rev, author)
+        locked: page ids for which ``wiki.putPage`` faults
+        multicall: Set to False to answer ``system.multicall`` with "method does not exist"
+        connections: The client addresses seen, one per TCP connection
+        cookies: The ``Cookie`` header of every request
+        max_in_flight: The highest number of concurrently executing requests
+        delay: Seconds each ``wiki.putPage`` call sleeps, to observe concurrency
+    """
+
+    USER = 'tester'
+    PASSWORD = 'secret'
+
+    def __init__(self):
+        self.pages = {}
+        self.connections = set()
+        self.cookies = []
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0.0
+        self.multicall = True
+        self.locked = set()
+        self._clock = 1700000000
+        self._lock = threading.Lock()
+
+    def _tick(self) -> int:
+        with self._lock:
+            self._clock += 1
+            return self._clock
+
+    # XML-RPC methods
+    def login(self, user, password):
+        return user == self.USER and password == self.PASSWORD
+
+    def get_version(self):
+        return 'Release fake'
+
+    def get_xmlrpc_version(self):
+        return 14
+
+    def put_page(self, page, content, options):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if page.lower() in self.locked:
+                raise xmlrpc.client.Fault(423, f'The page {page} is currently locked')
+            self.pages[page.lower()] = {'content': content, 'rev': self._tick(), 'author': self.USER}
+            return True
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def append_page(self, page, content, options):
+        current = self.pages.get(page.lower(), {}).get('content', '')
+        return self.put_page(page, current + content, options)
+
+    def get_page(self, page):
+        return self.pages.get(page.lower(), {}).get('content', '')
+
+    def get_page_info(self, page):
+        if page.lower() not in self.pages:
+            raise xmlrpc.client.Fault(121, 'The requested page does not exist')
+        info = self.pages[page.lower()]
+        return {'name': page.lower(), 'version': info['rev'], 'author': info['author']}
+
+    def get_pagelist(self, namespace, options):
+        result = []
+        for page, info in sorted(self.pages.items()):
+            if page.startswith(f'{namespace.lower()}:'):
+                item = {'id': page, 'rev': info['rev'], 'mtime': info['rev'], 'size': len(info['content'])}
+                if options.get('hash'):
+                    item['hash'] = hashlib.md5(info['content'].encode('utf-8')).hexdigest()
+                result.append(item)
+        return result
+
+    def get_recent_changes(self, timestamp):
+        changes = [{'name': page, 'version': info['rev'], 'author': info['author']}
+                   for page, info in self.pages.items() if info['rev'] >= timestamp]
+        if not changes:
+            raise xmlrpc.client.Fault(321, 'There are no changes in the specified timeframe')
+        return changes
+
+    def edit(self, page, content, author='someone'):
+        """Simulate an edit made by another wiki user."""
+        self.pages[page.lower()] = {'content': content, 'rev': self._tick(), 'author': author}
+
+
+@pytest.fixture
+def fake_wiki():
+    """Serve a :class:`FakeDokuWiki` on a local port and yield ``(url, fake)``."""
+    fake = FakeDokuWiki()
+
+    class Handler(SimpleXMLRPCRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        rpc_paths = ('/lib/exe/xmlrpc.php',)
+
+        def do_POST(self):
+            fake.connections.add(self.client_address)
+            fake.cookies.append(self.headers.get('Cookie'))
+            super().do_POST()
+
+        def end_headers(self):
+            self.send_header('Set-Cookie', 'DokuWiki=fake-session; path=/')
+            super().end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    class Server(socketserver.ThreadingMixIn, SimpleXMLRPCServer):
+        daemon_threads = True
+
+    server = Server(('127.0.0.1', 0), requestHandler=Handler, allow_none=True, logRequests=False)
+    methods = {
+        'dokuwiki.login': fake.login,
+        'dokuwiki.getVersion': fake.get_version,
+        'dokuwiki.getXMLRPCAPIVersion': fake.get_xmlrpc_version,
+        'dokuwiki.getPagelist': fake.get_pagelist,
+        'dokuwiki.appendPage': fake.append_page,
+        'wiki.putPage': fake.put_page,
+        'wiki.getPage': fake.get_page,
+        'wiki.getPageInfo': fake.get_page_info,
+        'wiki.getRecentChanges': fake.get_recent_changes,
+    }
+    for name, method in methods.items():
+        server.register_function(_recording(fake, name, method), name)
+
+    def multicall(calls):
+        if not fake.multicall:
+            raise xmlrpc.client.Fault(-32601, 'server error. requested method system.multicall does not exist.')
+        fake.calls.append('system.multicall')
+        return server.system_multicall(calls)
+    server.register_function(multicall, 'system.multicall')
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/', fake
+    server.shutdown()
+    server.server_close()
+
+
+def _recording(fake: FakeDokuWiki, name: str, method):
+    def call(*args):
+        fake.calls.append(name)
+        return method(*args)
+    return call
+
+
+@pytest.fixture
+def ocx_schema_folder(tmp_path):
+    """A folder with the OCX 3.0.1 schema and its imports, processable without network access.
+
+    The imports are placed in a sub folder so the OCX schema declaring their namespace prefixes is parsed first.
+    """
+    schemas = Path(ocx.__file__).parent / 'ocx_301'
+    folder = tmp_path / 'schema'
+    imports = folder / 'imports'
+    imports.mkdir(parents=True)
+    shutil.copy(schemas / 'OCX_Schema.xsd', folder)
+    shutil.copy(schemas / 'unitsmlSchema_lite-0.9.18.xsd', imports)
+    shutil.copy(Path(xsdata.__file__).parent / 'schemas' / 'xml.xsd', imports)
+    return folder
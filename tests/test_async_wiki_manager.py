@@ -3,18 +3,23 @@
 
 import pytest
 import asyncio
+import time
+from dataclasses import FrozenInstanceError
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from pathlib import Path
 
+from dokuwiki import DokuWikiError
+
+from ocxwiki import CACHE_FOLDER
 from ocxwiki.wiki_manager import WikiManager, PublishState
-from ocxwiki.client import WikiClient
+from ocxwiki.client import WikiClient, PageWrite, MAX_BATCH_BYTES
 from ocxwiki.error import OcxWikiError
+from ocxwiki.retry import RetryStats
+from ocxwiki.schema_cache import SchemaCache
+from ocxwiki.struct_data import struct_gen, WikiSchema
 from ocx_schema_parser.data_classes import OcxEnumerator, SchemaAttribute
 from ocx_schema_parser.elements import OcxGlobalElement
 
-# Configure pytest-asyncio
-pytestmark = pytest.mark.asyncio
-
 
 @pytest.fixture
 def wiki_manager():
@@ -30,6 +35,10 @@ def mock_client():
     client.connect_async = AsyncMock(return_value=True)
     client.set_page_async = AsyncMock(return_value=True)
     client.append_page_async = AsyncMock(return_value=True)
+    client.set_pages_async = AsyncMock(side_effect=lambda writes, *args, **kwargs: [True] * len(writes))
+    client.max_batch_bytes = MAX_BATCH_BYTES
+    client.retry_stats = RetryStats()
+    client.rate_limiter = None
     return client
 
 
@@ -54,55 +63,183 @@ def mock_transformer():
 
 
 class TestWikiClientAsync:
-    """Test WikiClient async methods."""
+    """Test WikiClient async methods against a local DokuWiki stand-in."""
 
     @pytest.mark.asyncio
-    async def test_connect_async(self):
-        """Test async connect method."""
-        client = WikiClient(url="http://test.wiki")
+    async def test_connect_async(self, fake_wiki):
+        """Test async connect logs in and reads the wiki versions."""
+        url, fake = fake_wiki
+        client = WikiClient(url=url)
 
-        with patch.object(client, 'connect', return_value=True) as mock_connect:
-            result = await client.connect_async(user="testuser", password="testpass")
+        result = await client.connect_async(user=fake.USER, password=fake.PASSWORD)
 
-            assert result is True
-            mock_connect.assert_called_once_with(user="testuser", password="testpass")
+        assert result is True
+        assert client.is_connected()
+        assert client.wiki_version() == 'Release fake'
+        assert client.xmlrpc_version() == 14
 
     @pytest.mark.asyncio
-    async def test_set_page_async(self):
+    async def test_connect_async_invalid_login(self, fake_wiki):
+        """Test async connect raises on invalid credentials."""
+        url, fake = fake_wiki
+        client = WikiClient(url=url)
+
+        with pytest.raises(DokuWikiError):
+            await client.connect_async(user=fake.USER, password="wrong")
+        assert not client.is_connected()
+
+    @pytest.mark.asyncio
+    async def test_set_page_async(self, fake_wiki):
         """Test async set_page method."""
-        client = WikiClient(url="http://test.wiki")
+        url, fake = fake_wiki
+        client = WikiClient(url=url)
+        await client.connect_async(user=fake.USER, password=fake.PASSWORD)
 
-        with patch.object(client, 'set_page', return_value=True) as mock_set:
-            result = await client.set_page_async(
-                page="test_page",
-                content="test content",
-                summary="test summary",
-                namespace="test_ns"
-            )
+        result = await client.set_page_async(
+            page="test_page",
+            content="test content",
+            summary="test summary",
+            namespace="test_ns"
+        )
 
-            assert result is True
-            mock_set.assert_called_once_with(
-                page="test_page",
-                content="test content",
-                summary="test summary",
-                namespace="test_ns",
-                minor=False
-            )
+        assert result is True
+        assert await client.get_page_async("test_ns:test_page") == "test content"
+        # Every request after the login carries the session cookie
+        assert all(cookie and 'DokuWiki=fake-session' in cookie for cookie in fake.cookies[1:])
 
     @pytest.mark.asyncio
-    async def test_append_page_async(self):
+    async def test_set_page_async_not_connected(self, fake_wiki):
+        """Test async set_page refuses to write before connecting."""
+        url, fake = fake_wiki
+        client = WikiClient(url=url)
+
+        assert await client.set_page_async("test_page", "content", "summary") is False
+        assert fake.pages == {}
+
+    @pytest.mark.asyncio
+    async def test_append_page_async(self, fake_wiki):
         """Test async append_page method."""
-        client = WikiClient(url="http://test.wiki")
+        url, fake = fake_wiki
+        client = WikiClient(url=url)
+        await client.connect_async(user=fake.USER, password=fake.PASSWORD)
+        await client.set_page_async("test_page", "first", "summary")
 
-        with patch.object(client, 'append_page', return_value=True) as mock_append:
-            result = await client.append_page_async(
-                page="test_page",
-                content="test content",
-                summary="test summary"
-            )
+        result = await client.append_page_async(
+            page="test_page",
+            content=" second",
+            summary="test summary"
+        )
 
-            assert result is True
-            mock_append.assert_called_once()
+        assert result is True
+        assert fake.pages['ocx:test_page']['content'] == 'first second'
+
+    @pytest.mark.asyncio
+    async def test_missing_page_info_is_empty(self, fake_wiki):
+        """Test that DokuWiki's 'no such page' fault maps to an empty result."""
+        url, fake = fake_wiki
+        client = WikiClient(url=url)
+        await client.connect_async(user=fake.USER, password=fake.PASSWORD)
+
+        assert await client.get_page_info_async("ocx:missing") == {}
+
+    @pytest.mark.asyncio
+    async def test_set_page_async_uses_pool_concurrently(self, fake_wiki):
+        """Test that concurrent set_page_async calls run on separate keep-alive connections."""
+        url, fake = fake_wiki
+        client = WikiClient(url=url, pool_size=4)
+        await client.connect_async(user=fake.USER, password=fake.PASSWORD)
+        fake.delay = 0.05
+
+        results = await asyncio.gather(
+            *(client.set_page_async(f"page{i}", "content", "summary") for i in range(8))
+        )
+
+        assert all(results)
+        assert fake.max_in_flight == 4
+        assert len(fake.connections) == 4
+
+    @pytest.mark.asyncio
+    async def test_set_pages_async_uses_multicall(self, fake_wiki):
+        """Test that a bulk write costs one round trip per multicall batch."""
+        url, fake = fake_wiki
+        client = WikiClient(url=url)
+        await client.connect_async(user=fake.USER, password=fake.PASSWORD)
+        requests = client.transport.requests
+
+        writes = [PageWrite(f"page{i}", f"content {i}", "summary") for i in range(40)]
+        results = await client.set_pages_async(writes)
+
+        assert results == [True] * 40
+        assert client.transport.requests - requests == 1
+        assert fake.pages['ocx:page7']['content'] == 'content 7'
+
+    @pytest.mark.asyncio
+    async def test_set_pages_async_adapts_batch_to_payload(self, fake_wiki):
+        """Test that the batch size adapts to the payload bytes."""
+        url, fake = fake_wiki
+        client = WikiClient(url=url)
+        client.max_batch_bytes = 4096
+        await client.connect_async(user=fake.USER, password=fake.PASSWORD)
+        requests = client.transport.requests
+
+        writes = [PageWrite(f"page{i}", "x" * 1500, "summary") for i in range(10)]
+        done = []
+        results = await client.set_pages_async(writes, done_callback=lambda index, result: done.append(index))
+
+        assert results == [True] * 10
+        assert client.transport.requests - requests == 5
+        assert sorted(done) == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_set_pages_async_reports_faults_per_page(self, fake_wiki):
+        """Test that a fault only fails its own page write."""
+        url, fake = fake_wiki
+        fake.locked.add('ocx:page1')
+        client = WikiClient(url=url)
+        await client.connect_async(user=fake.USER, password=fake.PASSWORD)
+
+        results = await client.set_pages_async([PageWrite(f"page{i}", "content", "summary") for i in range(3)])
+
+        assert results[0] is True and results[2] is True
+        assert isinstance(results[1], DokuWikiError)
+        assert 'locked' in str(results[1])
+
+    @pytest.mark.asyncio
+    async def test_batch_falls_back_without_multicall(self, fake_wiki):
+        """Test that single calls are sent if the wiki lacks system.multicall."""
+        url, fake = fake_wiki
+        fake.multicall = False
+        client = WikiClient(url=url)
+        await client.connect_async(user=fake.USER, password=fake.PASSWORD)
+
+        results = await client.set_pages_async([PageWrite(f"page{i}", "content", "summary") for i in range(3)])
+
+        assert results == [True] * 3
+        assert fake.calls.count('wiki.putPage') == 3
+
+    @pytest.mark.asyncio
+    async def test_get_pages_and_info_async(self, fake_wiki):
+        """Test the batched page and page info reads."""
+        url, fake = fake_wiki
+        client = WikiClient(url=url)
+        await client.connect_async(user=fake.USER, password=fake.PASSWORD)
+        await client.set_pages_async([PageWrite("a", "A", "summary"), PageWrite("b", "B", "summary")])
+
+        assert await client.get_pages_async(["ocx:a", "ocx:b"]) == ["A", "B"]
+        info = await client.get_pages_info_async(["ocx:a", "ocx:missing"])
+        assert info[0]['name'] == 'ocx:a'
+        assert info[1] == {}
+
+    def test_sync_methods_wrap_async(self, fake_wiki):
+        """Test that the synchronous methods share the session of the async transport."""
+        url, fake = fake_wiki
+        client = WikiClient(url=url)
+
+        assert client.connect(user=fake.USER, password=fake.PASSWORD) is True
+        content = struct_gen('version', {'OCX Version': '3.1.0'})
+        assert client.set_page("test_page", content, "summary") is True
+        assert client.get_data("ocx:test_page")['OCX Version'] == '3.1.0'
+        assert [page['id'] for page in client.list_pages(namespace='ocx')] == ['ocx:test_page']
 
 
 class TestWikiManagerAsync:
@@ -347,8 +484,9 @@ class TestBatchPublishingAsync:
                 mock_enum_render.return_value = "enum content"
                 with patch('ocxwiki.wiki_manager.Render.attribute') as mock_attr_render:
                     mock_attr_render.return_value = "attribute content"
-                    with patch.object(wiki_manager, 'transform'):
-                        wiki_manager.process_schema_folder(Path('.'))
+                    with patch.object(wiki_manager, 'transform'), \
+                            patch('ocxwiki.wiki_manager.Transformer', return_value=mock_transformer):
+                        wiki_manager.process_schema_folder(Path('.'), use_cache=False)
 
                     results = await wiki_manager.publish_complete_schema_async(max_concurrent=3)
 
@@ -358,6 +496,231 @@ class TestBatchPublishingAsync:
                     assert results['simple_types'] == 2
                     assert len(results['errors']) == 0
 
+    @staticmethod
+    async def _enum_publisher(url, fake, mock_transformer, count=30, cache_folder=CACHE_FOLDER):
+        """A manager connected to the fake wiki publishing ``count`` enums."""
+        wiki_manager = WikiManager(wiki_url=url, cache_folder=cache_folder)
+        await wiki_manager.connect_async(fake.USER, fake.PASSWORD)
+        wiki_manager._transformer = mock_transformer
+        wiki_manager._wiki_schema = WikiSchema(ocx_version="3.0.0", ocx_location="", namespace="", author="",
+                                               date="", status="", wiki_version="")
+        mock_enums = {}
+        for i in range(count):
+            enum = Mock(spec=OcxEnumerator)
+            enum.prefix = "ocx"
+            enum.name = f"Enum{i}"
+            mock_enums[enum.name] = enum
+        mock_transformer.get_enumerators.return_value = mock_enums
+        return wiki_manager
+
+    @pytest.mark.asyncio
+    async def test_publish_complete_schema_async_batches_requests(self, fake_wiki, mock_transformer):
+        """Test that a complete schema publish costs one multicall round trip per batch."""
+        url, fake = fake_wiki
+        wiki_manager = await self._enum_publisher(url, fake, mock_transformer)
+        progress = []
+        requests = wiki_manager.client.transport.requests
+
+        with patch('ocxwiki.wiki_manager.Render.enum', return_value="enum content"):
+            results = await wiki_manager.publish_complete_schema_async(
+                progress_callback=lambda advance, total, description: progress.append(advance))
+
+        assert results['enums'] == 30
+        assert results['created'] == 30
+        assert results['total'] == 30
+        assert not results['journal']
+        # One multicall, the wiki is not listed without skip_unchanged or a manifest
+        assert wiki_manager.client.transport.requests - requests == 1
+        assert 'dokuwiki.getPagelist' not in fake.calls
+        assert progress == [0] + [1] * 30
+        assert len(fake.pages) == 30
+
+    @pytest.mark.asyncio
+    async def test_publish_complete_schema_async_adaptive(self, fake_wiki, mock_transformer):
+        """Test that an adaptive publish reports the concurrency it ended with."""
+        url, fake = fake_wiki
+        wiki_manager = await self._enum_publisher(url, fake, mock_transformer, count=60)
+        wiki_manager.client.max_batch_bytes = 2048
+        fake.delay = 0.02
+
+        with patch('ocxwiki.wiki_manager.Render.enum', return_value="enum content"):
+            results = await wiki_manager.publish_complete_schema_async(max_concurrent=6, adaptive=True,
+                                                                       min_concurrent=2)
+
+        assert results['enums'] == 60
+        assert 2 <= results['concurrency'] <= 6
+        # The limit starts at max_concurrent, a wiki answering at a steady pace gets all of them
+        assert fake.max_in_flight == 6
+
+    @pytest.mark.asyncio
+    async def test_publish_complete_schema_async_skips_unchanged(self, fake_wiki, mock_transformer):
+        """Test that only pages with changed content are written."""
+        url, fake = fake_wiki
+        wiki_manager = await self._enum_publisher(url, fake, mock_transformer)
+        namespace = wiki_manager.get_publish_namespace().lower()
+        with patch('ocxwiki.wiki_manager.Render.enum', return_value="enum content\r\n"):
+            await wiki_manager.publish_complete_schema_async()
+        fake.edit(f'{namespace}:ocx:enum3', 'edited by someone')
+        del fake.pages[f'{namespace}:ocx:enum4']
+        fake.calls.clear()
+        progress = []
+
+        with patch('ocxwiki.wiki_manager.Render.enum', return_value="enum content\r\n"):
+            results = await wiki_manager.publish_complete_schema_async(
+                progress_callback=lambda advance, total, description: progress.append(advance),
+                skip_unchanged=True)
+
+        assert (results['created'], results['updated'], results['unchanged']) == (1, 1, 28)
+        assert results['enums'] == 2
+        assert fake.calls.count('wiki.putPage') == 2
+        assert fake.pages[f'{namespace}:ocx:enum3']['content'] == 'enum content\n'
+        assert progress == [0] + [1] * 30
+
+    @pytest.mark.asyncio
+    async def test_publish_complete_schema_async_listing_fails(self, fake_wiki, mock_transformer):
+        """Test that all pages are written as created if the wiki namespace cannot be listed."""
+        url, fake = fake_wiki
+        wiki_manager = await self._enum_publisher(url, fake, mock_transformer)
+        with patch('ocxwiki.wiki_manager.Render.enum', return_value="enum content"), \
+                patch.object(wiki_manager.client, 'list_pages_async', side_effect=DokuWikiError('listing failed')):
+            results = await wiki_manager.publish_complete_schema_async(skip_unchanged=True)
+
+        assert (results['created'], results['updated'], results['unchanged']) == (30, 0, 0)
+        assert not results['errors']
+        assert len(fake.pages) == 30
+
+    @pytest.mark.asyncio
+    async def test_publish_complete_schema_async_with_manifest(self, fake_wiki, mock_transformer, tmp_path):
+        """Test that a manifest publish of an unchanged schema only asks the wiki for its recent changes."""
+        url, fake = fake_wiki
+        wiki_manager = await self._enum_publisher(url, fake, mock_transformer, cache_folder=tmp_path)
+        namespace = wiki_manager.get_publish_namespace().lower()
+        with patch('ocxwiki.wiki_manager.Render.enum', return_value="enum content"):
+            results = await wiki_manager.publish_complete_schema_async(skip_unchanged=True, use_manifest=True)
+            assert results['created'] == 30
+            assert len(wiki_manager.publish_manifest()) == 30
+
+            fake.calls.clear()
+            results = await wiki_manager.publish_complete_schema_async(skip_unchanged=True, use_manifest=True)
+            assert results['unchanged'] == 30
+            assert fake.calls == ['wiki.getRecentChanges']
+
+            fake.edit(f'{namespace}:ocx:enum5', 'edited by someone')
+            fake.calls.clear()
+            results = await wiki_manager.publish_complete_schema_async(skip_unchanged=True, use_manifest=True)
+
+        assert (results['created'], results['updated'], results['unchanged']) == (0, 1, 29)
+        assert 'wiki.getPagelist' not in fake.calls
+        assert fake.pages[f'{namespace}:ocx:enum5']['content'] == 'enum content'
+        assert wiki_manager.publish_manifest().get(f'{namespace}:ocx:enum5').rev == \
+               fake.pages[f'{namespace}:ocx:enum5']['rev']
+
+    @pytest.mark.asyncio
+    async def test_manifest_publish_by_a_new_process(self, fake_wiki, mock_transformer, tmp_path):
+        """Test that a manifest publish of an unchanged schema processed again on another date writes nothing."""
+        url, fake = fake_wiki
+        enums = {f'curveForm{i}': OcxEnumerator('ocx', f'curveForm{i}_enum', f'curveForm{i}', ['Open', 'Closed'],
+                                                ['Open curve', None]) for i in range(10)}
+        for date in ('Oct 16 2026 10:00:00', 'Oct 17 2026 10:00:00'):
+            wiki_manager = await self._enum_publisher(url, fake, mock_transformer, count=0, cache_folder=tmp_path)
+            wiki_manager._wiki_schema.date = date
+            mock_transformer.get_enumerators.return_value = enums
+            fake.calls.clear()
+            results = await wiki_manager.publish_complete_schema_async(skip_unchanged=True, use_manifest=True)
+            assert not results['errors']
+
+        assert (results['created'], results['updated'], results['unchanged']) == (0, 0, 10)
+        assert fake.calls == ['wiki.getRecentChanges']
+        assert all('Oct 16 2026' in page['content'] for page in fake.pages.values())
+
+    @staticmethod
+    async def _schema_publisher(url, fake, schema_folder, cache_folder, date):
+        """A manager connected to the fake wiki that processed the schema in ``schema_folder`` on ``date``."""
+        wiki_manager = WikiManager(wiki_url=url, cache_folder=cache_folder,
+                                   schema_cache=SchemaCache(cache_folder / 'schemas'))
+        await wiki_manager.connect_async(fake.USER, fake.PASSWORD)
+        with patch('ocxwiki.wiki_manager.datetime') as clock:
+            clock.datetime.now.return_value.strftime.return_value = date
+            assert wiki_manager.process_schema_folder(schema_folder)
+        return wiki_manager
+
+    @pytest.mark.asyncio
+    async def test_unchanged_schema_is_not_republished_by_a_new_process(self, fake_wiki, ocx_schema_folder, tmp_path):
+        """Test that pages rendered again on another date are not written when the schema did not change."""
+        url, fake = fake_wiki
+        first = await self._schema_publisher(url, fake, ocx_schema_folder, tmp_path, 'Oct 16 2026 10:00:00')
+        results = await first.publish_complete_schema_async(skip_unchanged=True)
+        assert results['created'] == results['total'] and not results['errors']
+        namespace = first.get_publish_namespace().lower()
+        fake.edit(f'{namespace}:ocx:vessel', 'edited by someone')
+        # Items with the same case-insensitive page id, like the enum position and the element Position, replace
+        # each other's page
+        shared = results['total'] - len(fake.pages)
+        fake.calls.clear()
+
+        second = await self._schema_publisher(url, fake, ocx_schema_folder, tmp_path, 'Oct 17 2026 10:00:00')
+        results = await second.publish_complete_schema_async(skip_unchanged=True)
+
+        assert (results['created'], results['updated']) == (0, 1 + shared)
+        assert fake.calls.count('wiki.putPage') == 1 + shared
+        assert 'Oct 17 2026' in fake.pages[f'{namespace}:ocx:vessel']['content']
+
+    @pytest.mark.asyncio
+    async def test_publish_resume_skips_confirmed_items(self, fake_wiki, mock_transformer, tmp_path):
+        """Test that a resumed run only publishes the items the interrupted run did not confirm."""
+        url, fake = fake_wiki
+        wiki_manager = await self._enum_publisher(url, fake, mock_transformer, count=10, cache_folder=tmp_path)
+        mock_transformer.parser.get_schema_version.return_value = '3.1.0'
+        namespace = wiki_manager.get_publish_namespace().lower()
+        fake.locked = {f'{namespace}:ocx:enum2', f'{namespace}:ocx:enum7'}
+        with patch('ocxwiki.wiki_manager.Render.enum', return_value="enum content"):
+            results = await wiki_manager.publish_complete_schema_async(journal=True)
+            assert results['enums'] == 8
+            assert len(results['errors']) == 2
+            assert results['journal']
+
+            fake.locked = set()
+            fake.calls.clear()
+            progress = []
+            results = await wiki_manager.publish_complete_schema_async(
+                progress_callback=lambda advance, total, description: progress.append(advance), resume=True)
+
+            assert results['resumed'] == 8
+            assert results['enums'] == 2
+            assert fake.calls.count('wiki.putPage') == 2
+            assert progress == [0] + [1] * 10
+            # The resumed run completed, there is nothing left to resume
+            with pytest.raises(OcxWikiError):
+                await wiki_manager.publish_complete_schema_async(resume=True)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_pages_keep_their_namespace(self, fake_wiki, mock_transformer):
+        """Test that pages rendered concurrently get the dataentry namespace of their own schema type."""
+        url, fake = fake_wiki
+        wiki_manager = await self._enum_publisher(url, fake, mock_transformer, count=0)
+        mock_pages = []
+        for i in range(40):
+            ocx = Mock(spec=OcxGlobalElement)
+            ocx.get_prefix.return_value = "ocx" if i % 2 else "unitsml"
+            ocx.get_name.return_value = f"Element{i}"
+            ocx.get_tag.return_value = f"{{https://{ocx.get_prefix.return_value}.org}}Element{i}"
+            mock_pages.append(ocx)
+        mock_transformer.get_ocx_elements.return_value = mock_pages
+
+        def render(ocx, data, *args):
+            time.sleep(0.001)
+            return f"{ocx.get_tag()} {data.namespace}"
+
+        with patch('ocxwiki.wiki_manager.Render.page', side_effect=render):
+            results = await wiki_manager.publish_complete_schema_async(render_workers=4)
+
+        assert results['pages'] == 40
+        for page in fake.pages.values():
+            tag, namespace = page['content'].split()
+            assert tag.startswith(f'{{{namespace}}}')
+        with pytest.raises(FrozenInstanceError):
+            wiki_manager._header('https://ocx.org').namespace = 'other'
+
     @pytest.mark.asyncio
     async def test_publish_with_errors(self, wiki_manager, mock_client, mock_transformer):
         """Test batch publishing with some errors."""
@@ -10,10 +10,10 @@ def test_url(wiki_client):
     assert wiki_client.current_url() == 'https://ocxwiki.3docx.org/'
 
 def test_wiki_version(wiki_client):
-    assert wiki_client._wiki.version == 'Release 2025-05-14b "Librarian"'
+    assert wiki_client.wiki_version() == 'Release 2025-05-14b "Librarian"'
 
 def test_xmlrpc_version(wiki_client):
-    assert wiki_client._wiki.xmlrpc_version == 14
+    assert wiki_client.xmlrpc_version() == 14
 
 
 def test_list_pages(wiki_client):
@@ -0,0 +1,75 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the adaptive concurrency limiter."""
+
+import asyncio
+
+import pytest
+
+from ocxwiki.concurrency import AdaptiveLimiter
+
+
+async def _saturated_round(limiter: AdaptiveLimiter, latency: float, overload: bool = False):
+    """Fill all slots and release them with ``latency``."""
+    tokens = [await limiter.acquire() for _ in range(limiter.limit)]
+    for token in tokens:
+        await limiter.release(latency, overload, token)
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_latency_is_flat():
+    limiter = AdaptiveLimiter(floor=2, ceiling=8)
+    for _ in range(20):
+        await _saturated_round(limiter, 0.05)
+    assert limiter.limit == 8
+    assert limiter.peak == 8
+
+
+@pytest.mark.asyncio
+async def test_limit_does_not_grow_when_not_saturated():
+    limiter = AdaptiveLimiter(floor=4, ceiling=8)
+    for _ in range(20):
+        await limiter.acquire()
+        await limiter.release(0.05)
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_limit_backs_off_on_overload_down_to_floor():
+    limiter = AdaptiveLimiter(floor=2, ceiling=16, initial=16)
+    await _saturated_round(limiter, 0.0, overload=True)
+    assert limiter.limit == 11
+    for _ in range(10):
+        await _saturated_round(limiter, 0.0, overload=True)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limit_backs_off_when_latency_rises():
+    limiter = AdaptiveLimiter(floor=1, ceiling=16, initial=10, smoothing=1.0)
+    await _saturated_round(limiter, 0.01)
+    await limiter.acquire()
+    await limiter.release(0.1)
+    assert limiter.limit < 10
+    assert limiter.decreases == 1
+
+
+@pytest.mark.asyncio
+async def test_converges_below_the_wiki_capacity():
+    """A wiki that gets slow beyond 6 concurrent requests keeps the limit near 6."""
+    limiter = AdaptiveLimiter(floor=1, ceiling=32)
+    in_flight = 0
+
+    async def request():
+        nonlocal in_flight
+        async with limiter.slot():
+            in_flight += 1
+            await asyncio.sleep(0.002 if in_flight <= 6 else 0.002 * in_flight)
+            in_flight -= 1
+
+    async def worker(count):
+        for _ in range(count):
+            await request()
+
+    await asyncio.gather(*(worker(40) for _ in range(32)))
+    assert 3 <= limiter.limit <= 12
+    assert limiter.in_flight == 0
@@ -0,0 +1,190 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the conditional schema download against a local HTTP stand-in."""
+
+import hashlib
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import ocx
+import pytest
+
+from ocxwiki.downloader import SchemaDownloader
+from ocxwiki.error import SchemaDownloadError
+from ocxwiki.schema_cache import SchemaCache, SchemaSnapshot
+from ocxwiki.wiki_manager import WikiManager
+
+XSD = 'http://www.w3.org/2001/XMLSchema'
+
+
+def _schema(*imports: str, namespace: str = 'urn:test') -> bytes:
+    references = ''.join(f'<xs:import namespace="urn:{i}" schemaLocation="{i}"/>' for i in imports)
+    return (f'<xs:schema xmlns:xs="{XSD}" targetNamespace="{namespace}">{references}'
+            f'<xs:element name="E" type="xs:string"/></xs:schema>').encode()
+
+
+class SchemaServer:
+    """A static file server answering conditional requests, with an optional delay per request.
+
+    ``max_in_flight`` is the highest number of requests the server handled at the same time.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.requests = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with lock:
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    self._answer()
+                finally:
+                    with lock:
+                        server.in_flight -= 1
+
+            def _answer(self):
+                server.requests.append((self.path, self.headers.get('If-None-Match')))
+                time.sleep(server.delay)
+                data = server.files.get(self.path)
+                if data is None:
+                    self.send_error(404)
+                    return
+                etag = f'"{hashlib.md5(data).hexdigest()}"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', formatdate(usegmt=True))
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self._httpd.server_address[1]}'
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def paths(self):
+        return [path for path, _ in self.requests]
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    server = SchemaServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    return SchemaDownloader(tmp_path / 'store')
+
+
+def test_download_and_revalidate(server, downloader, tmp_path):
+    server.files = {'/v1/main.xsd': _schema('a.xsd', 'sub/b.xsd'), '/v1/a.xsd': _schema(),
+                    '/v1/sub/b.xsd': _schema('../a.xsd')}
+    folder = tmp_path / 'download'
+
+    first = downloader.download(f'{server.url}/v1/main.xsd', folder)
+
+    assert first.downloaded == 3
+    assert sorted(server.paths()) == ['/v1/a.xsd', '/v1/main.xsd', '/v1/sub/b.xsd']
+    assert (folder / 'main.xsd').read_bytes() == server.files['/v1/main.xsd']
+    assert sorted(p.name for p in (folder / 'imports').glob('*.xsd')) == ['a.xsd', 'b.xsd']
+
+    server.requests.clear()
+    server.files['/v1/a.xsd'] = _schema(namespace='urn:changed')
+    second = downloader.download(f'{server.url}/v1/main.xsd', folder)
+
+    assert (second.downloaded, second.not_modified) == (1, 2)
+    assert all(etag is not None for _, etag in server.requests)
+    assert (folder / 'imports' / 'a.xsd').read_bytes() == server.files['/v1/a.xsd']
+
+
+def test_imports_are_fetched_concurrently(server, downloader, tmp_path):
+    names = [f'i{i}.xsd' for i in range(6)]
+    server.files = {'/main.xsd': _schema(*names), **{f'/{name}': _schema() for name in names}}
+    server.delay = 0.2
+
+    result = downloader.download(f'{server.url}/main.xsd', tmp_path / 'download')
+
+    assert result.downloaded == 7
+    # The root and then the six imports in parallel
+    assert server.max_in_flight == 6
+
+
+def test_bundled_w3c_schemas_are_not_downloaded(server, downloader, tmp_path):
+    server.files = {'/main.xsd': (f'<xs:schema xmlns:xs="{XSD}"><xs:import namespace='
+                                  f'"http://www.w3.org/XML/1998/namespace" schemaLocation='
+                                  f'"http://www.w3.org/2001/xml.xsd"/></xs:schema>').encode()}
+
+    result = downloader.download(f'{server.url}/main.xsd', tmp_path / 'download')
+
+    assert server.paths() == ['/main.xsd']
+    assert result.local == 1
+    assert (tmp_path / 'download' / 'imports' / 'xml.xsd').is_file()
+
+
+def test_schema_versions_share_stored_files(server, downloader, tmp_path):
+    common = _schema()
+    server.files = {'/V310/main.xsd': _schema('common.xsd'), '/V310/common.xsd': common,
+                    '/V320/main.xsd': _schema('common.xsd', namespace='urn:v320'), '/V320/common.xsd': common}
+
+    downloader.download(f'{server.url}/V310/main.xsd', tmp_path / 'v310')
+    downloader.download(f'{server.url}/V320/main.xsd', tmp_path / 'v320')
+
+    objects = [p for p in downloader.store.path('00').parent.parent.glob('*/*') if p.is_file()]
+    assert len(objects) == 3
+
+
+def test_stored_copies_are_used_when_the_server_is_down(server, downloader, tmp_path):
+    server.files = {'/main.xsd': _schema('a.xsd'), '/a.xsd': _schema()}
+    url = f'{server.url}/main.xsd'
+    downloader.download(url, tmp_path / 'download')
+    server.files = {}
+
+    result = downloader.download(url, tmp_path / 'download')
+
+    assert result.stale == 2
+    with pytest.raises(SchemaDownloadError):
+        SchemaDownloader(tmp_path / 'other').download(url, tmp_path / 'other')
+
+
+def test_unchanged_schema_url_is_neither_downloaded_nor_parsed(server, tmp_path):
+    schemas = Path(ocx.__file__).parent / 'ocx_301'
+    unitsml = 'unitsmlSchema_lite-0.9.18.xsd'
+    main = (schemas / 'OCX_Schema.xsd').read_bytes().replace(
+        f'https://3docx.org/fileadmin/ocx_schema/unitsml/{unitsml}'.encode(), f'unitsml/{unitsml}'.encode())
+    server.files = {'/V301/OCX_Schema.xsd': main, f'/V301/unitsml/{unitsml}': (schemas / unitsml).read_bytes()}
+    url = f'{server.url}/V301/OCX_Schema.xsd'
+    cache = SchemaCache(tmp_path / 'cache')
+    downloader = SchemaDownloader(tmp_path / 'store')
+
+    assert WikiManager('http://localhost/', schema_cache=cache, downloader=downloader).process_schema(
+        url, tmp_path / 'download')
+    server.requests.clear()
+    manager = WikiManager('http://localhost/', schema_cache=cache, downloader=downloader)
+    with patch('ocxwiki.wiki_manager.Transformer', side_effect=AssertionError('parsed')):
+        assert manager.process_schema(url, tmp_path / 'download')
+
+    assert isinstance(manager.transformer, SchemaSnapshot)
+    assert len(server.requests) == 2
+    assert all(etag is not None for _, etag in server.requests)
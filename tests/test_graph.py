@@ -0,0 +1,73 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the reference graph of the schema items."""
+
+from types import SimpleNamespace
+
+import pytest
+from ocx_schema_parser.data_classes import OcxEnumerator, OcxSchemaAttribute, OcxSchemaChild, SchemaAttribute
+
+from ocxwiki.graph import ReferenceGraph
+from ocxwiki.schema_cache import SchemaCache, SchemaElement
+from ocxwiki.wiki_manager import WikiManager
+
+NS = 'https://3docx.org/ocx'
+
+
+def _element(name, children=(), attributes=()):
+    return SchemaElement(name, 'ocx', f'{{{NS}}}{name}', NS, f'The {name}.', list(children), list(attributes))
+
+
+@pytest.fixture
+def transformer():
+    """A schema where a vessel has a hull and a deck, both with a guid and a side."""
+    guid = OcxSchemaAttribute('guid', 'ocx', 'ocx:guidType', 'required')
+    side = OcxSchemaAttribute('side', 'ocx', 'ocx:Side', 'optional')
+    elements = [_element('Vessel', [OcxSchemaChild('Hull', 'ocx', 'ocx:Hull_T', 'req', '[1]'),
+                                    OcxSchemaChild('Deck', 'ocx', 'ocx:Deck_T', 'opt', '[0..*]')], [guid]),
+                _element('Hull', [], [guid, side]),
+                _element('Deck', [], [guid, side, OcxSchemaAttribute('name', 'ocx', 'xs:string', 'optional')])]
+    enums = {'Side': OcxEnumerator(prefix='ocx', name='Side', tag=f'{{{NS}}}Side')}
+    return SimpleNamespace(get_ocx_elements=lambda: elements, get_enumerators=lambda: enums,
+                           get_global_attributes=lambda: [SchemaAttribute('guid', 'ocx', 'ocx:guidType')],
+                           get_simple_types=lambda: [SchemaAttribute('guidType', 'ocx', 'Restriction of type xs:ID',
+                                                                     'xs:ID')])
+
+
+def test_references_in_both_directions(transformer):
+    graph = ReferenceGraph.from_transformer(transformer)
+
+    assert len(graph) == 6
+    assert graph.uses('ocx:Vessel') == ['ocx:Deck', 'ocx:Hull', 'ocx:guid', 'ocx:guidType']
+    assert graph.used_by('ocx:Hull') == ['ocx:Vessel']
+    assert graph.used_by('ocx:Side') == ['ocx:Deck', 'ocx:Hull']
+    assert graph.used_by('ocx:guidType') == ['ocx:Deck', 'ocx:Hull', 'ocx:Vessel', 'ocx:guid']
+    assert graph.uses('ocx:guidType') == []
+    assert graph.used_by('ocx:Missing') == [] and 'ocx:Missing' not in graph
+    assert graph.edges == 11
+
+
+def test_impacted_pages(transformer):
+    graph = ReferenceGraph.from_transformer(transformer)
+
+    assert graph.impacted(['ocx:Side']) == {'ocx:Side', 'ocx:Hull', 'ocx:Deck'}
+    assert graph.impacted(['ocx:Vessel']) == {'ocx:Vessel'}
+
+    # The deck loses its side: the side page no longer lists the deck
+    deck = transformer.get_ocx_elements()[2]
+    deck.attributes = deck.attributes[:1]
+    changed = ReferenceGraph.from_transformer(transformer)
+    assert changed.impacted(['ocx:Deck'], previous=graph) == {'ocx:Deck', 'ocx:Vessel', 'ocx:Side'}
+
+
+def test_pages_list_their_users(ocx_schema_folder, tmp_path):
+    manager = WikiManager('http://localhost/', schema_cache=SchemaCache(tmp_path / 'cache'))
+    assert manager.process_schema_folder(ocx_schema_folder)
+    vessel = next(ocx for ocx in manager.transformer.get_ocx_elements() if ocx.get_name() == 'Vessel')
+
+    page = manager._page_write('pages', vessel, 'ns').content
+
+    assert 'Vessel%% is used by:' in page
+    assert '[[ns:ocx:ocxXML|ocxXML]]' in page.split('is used by:')[1]
+    assert manager.graph.edges > len(manager.graph)
+    keys = [manager._item_key(kind, item) for kind, item in manager.impacted_items(['ocx:Vessel'])]
+    assert sorted(keys) == ['pages:ocx:Vessel', 'pages:ocx:ocxXML']
@@ -0,0 +1,117 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the incremental processing of changed schemas."""
+
+import shutil
+from unittest.mock import patch
+
+import pytest
+from ocx_schema_parser.transformer import Transformer
+
+from ocxwiki.incremental import IncrementalTransformer
+from ocxwiki.schema_cache import SchemaCache
+from ocxwiki.wiki_manager import WikiManager
+
+NS = 'https://3docx.org/fileadmin//ocx_schema//V301//OCX_Schema.xsd'
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return WikiManager('http://localhost/', schema_cache=SchemaCache(tmp_path / 'cache'))
+
+
+def _content(manager: WikiManager) -> dict:
+    return {ocx.get_tag(): (ocx.get_annotation(), [c.to_dict() for c in ocx.get_children()],
+                            [a.to_dict() for a in ocx.get_attributes()])
+            for ocx in manager.transformer.get_ocx_elements()}
+
+
+def _edit(folder, old: str, new: str):
+    schema = folder / 'OCX_Schema.xsd'
+    content = schema.read_text(encoding='utf-8')
+    assert old in content
+    schema.write_text(content.replace(old, new, 1), encoding='utf-8')
+
+
+def _assert_same_as_full(manager: WikiManager, folder, tmp_path):
+    full = WikiManager('http://localhost/', schema_cache=SchemaCache(tmp_path / 'full'))
+    assert full.process_schema_folder(folder, use_cache=False, incremental=False)
+    assert _content(manager) == _content(full)
+    assert len(manager._links) == len(full._links)
+
+
+def test_unchanged_elements_are_reused(ocx_schema_folder, manager, tmp_path):
+    assert manager.process_schema_folder(ocx_schema_folder, incremental=True)
+    assert isinstance(manager.transformer, Transformer)
+    _edit(ocx_schema_folder, '<xs:attribute name="documentation" type="xs:string" use="optional">',
+          '<xs:attribute name="documentation" type="xs:string" use="required">')
+
+    assert manager.process_schema_folder(ocx_schema_folder, incremental=True)
+
+    transformer = manager.transformer
+    assert isinstance(transformer, IncrementalTransformer)
+    assert 0 < len(transformer.reprocessed) < len(transformer.get_ocx_elements()) // 10
+    _assert_same_as_full(manager, ocx_schema_folder, tmp_path)
+
+
+def test_substitution_group_member_changes_its_head(ocx_schema_folder, manager, tmp_path):
+    assert manager.process_schema_folder(ocx_schema_folder, incremental=True)
+    _edit(ocx_schema_folder, '<xs:element name="Vessel" substitutionGroup="ocx:Form">',
+          '<xs:element name="Barge" type="ocx:Form_T" substitutionGroup="ocx:Form"/>'
+          '<xs:element name="Vessel" substitutionGroup="ocx:Form">')
+
+    assert manager.process_schema_folder(ocx_schema_folder, incremental=True)
+
+    reprocessed = manager.transformer.reprocessed
+    assert {f'{{{NS}}}Barge', f'{{{NS}}}Form'} <= reprocessed
+    _assert_same_as_full(manager, ocx_schema_folder, tmp_path)
+
+
+def test_incremental_from_the_schema_cache(ocx_schema_folder, manager, tmp_path):
+    assert manager.process_schema_folder(ocx_schema_folder, incremental=True)
+    _edit(ocx_schema_folder, 'name="documentation" type="xs:string"', 'name="documentation" type="xs:token"')
+
+    restarted = WikiManager('http://localhost/', schema_cache=manager.schema_cache)
+    assert restarted.process_schema_folder(ocx_schema_folder, incremental=True)
+
+    assert isinstance(restarted.transformer, IncrementalTransformer)
+    assert len(restarted.transformer.reprocessed) < len(restarted.transformer.get_ocx_elements())
+    _assert_same_as_full(restarted, ocx_schema_folder, tmp_path)
+
+
+def test_full_processing(ocx_schema_folder, manager):
+    assert manager.process_schema_folder(ocx_schema_folder, incremental=True)
+    _edit(ocx_schema_folder, 'use="optional"', 'use="required"')
+
+    with patch('ocxwiki.wiki_manager.IncrementalTransformer', side_effect=AssertionError('incremental')):
+        assert manager.process_schema_folder(ocx_schema_folder, incremental=False)
+        # Full processing is the default
+        _edit(ocx_schema_folder, 'use="required"', 'use="optional"')
+        assert manager.process_schema_folder(ocx_schema_folder)
+
+    assert isinstance(manager.transformer, Transformer)
+
+
+def test_only_the_same_schema_is_reused(ocx_schema_folder, manager, tmp_path):
+    assert manager.process_schema_folder(ocx_schema_folder, incremental=True)
+    other = tmp_path / 'other'
+    shutil.copytree(ocx_schema_folder, other)
+    _edit(other, 'use="optional"', 'use="required"')
+
+    # Neither the processed schema nor the cached schema are of the other folder
+    assert manager.process_schema_folder(other, incremental=True)
+    assert not isinstance(manager.transformer, IncrementalTransformer)
+    restarted = WikiManager('http://localhost/', schema_cache=manager.schema_cache)
+    _edit(ocx_schema_folder, 'name="documentation" type="xs:string"', 'name="documentation" type="xs:token"')
+    assert restarted.process_schema_folder(ocx_schema_folder, incremental=True)
+    assert isinstance(restarted.transformer, IncrementalTransformer)
+    assert restarted.transformer.reprocessed
+
+
+def test_unsupported_parser_processes_the_complete_schema(ocx_schema_folder, manager):
+    assert manager.process_schema_folder(ocx_schema_folder, incremental=True)
+    _edit(ocx_schema_folder, 'use="optional"', 'use="required"')
+
+    with patch('ocxwiki.incremental.metadata.version', return_value='2.1.0'):
+        assert manager.process_schema_folder(ocx_schema_folder, incremental=True)
+
+    assert not isinstance(manager.transformer, IncrementalTransformer)
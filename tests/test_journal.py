@@ -0,0 +1,50 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the publish checkpoint journal."""
+
+import ocxwiki.journal as journal_module
+from ocxwiki.journal import PublishJournal
+
+URL = 'https://wiki.example/'
+NAMESPACE = 'ocx-if:draft-schema'
+
+
+def test_record_and_load(tmp_path):
+    journal = PublishJournal.start(URL, NAMESPACE, '3.1.0', tmp_path)
+    journal.record('pages:ocx:Vessel', 'abc', 'written')
+    journal.record('pages:ocx:Hull', 'def', 'unchanged')
+    journal.record('enums:ocx:Unit', 'ghi', 'failed')
+    journal.flush()
+
+    loaded = PublishJournal.latest(URL, NAMESPACE, tmp_path)
+    assert loaded.run_id == journal.run_id
+    assert loaded.schema_version == '3.1.0'
+    assert not loaded.completed
+    assert loaded.confirmed() == {'pages:ocx:Vessel': 'abc', 'pages:ocx:Hull': 'def'}
+
+
+def test_records_are_written_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(journal_module, 'FLUSH_RECORDS', 3)
+    monkeypatch.setattr(journal_module, 'FLUSH_INTERVAL', 3600)
+    journal = PublishJournal.start(URL, NAMESPACE, '3.1.0', tmp_path)
+    journal.record('a', '1', 'written')
+    journal.record('b', '2', 'written')
+    assert len(journal.path.read_text().splitlines()) == 1
+    journal.record('c', '3', 'written')
+    assert len(journal.path.read_text().splitlines()) == 4
+
+
+def test_truncated_record_is_ignored(tmp_path):
+    journal = PublishJournal.start(URL, NAMESPACE, '3.1.0', tmp_path)
+    journal.record('a', '1', 'written')
+    journal.flush()
+    with open(journal.path, 'a') as f:
+        f.write('{"key": "b", "ha')
+
+    assert PublishJournal.load(journal.path).confirmed() == {'a': '1'}
+
+
+def test_latest_run_completed(tmp_path):
+    journal = PublishJournal.start(URL, NAMESPACE, '3.1.0', tmp_path)
+    journal.complete()
+    assert PublishJournal.latest(URL, NAMESPACE, tmp_path).completed
+    assert PublishJournal.latest(URL, 'public:schema:', tmp_path) is None
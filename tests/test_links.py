@@ -0,0 +1,116 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the link index and the wiki links of a transformed schema."""
+
+from types import SimpleNamespace
+
+import pytest
+from ocx_schema_parser.data_classes import OcxEnumerator, OcxSchemaAttribute, OcxSchemaChild
+
+from ocxwiki.links import LinkIndex
+from ocxwiki.render import Render
+from ocxwiki.wiki_manager import WikiManager, PublishState
+
+NS = 'https://3docx.org/ocx'
+XS = 'http://www.w3.org/2001/XMLSchema'
+
+
+def _element(name, children, attributes):
+    return SimpleNamespace(get_name=lambda: name, get_prefix=lambda: 'ocx', get_children=lambda: children,
+                           get_attributes=lambda: attributes, get_tag=lambda: f'{{{NS}}}{name}',
+                           get_annotation=lambda: f'The {name}.')
+
+
+@pytest.fixture
+def transformer():
+    """A transformer of a schema with two elements, a simple type and an enumerator."""
+    vessel = _element('Vessel', [OcxSchemaChild('Hull', 'ocx', 'ocx:Hull_T', 'req', '[1]')],
+                      [OcxSchemaAttribute('guid', 'ocx', 'xs:ID', 'required'),
+                       OcxSchemaAttribute('Hull', 'ocx', 'ocx:unitRef', 'optional')])
+    hull = _element('Hull', [], [OcxSchemaAttribute('name', 'ocx', 'xsd:string', 'optional')])
+    parser = SimpleNamespace(
+        get_namespaces=lambda: {'ocx': NS, 'xs': XS},
+        get_xs_types=lambda: {f'{{{XS}}}ID': 'https://w3c/ID', f'{{{XS}}}string': 'https://w3c/string'},
+        get_prefix_from_namespace=lambda ns: 'xs' if ns == XS else 'ocx',
+        get_schema_element_types=lambda: [f'{{{NS}}}Vessel', f'{{{NS}}}Hull'],
+        get_schema_attribute_types=lambda: [],
+        get_schema_attribute_group_types=lambda: [],
+        get_schema_simple_types=lambda: [f'{{{NS}}}unitRef'],
+        get_schema_version=lambda: '3.0.1',
+        get_schema_namespace=lambda version: NS,
+    )
+    enums = {'Side': OcxEnumerator(prefix='ocx', name='Side', tag=f'{{{NS}}}Side')}
+    return SimpleNamespace(parser=parser, get_ocx_elements=lambda: [vessel, hull], get_enumerators=lambda: enums,
+                           get_global_attributes=lambda: [], get_simple_types=lambda: [])
+
+
+def test_index_lookups():
+    index = LinkIndex({'xs:string': 'https://w3c/string'})
+    index.add('ocx', 'Vessel')
+    index.add('unitsml', 'Vessel')
+
+    assert index.is_global('Vessel')
+    assert index.is_global('unitsml:Vessel')
+    assert not index.is_global('ocx:Hull')
+    assert index.target('Vessel') == ('ocx', 'Vessel')
+    assert index.builtin('xs:string') == 'https://w3c/string'
+    assert index.builtin('ocx:Vessel') is None
+    assert len(index) == 2
+
+
+def test_index_from_transformer(transformer):
+    index = LinkIndex.from_transformer(transformer)
+
+    assert index.globals == [('ocx', 'Vessel'), ('ocx', 'Hull'), ('ocx', 'unitRef'), ('ocx', 'Side')]
+    # xs and xsd builtins are complementary
+    assert index.builtin('xsd:ID') == index.builtin('xs:ID') == 'https://w3c/ID'
+
+
+def test_render_links_children_and_attributes(transformer):
+    manager = WikiManager('http://localhost/')
+    manager._transformer = transformer
+    manager.transform()
+    vessel, hull = transformer.get_ocx_elements()
+
+    children = Render.children_table(vessel, manager._links, 'ocx-if:draft-schema')
+    attributes = Render.attributes_table(vessel, manager._links, 'ocx-if:draft-schema')
+
+    assert children['Child'] == ['[[ocx-if:draft-schema:ocx:Hull|Hull]]']
+    assert children['Type'] == ['[[ocx-if:draft-schema:ocx:Hull_T]]']
+    assert attributes['Attribute'] == ['guid', '[[ocx-if:draft-schema:ocx:Hull|Hull]]']
+    assert attributes['Type'] == ['[[https://w3c/ID|xs:ID]]', '[[ocx-if:draft-schema:ocx:unitRef]]']
+    assert Render.attributes_table(hull, manager._links, 'ns')['Type'] == ['[[https://w3c/string|xsd:string]]']
+
+
+def test_transform_is_repeatable(transformer):
+    manager = WikiManager('http://localhost/')
+    manager._transformer = transformer
+    manager.transform()
+    vessel = transformer.get_ocx_elements()[0]
+    first = manager._page_write('pages', vessel, 'ns').content
+
+    manager.transform()
+    manager.transform()
+
+    # The schema objects keep their raw names and the link table does not grow
+    assert vessel.get_children()[0].name == 'Hull'
+    assert vessel.get_attributes()[1].name == 'Hull'
+    assert len(manager._links) == 4
+    assert manager._page_write('pages', vessel, 'ns').content == first
+    assert first.count('[[ns:ocx:Hull|Hull]]') == 2
+
+
+def test_links_follow_the_publish_state_without_reprocessing(transformer):
+    manager = WikiManager('http://localhost/')
+    manager._transformer = transformer
+    manager.transform()
+    vessel = transformer.get_ocx_elements()[0]
+    draft = manager._page_write('pages', vessel, manager.get_publish_namespace())
+
+    manager.set_publish_state(PublishState.PUBLIC)
+    public = manager._page_write('pages', vessel, manager.get_publish_namespace())
+
+    assert public.namespace == 'public:schema:3.0.1'
+    assert '[[public:schema:3.0.1:ocx:Hull|Hull]]' in public.content
+    assert '[[public:schema:3.0.1:ocx:Hull_T]]' in public.content
+    assert 'ocx-if:draft-schema' not in public.content
+    assert '[[ocx-if:draft-schema:ocx:Hull|Hull]]' in draft.content
@@ -0,0 +1,58 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the local publish manifest."""
+
+from ocxwiki.client import page_hash
+from ocxwiki.manifest import PublishManifest, ManifestEntry, content_hash
+from ocxwiki.struct_data import struct_gen
+
+
+def test_record_save_and_load(tmp_path):
+    manifest = PublishManifest.for_target('https://wiki.example/', 'ocx-if:draft-schema', tmp_path)
+    manifest.record('ocx-if:draft-schema:ocx:Vessel', 'abc', 1700000002)
+    manifest.record('ocx-if:draft-schema:ocx:Hull', 'def', 1700000001)
+    manifest.save()
+
+    loaded = PublishManifest.for_target('https://wiki.example', 'OCX-IF:draft-schema', tmp_path)
+    assert loaded.path == manifest.path
+    assert loaded.get('ocx-if:draft-schema:ocx:vessel') == ManifestEntry('abc', 1700000002)
+    assert loaded.last_sync == 1700000002
+    assert len(loaded) == 2
+
+
+def test_targets_have_separate_manifests(tmp_path):
+    draft = PublishManifest.for_target('https://wiki.example/', 'ocx-if:draft-schema', tmp_path)
+    public = PublishManifest.for_target('https://wiki.example/', 'public:schema:', tmp_path)
+    other = PublishManifest.for_target('http://localhost:9001/', 'ocx-if:draft-schema', tmp_path)
+    assert len({draft.path, public.path, other.path}) == 3
+
+
+def test_apply_changes_invalidates_edited_pages(tmp_path):
+    manifest = PublishManifest(tmp_path / 'manifest.json')
+    manifest.record('ns:a', 'a', 10)
+    manifest.record('ns:b', 'b', 11)
+    changes = [
+        {'name': 'ns:a', 'version': 10},  # Our own publish
+        {'name': 'ns:b', 'version': 11},
+        {'name': 'ns:b', 'version': 15},  # Edited by someone else
+        {'name': 'other:c', 'version': 12},
+    ]
+    assert manifest.apply_changes(changes) == ['ns:b']
+    assert 'ns:a' in manifest
+    assert 'ns:b' not in manifest
+
+
+def test_unreadable_manifest_is_empty(tmp_path):
+    path = tmp_path / 'manifest.json'
+    path.write_text('{not json')
+    manifest = PublishManifest(path)
+    assert not manifest.load()
+    assert len(manifest) == 0
+    assert manifest.last_sync == 0
+
+
+def test_content_hash_leaves_out_the_publish_date():
+    first = 'body\r\n' + struct_gen('version', {'OCX Version ': '3.0.1', 'Date ': 'Oct 16 2026 10:00:00'})
+    second = 'body\n' + struct_gen('version', {'OCX Version ': '3.0.1', 'Date ': 'Oct 17 2026 10:00:00'})
+    bumped = 'body\n' + struct_gen('version', {'OCX Version ': '3.1.0', 'Date ': 'Oct 17 2026 10:00:00'})
+    assert page_hash(first) != page_hash(second)
+    assert content_hash(first) == content_hash(second) != content_hash(bumped)
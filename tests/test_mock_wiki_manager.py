@@ -9,6 +9,7 @@ from ocxwiki import WIKI_URL, USER, PSWD, WORKING_DRAFT
 from ocxwiki.wiki_manager import WikiManager, PublishState
 from ocxwiki.client import WikiClient
 from ocxwiki.error import OcxWikiError
+from ocxwiki.downloader import SchemaDownloader
 from ocx_schema_parser.transformer import Transformer
 from ocx_schema_parser.elements import OcxGlobalElement
 from ocx_schema_parser.data_classes import OcxEnumerator, SchemaAttribute
@@ -198,11 +199,17 @@ class TestWikiManagerPublishNamespace:
 class TestWikiManagerProcessSchema:
     """Test WikiManager schema processing."""
 
+    @pytest.fixture(autouse=True)
+    def schema_downloader(self, wiki_manager):
+        """Replace the schema download by a mock."""
+        wiki_manager._downloader = Mock(spec=SchemaDownloader)
+        return wiki_manager._downloader
+
     @patch('ocxwiki.wiki_manager.Transformer')
     def test_process_schema_creates_transformer(self, mock_transformer_class, wiki_manager):
         """Test that process_schema creates a new Transformer instance."""
         mock_instance = Mock(spec=Transformer)
-        mock_instance.transform_schema_from_url.return_value = True
+        mock_instance.transform_schema_from_folder.return_value = True
         mock_transformer_class.return_value = mock_instance
 
         with patch.object(wiki_manager, 'transform'):
@@ -215,7 +222,7 @@ class TestWikiManagerProcessSchema:
     def test_process_schema_calls_transform_on_success(self, mock_transformer_class, wiki_manager):
         """Test that transform is called when schema processing succeeds."""
         mock_instance = Mock(spec=Transformer)
-        mock_instance.transform_schema_from_url.return_value = True
+        mock_instance.transform_schema_from_folder.return_value = True
         mock_transformer_class.return_value = mock_instance
 
         with patch.object(wiki_manager, 'transform') as mock_transform:
@@ -228,7 +235,7 @@ class TestWikiManagerProcessSchema:
     def test_process_schema_does_not_call_transform_on_failure(self, mock_transformer_class, wiki_manager):
         """Test that transform is not called when schema processing fails."""
         mock_instance = Mock(spec=Transformer)
-        mock_instance.transform_schema_from_url.return_value = False
+        mock_instance.transform_schema_from_folder.return_value = False
         mock_transformer_class.return_value = mock_instance
 
         with patch.object(wiki_manager, 'transform') as mock_transform:
@@ -244,7 +251,7 @@ class TestWikiManagerProcessSchema:
         wiki_manager.transformer = old_transformer
 
         mock_instance = Mock(spec=Transformer)
-        mock_instance.transform_schema_from_url.return_value = True
+        mock_instance.transform_schema_from_folder.return_value = True
         mock_transformer_class.return_value = mock_instance
 
         with patch.object(wiki_manager, 'transform'):
@@ -0,0 +1,68 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the page model shared by the renderers."""
+
+import pytest
+from rich.console import Console
+
+from ocx_schema_parser.data_classes import OcxEnumerator, SchemaAttribute
+from ocxwiki.render import Render, RichRender
+from ocxwiki.render.page_model import PageModel, Table
+from ocxwiki.schema_cache import SchemaCache
+from ocxwiki.wiki_manager import WikiManager
+
+
+@pytest.fixture
+def manager(ocx_schema_folder, tmp_path):
+    manager = WikiManager('http://localhost/', schema_cache=SchemaCache(tmp_path / 'cache'))
+    assert manager.process_schema_folder(ocx_schema_folder)
+    return manager
+
+
+def test_column_oriented_tables():
+    rows = [SchemaAttribute('guid', 'ocx', 'xs:ID'), SchemaAttribute('name', 'ocx', 'xs:string', description='Name')]
+    table = Table.from_rows(rows)
+
+    assert table.names[:3] == ('name', 'prefix', 'type')
+    assert table.headers[:3] == ('Attribute', 'Namespace', 'Type')
+    assert table.column('type') == ('xs:ID', 'xs:string') and len(table) == 2
+    assert list(table.rows())[1] == ('name', 'ocx', 'xs:string', '', 'Name')
+    linked = table.replace(name=['[[guid]]', '[[name]]'])
+    assert linked.column('name') == ('[[guid]]', '[[name]]') and table.column('name') == ('guid', 'name')
+    assert linked.to_dict()['Attribute'] == ['[[guid]]', '[[name]]']
+    assert not Table.from_rows([]) and len(Table()) == 0
+
+
+def test_backends_render_the_same_model(manager):
+    namespace = manager.get_publish_namespace()
+    header = manager._header()
+    vessel = next(ocx for ocx in manager.transformer.get_ocx_elements() if ocx.get_name() == 'Vessel')
+    model = manager.page_model('pages', vessel)
+
+    assert model.qname == 'ocx:Vessel' and model.used_by == ('ocx:ocxXML',) and len(model.children) == 18
+    assert Render.page(model, header, manager._links, namespace) == \
+        Render.page(vessel, header, manager._links, namespace, ['ocx:ocxXML'])
+
+    console = Console(record=True, width=200)
+    RichRender.element(model, console=console)
+    text = console.export_text()
+    assert 'Vessel has the following child elements:' in text and 'AngleTolerance' in text
+
+    enum = OcxEnumerator('ocx', 'curveForm_enum', 'curveForm', ['Open', 'Closed'], ['Open curve', None])
+    assert Render.enum(PageModel.from_enum(enum), header) == Render.enum(enum, header)
+    assert '|%%Open%%|Open curve|' in Render.enum(enum, header)
+    RichRender.enum(enum, header, console=console)
+    attribute = SchemaAttribute('guid', 'ocx', 'xs:ID', description='A unique id')
+    assert Render.attribute(PageModel.from_attribute(attribute), header) == Render.attribute(attribute, header)
+    RichRender.attribute(attribute, header, console=console)
+    text = console.export_text()
+    assert 'Closed' in text and 'A unique id' in text
+
+
+def test_models_are_extracted_once_per_transform(manager):
+    vessel = next(ocx for ocx in manager.transformer.get_ocx_elements() if ocx.get_name() == 'Vessel')
+    model = manager.page_model('pages', vessel)
+
+    assert manager.page_model('pages', vessel) is model
+    manager.transform()
+    assert manager.page_model('pages', vessel) is not model
+    assert manager.page_model('pages', vessel) == model
@@ -0,0 +1,81 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the streaming render and upload pipeline."""
+
+import threading
+import time
+
+import pytest
+
+from ocxwiki.client import WikiClient, PageWrite
+from ocxwiki.pipeline import PublishPipeline
+
+
+async def _connected_client(url, fake, max_batch_bytes=None) -> WikiClient:
+    client = WikiClient(url=url)
+    if max_batch_bytes:
+        client.max_batch_bytes = max_batch_bytes
+    await client.connect_async(user=fake.USER, password=fake.PASSWORD)
+    return client
+
+
+async def _no_hashes():
+    return {}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_renders_off_the_event_loop(fake_wiki):
+    url, fake = fake_wiki
+    client = await _connected_client(url, fake)
+    threads = set()
+
+    def render(kind, item):
+        threads.add(threading.current_thread().name)
+        return PageWrite(f'{kind}{item}', 'content', 'summary')
+
+    items = [('pages', i) for i in range(5)] + [('enums', i) for i in range(5)]
+    outcomes = await PublishPipeline(client, render).run(items, _no_hashes())
+
+    assert [outcome.result for outcome in outcomes] == [True] * 10
+    assert [outcome.kind for outcome in outcomes] == ['pages'] * 5 + ['enums'] * 5
+    assert all(name.startswith('ocxwiki-render') for name in threads)
+    assert len(fake.pages) == 10
+
+
+@pytest.mark.asyncio
+async def test_pipeline_reports_render_errors(fake_wiki):
+    url, fake = fake_wiki
+    client = await _connected_client(url, fake)
+
+    def render(kind, item):
+        if item == 2:
+            raise ValueError('broken item')
+        return PageWrite(f'page{item}', 'content', 'summary')
+
+    done = []
+    outcomes = await PublishPipeline(client, render).run([('pages', i) for i in range(4)], _no_hashes(),
+                                                         done_callback=lambda index, outcome: done.append(index))
+
+    assert isinstance(outcomes[2].result, ValueError)
+    assert outcomes[2].write is None
+    assert [outcome.status for outcome in outcomes] == ['created', 'created', None, 'created']
+    assert sorted(done) == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_overlaps_rendering_and_uploads(fake_wiki):
+    url, fake = fake_wiki
+    fake.delay = 0.02
+    client = await _connected_client(url, fake, max_batch_bytes=1)
+    ahead = []
+
+    def render(kind, item):
+        time.sleep(0.005)
+        ahead.append(item - len(fake.pages))
+        return PageWrite(f'page{item}', 'content', 'summary')
+
+    pipeline = PublishPipeline(client, render, max_uploads=1, render_workers=1, queue_size=1)
+    outcomes = await pipeline.run([('pages', i) for i in range(30)], _no_hashes())
+
+    assert [outcome.result for outcome in outcomes] == [True] * 30
+    # Uploads start before rendering completes and the slow uploads hold the rendering back
+    assert max(ahead) <= 6
@@ -0,0 +1,111 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the token bucket rate limits."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ocxwiki.client import WikiClient
+from ocxwiki.rate_limit import TokenBucket, RateLimiter, rate_limiter_for
+from ocxwiki.transport import AsyncXmlRpcTransport
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_allows_a_burst_then_paces():
+    clock = _Clock()
+    bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+    clock.now = 1.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_bucket_refill_is_capped_at_the_burst():
+    clock = _Clock()
+    bucket = TokenBucket(rate=10, burst=5, clock=clock)
+    clock.now = 100.0
+
+    assert all(bucket.reserve() == 0 for _ in range(5))
+    assert bucket.reserve() == pytest.approx(0.1)
+
+
+def test_limiter_waits_for_the_slower_bucket():
+    limiter = RateLimiter(requests_per_second=1000, bytes_per_second=1000, burst_bytes=1000)
+
+    assert limiter.delay(1000) == 0
+    assert limiter.delay(500) == pytest.approx(0.5, abs=0.01)
+    assert limiter.requests == 2
+    assert limiter.describe() == '1000 req/s, 1.0 kB/s'
+
+
+def test_limit_holds_across_threads_and_event_loops():
+    limiter = RateLimiter(requests_per_second=20, burst_requests=1)
+
+    def worker():
+        asyncio.run(_acquire(limiter, 5))
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 10 requests at 20 per second, the first one is free
+    assert time.monotonic() - start >= 0.4
+    assert limiter.requests == 10
+
+
+async def _acquire(limiter: RateLimiter, count: int):
+    for _ in range(count):
+        await limiter.acquire(100)
+
+
+def test_rate_limiter_for_is_shared_per_url():
+    limits = {'https://Rate.Example.org/': {'requests_per_second': 5}}
+
+    limiter = rate_limiter_for('https://rate.example.org', limits)
+
+    assert limiter is not None
+    assert rate_limiter_for('https://rate.example.org/', limits) is limiter
+    assert rate_limiter_for('https://other.example.org', limits) is None
+    assert limiter.describe() == '5 req/s'
+
+
+@pytest.mark.asyncio
+async def test_transport_requests_are_rate_limited(fake_wiki):
+    url, fake = fake_wiki
+    limiter = RateLimiter(requests_per_second=20, burst_requests=1)
+    transport = AsyncXmlRpcTransport(url, max_connections=4, rate_limiter=limiter)
+
+    start = time.monotonic()
+    await asyncio.gather(*(transport.call('dokuwiki.getVersion') for _ in range(6)))
+
+    assert time.monotonic() - start >= 0.25
+    assert limiter.requests == 6
+    assert limiter.wait > 0
+    assert fake.calls.count('dokuwiki.getVersion') == 6
+
+
+@pytest.mark.asyncio
+async def test_client_uses_the_given_rate_limiter(fake_wiki):
+    url, fake = fake_wiki
+    limiter = RateLimiter(bytes_per_second=1_000_000)
+    client = WikiClient(url, rate_limiter=limiter)
+
+    assert client.rate_limiter is limiter
+    assert await client.connect_async(fake.USER, fake.PASSWORD)
+    assert limiter.requests >= 1
+    assert WikiClient(url).rate_limiter is None
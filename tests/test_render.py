@@ -0,0 +1,53 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the DokuWiki tables of the rendered pages."""
+
+from ocx_schema_parser.data_classes import SchemaAttribute
+
+from ocxwiki.render import Render
+from ocxwiki.render.page_model import PageModel
+from ocxwiki.struct_data import WikiSchema
+
+
+def test_table_rows_are_unpadded():
+    table = {'Child': ['[[ns:ocx:Hull|Hull]]', 'Deck'], 'Use': ['req.', 'opt.'], 'Count': [1, 2.5]}
+
+    assert Render.table(table) == ('^%%Child%%^%%Use%%^%%Count%%^\n'
+                                   '|[[ns:ocx:Hull|Hull]]|req.|1|\n'
+                                   '|Deck|opt.|2.5|')
+
+
+def test_table_cells_keep_the_row_structure():
+    table = {'Name': ['a', None, '  b  '], 'Description': ['first\nsecond', '', None], 'Extra': ['x']}
+
+    rows = Render.table(table).split('\n')
+
+    # An empty cell would be merged into the previous cell by DokuWiki
+    assert rows[1:] == ['|a|first \\\\ second|x|', '| | | |', '|b| | |']
+    assert Render.table({}) == ''
+    assert Render.table({'Name': []}) == '^%%Name%%^'
+
+
+def test_numbers_are_written_as_before():
+    table = {'Default': ['1.0', None, '2.50', ''], 'Count': [1, 2, 3, 4], 'Version': ['1.0', 'draft', None, None],
+             'Fixed': [1.0, 10000000.0, 3, None]}
+
+    rows = Render.table(table).split('\n')
+
+    # Numbers with a fraction in a column of numbers have the shortest notation, other columns are as they are
+    assert rows[1:] == ['|1|1|1.0|1|', '| |2|draft|1e+07|', '|2.5|3| |3|', '| |4| | |']
+    assert Render.dict({'Default': '1.0'}) == '^%%Default%%^\n|1.0|\n\n'
+
+
+def test_dict_is_a_one_row_table():
+    assert Render.dict({'Name': 'guid', 'Type': 'xs:ID', 'Default': None}) == \
+        '^%%Name%%^%%Type%%^%%Default%%^\n|guid|xs:ID| |\n\n'
+
+
+def test_attribute_values_are_written_as_they_are():
+    attribute = SchemaAttribute('version', 'ocx', 'xs:decimal', restriction='1.0')
+    data = WikiSchema('3.0.1', 'https://3docx.org', 'ocx', 'tester', 'Oct 17 2026 10:00:00', 'draft', '1.0')
+
+    content = Render.attribute(attribute, data)
+
+    assert '|version|ocx|xs:decimal|1.0| |' in content
+    assert Render.attribute(PageModel.from_attribute(attribute), data) == content
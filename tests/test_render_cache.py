@@ -0,0 +1,74 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the cache of rendered pages."""
+
+from unittest.mock import patch
+
+import pytest
+from lxml.etree import QName
+
+from ocxwiki.render import Render, cache as render_cache
+from ocxwiki.render.cache import RenderCache
+from ocxwiki.schema_cache import SchemaCache
+from ocxwiki.wiki_manager import WikiManager
+
+
+@pytest.fixture
+def manager(ocx_schema_folder, tmp_path):
+    manager = WikiManager('http://localhost/', schema_cache=SchemaCache(tmp_path / 'cache'),
+                          render_cache=RenderCache(folder=tmp_path / 'pages'))
+    assert manager.process_schema_folder(ocx_schema_folder)
+    return manager
+
+
+def test_lru_eviction_and_disk_store(tmp_path):
+    cache = RenderCache(max_entries=2)
+    for key in 'abc':
+        cache.put(key, f'page {key}')
+    assert len(cache) == 2 and cache.get('a') is None
+    # A read makes an entry the most recently used
+    assert cache.get('b') == 'page b'
+    cache.put('d', 'page d')
+    assert cache.get('c') is None and cache.get('b') == 'page b'
+
+    stored = RenderCache(max_entries=1, folder=tmp_path)
+    key = stored.key('pages', 'ocx:Plate')
+    stored.put(key, 'plate')
+    stored.put(stored.key('pages', 'ocx:Vessel'), 'vessel')
+    # Evicted from memory, read back from the folder, also by a new cache
+    assert stored.get(key) == 'plate'
+    assert RenderCache(folder=tmp_path).get(key) == 'plate'
+    assert stored.clear() == 2 and RenderCache(folder=tmp_path).get(key) is None
+
+
+def test_unchanged_pages_are_not_rendered_again(manager):
+    namespace = manager.get_publish_namespace()
+    items = manager.schema_items()
+    writes = [manager._page_write(kind, item, namespace) for kind, item in items]
+    cache = manager.render_cache
+    assert cache.misses == len(items) and cache.hits == 0
+
+    with patch.object(Render, 'page', side_effect=AssertionError('rendered')):
+        again = [manager._page_write(kind, item, namespace) for kind, item in items]
+    assert again == writes and cache.hits == len(items)
+
+    # Pages are rendered again in another namespace or by other templates
+    kind, item = items[0]
+    manager._page_write(kind, item, 'public:schema:')
+    with patch.object(render_cache, 'RENDER_VERSION', render_cache.RENDER_VERSION + 1):
+        manager._page_write(kind, item, namespace)
+    assert cache.misses == len(items) + 2
+
+
+def test_cached_pages_equal_rendered_pages(manager):
+    namespace = manager.get_publish_namespace()
+    for kind, item in manager.schema_items():
+        cached = manager._page_write(kind, item, namespace).content
+        if kind == 'pages':
+            header = manager._header(QName(item.get_tag()).namespace)
+            rendered = Render.page(item, header, manager._links, namespace,
+                                   manager.graph.used_by(f'{item.get_prefix()}:{item.get_name()}'))
+        elif kind == 'enums':
+            rendered = Render.enum(item, manager._header())
+        else:
+            rendered = Render.attribute(item, manager._header())
+        assert cached == rendered
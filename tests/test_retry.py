@@ -0,0 +1,121 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the retry policy and the circuit breaker."""
+
+import asyncio
+
+import pytest
+from dokuwiki import DokuWikiError
+
+from ocxwiki.client import WikiClient
+from ocxwiki.error import WikiTransportError, WikiUnavailableError
+from ocxwiki.retry import RetryPolicy, CircuitBreaker, retry_after, is_retryable
+from tests.test_transport import _raw_server, _xml
+
+
+def _failing(errors, result='ok'):
+    """A request raising ``errors`` in turn before it returns ``result``."""
+    calls = []
+
+    async def request():
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return result
+    return request, calls
+
+
+def test_retryable_errors():
+    assert is_retryable(WikiTransportError('bad gateway', status=502))
+    assert is_retryable(ConnectionResetError())
+    assert is_retryable(asyncio.TimeoutError())
+    assert not is_retryable(WikiTransportError('not found', status=404))
+    assert not is_retryable(DokuWikiError('fault'))
+
+
+def test_retry_after():
+    assert retry_after(WikiTransportError('busy', status=503, headers={'retry-after': '7'})) == 7.0
+    past = {'retry-after': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+    assert retry_after(WikiTransportError('busy', status=503, headers=past)) == 0.0
+    assert retry_after(WikiTransportError('busy', status=503)) is None
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=lambda: 1.0)
+    assert [policy.delay(retry) for retry in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+    assert policy.delay(1, requested=3.0) == 3.0
+    assert RetryPolicy(jitter=lambda: 0.5).delay(2) == 0.5
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    policy = RetryPolicy(base_delay=0.01)
+    request, calls = _failing([WikiTransportError('bad gateway', status=502), ConnectionResetError()])
+
+    assert await policy.run(request) == 'ok'
+    assert len(calls) == 3
+    assert policy.stats.retries == 2
+    assert policy.stats.wait > 0
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_and_permanent_errors_are_not_retried():
+    policy = RetryPolicy(base_delay=0.01)
+    request, calls = _failing([WikiTransportError('bad gateway', status=502)])
+    with pytest.raises(WikiTransportError):
+        await policy.run(request, idempotent=False)
+    request, calls = _failing([DokuWikiError('fault')])
+    with pytest.raises(DokuWikiError):
+        await policy.run(request)
+    assert len(calls) == 1
+    assert policy.stats.retries == 0
+
+
+@pytest.mark.asyncio
+async def test_attempts_are_limited():
+    policy = RetryPolicy(attempts=3, base_delay=0.001)
+    request, calls = _failing([ConnectionResetError()] * 5)
+    with pytest.raises(ConnectionResetError):
+        await policy.run(request)
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_pauses_requests_until_a_probe_succeeds():
+    breaker = CircuitBreaker(threshold=2, reset_timeout=0.05)
+    policy = RetryPolicy(attempts=1, breaker=breaker)
+    for _ in range(2):
+        request, _ = _failing([ConnectionRefusedError()])
+        with pytest.raises(ConnectionRefusedError):
+            await policy.run(request)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert policy.stats.breaker_opened == 1
+
+    request, calls = _failing([])
+    results = await asyncio.gather(*(policy.run(request) for _ in range(10)))
+
+    assert results == ['ok'] * 10
+    assert len(calls) == 10
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert policy.stats.wait >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_breaker_gives_up():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.01, give_up_after=0.05)
+    policy = RetryPolicy(attempts=100, base_delay=0.001, breaker=breaker)
+    request, calls = _failing([ConnectionRefusedError()] * 100)
+    with pytest.raises(WikiUnavailableError):
+        await policy.run(request)
+    assert len(calls) < 10
+
+
+@pytest.mark.asyncio
+async def test_client_retries_a_bad_gateway():
+    body = _xml('content')
+    server, url, _ = await _raw_server([
+        (b'HTTP/1.1 502 Bad Gateway\r\nRetry-After: 0\r\nContent-Length: 0\r\n\r\n', False),
+        (b'HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s' % (len(body), body), False)])
+    async with server:
+        client = WikiClient(url=url, retry=RetryPolicy(base_delay=0.01))
+        assert await client.get_page_async('ocx:page') == 'content'
+    assert client.retry_stats.retries == 1
@@ -0,0 +1,92 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the processed schema cache."""
+
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+import ocxwiki.schema_cache as schema_cache
+from ocxwiki.schema_cache import SchemaCache, SchemaSnapshot, schema_digest
+from ocxwiki.wiki_manager import WikiManager
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SchemaCache(tmp_path / 'cache')
+
+
+def _manager(cache) -> WikiManager:
+    return WikiManager('http://localhost/', schema_cache=cache)
+
+
+def _pages(manager: WikiManager) -> dict:
+    return {ocx.get_tag(): manager._page_write('pages', ocx, 'ns').content
+            for ocx in manager.transformer.get_ocx_elements()}
+
+
+def test_digest_follows_the_schema_content(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'a.xsd').write_text('<a/>')
+    (tmp_path / 'sub' / 'b.xsd').write_text('<b/>')
+    digest = schema_digest(tmp_path)
+
+    assert schema_digest(tmp_path) == digest
+    (tmp_path / 'sub' / 'b.xsd').write_text('<c/>')
+    assert schema_digest(tmp_path) != digest
+    assert schema_digest(tmp_path / 'missing') is None
+
+
+def test_processed_schema_is_restored_without_parsing(ocx_schema_folder, cache):
+    manager = _manager(cache)
+    assert manager.process_schema_folder(ocx_schema_folder)
+    pages = _pages(manager)
+    enums = sorted(manager.transformer.get_enumerators())
+
+    restored = _manager(cache)
+    with patch('ocxwiki.wiki_manager.Transformer', side_effect=AssertionError('parsed')):
+        assert restored.process_schema_folder(ocx_schema_folder)
+
+    assert isinstance(restored.transformer, SchemaSnapshot)
+    assert restored.transformer.parser.get_schema_version() == manager.transformer.parser.get_schema_version()
+    assert sorted(restored.transformer.get_enumerators()) == enums
+    assert len(restored._links) == len(manager._links)
+    # Same page header date
+    restored._wiki_schema, restored._headers = manager._wiki_schema, {}
+    assert _pages(restored) == pages
+
+
+def test_changed_schema_is_parsed_again(ocx_schema_folder, cache):
+    assert _manager(cache).process_schema_folder(ocx_schema_folder)
+    schema = ocx_schema_folder / 'OCX_Schema.xsd'
+    schema.write_bytes(schema.read_bytes() + b'\n')
+
+    with patch('ocxwiki.wiki_manager.Transformer', side_effect=RuntimeError('parsed')):
+        with pytest.raises(RuntimeError):
+            _manager(cache).process_schema_folder(ocx_schema_folder, incremental=False)
+
+
+def test_entries_of_other_versions_are_ignored(ocx_schema_folder, cache):
+    assert _manager(cache).process_schema_folder(ocx_schema_folder)
+    digest = schema_digest(ocx_schema_folder)
+    assert cache.load(digest) is not None
+
+    with patch.object(schema_cache, 'CACHE_FORMAT', schema_cache.CACHE_FORMAT + 1):
+        assert cache.load(digest) is None
+    cache._path(digest).write_bytes(pickle.dumps('garbage')[:5])
+    assert cache.load(digest) is None
+
+
+def test_clear(cache):
+    cache.store('abc', SchemaSnapshot(None, {}, {}, [], [], None))
+
+    assert cache.clear() == 1
+    assert cache.load('abc') is None
+
+
+def test_old_entries_are_pruned(cache):
+    with patch.object(schema_cache, 'MAX_ENTRIES', 2):
+        for digest in ('a', 'b', 'c'):
+            cache.store(digest, SchemaSnapshot(None, {}, {}, [], [], None))
+
+    assert len(list(cache.folder.glob('*.pickle'))) == 2
@@ -0,0 +1,55 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the SQLite schema database."""
+
+import time
+
+import pytest
+
+from ocxwiki.schema_cache import SchemaCache
+from ocxwiki.schema_db import SchemaDatabase
+from ocxwiki.wiki_manager import WikiManager
+
+
+@pytest.fixture
+def manager(ocx_schema_folder, tmp_path):
+    manager = WikiManager('http://localhost/', schema_cache=SchemaCache(tmp_path / 'cache'),
+                          schema_db=SchemaDatabase(tmp_path / 'schemas.sqlite'))
+    assert manager.process_schema_folder(ocx_schema_folder)
+    return manager
+
+
+def test_export_and_lookups(manager):
+    assert manager.export_schema() == 344
+    assert manager.export_schema() == 0
+    database = SchemaDatabase(manager.schema_db.path)
+
+    start = time.monotonic()
+    [version] = database.versions()
+    found = database.find('vessel')
+    vessel = database.find('ocx:Vessel', exact=True)
+    typed = database.typed('ocx:guid')
+    users = database.used_by('ocx:Vessel')
+    children = database.children('Vessel')
+
+    assert time.monotonic() - start < 0.5
+    assert version['version'] == '3.0.1' and version['items'] == 344
+    assert [row['name'] for row in found] == ['ocx:Vessel', 'ocx:VesselRef']
+    assert vessel[0]['description'] == 'Vessel asset subject to Classification.'
+    assert {row['kind'] for row in typed} == {'attribute'} and len(typed) == 74
+    assert [row['name'] for row in users] == ['ocx:ocxXML']
+    assert len(children) == 18 and children[0]['name'] == 'AngleTolerance'
+    assert database.find('Vessel', kind='enums') == []
+
+
+def test_versions_side_by_side(manager):
+    database = manager.schema_db
+    manager.export_schema()
+    manager.transformer.parser.get_schema_version = lambda: '3.1.0'
+    database.export(manager.transformer)
+    assert manager.export_schema(force=True) == 344
+
+    assert [row['version'] for row in database.versions()] == ['3.0.1', '3.1.0']
+    assert [row['version'] for row in database.find('ocx:Vessel', exact=True)] == ['3.0.1', '3.1.0']
+    assert len(database.used_by('Vessel', version='3.1.0')) == 1
+    assert database.remove('3.1.0') and not database.remove('3.1.0')
+    assert database.find('Vessel', version='3.1.0') == []
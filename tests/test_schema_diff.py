@@ -0,0 +1,100 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the comparison of schema versions and the publishing of the changes."""
+
+import shutil
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ocxwiki.client import WikiClient
+from ocxwiki.render import Render
+from ocxwiki.schema_cache import SchemaCache
+from ocxwiki.schema_diff import ADDED, MODIFIED, REMOVED, diff_schemas
+from ocxwiki.wiki_manager import CHANGELOG_PAGE, WikiManager
+
+NS = 'ocx-if:draft-schema'
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = WikiManager('http://localhost/', schema_cache=SchemaCache(tmp_path / 'cache'),
+                          cache_folder=tmp_path / 'manifests')
+    client = Mock(spec=WikiClient)
+    client.is_connected.return_value = True
+    client.current_url.return_value = 'http://localhost/'
+    client.set_page_async = AsyncMock(return_value=True)
+    manager._client = client
+    return manager
+
+
+@pytest.fixture
+def new_schema_folder(ocx_schema_folder, tmp_path):
+    """A copy of the OCX schema with an added element and a changed attribute."""
+    folder = tmp_path / 'new'
+    shutil.copytree(ocx_schema_folder, folder)
+    schema = folder / 'OCX_Schema.xsd'
+    content = schema.read_text(encoding='utf-8')
+    for old, new in (('<xs:element name="Vessel" substitutionGroup="ocx:Form">',
+                      ('<xs:element name="Barge" type="ocx:Form_T" substitutionGroup="ocx:Form"/>'
+                       '<xs:element name="Vessel" substitutionGroup="ocx:Form">')),
+                     ('<xs:attribute name="documentation" type="xs:string" use="optional">',
+                      '<xs:attribute name="documentation" type="xs:string" use="required">')):
+        assert old in content
+        content = content.replace(old, new, 1)
+    schema.write_text(content, encoding='utf-8')
+    return folder
+
+
+def test_changes_between_schema_folders(ocx_schema_folder, new_schema_folder, manager):
+    change_set = manager.diff_schema(ocx_schema_folder, new_schema_folder)
+
+    assert [change.key for change in change_set.with_status(ADDED)] == ['pages:ocx:Barge']
+    modified = {change.key: change.details for change in change_set.with_status(MODIFIED)}
+    # The root element has a Form child, replaced by the substitution group members
+    assert modified['pages:ocx:ocxXML'] == ['child Barge added']
+    assert modified['pages:ocx:Header'] == ['attribute documentation modified']
+    assert change_set.with_status(REMOVED) == []
+    assert manager.transformer is None
+
+    reverse = manager.diff_schema(new_schema_folder, ocx_schema_folder)
+    assert [change.key for change in reverse.with_status(REMOVED)] == ['pages:ocx:Barge']
+    assert reverse.keys(MODIFIED) == change_set.keys(MODIFIED)
+
+
+def test_unchanged_schema_has_no_changes(ocx_schema_folder, manager):
+    assert manager.process_schema_folder(ocx_schema_folder)
+
+    start = time.monotonic()
+    change_set = diff_schemas(manager.transformer, manager.transformer)
+
+    assert len(change_set) == 0
+    assert time.monotonic() - start < 1.0
+    assert 'There are no changes.' in Render.changelog(change_set, NS)
+
+
+def test_changelog_links_added_and_modified_items(ocx_schema_folder, new_schema_folder, manager):
+    assert manager.process_schema_folder(ocx_schema_folder)
+    change_set = manager.diff_schema(new_schema_folder)
+
+    page = Render.changelog(change_set, NS)
+
+    assert '=====Modified=====' in page and '=====Removed=====' in page
+    assert '=====Added=====' not in page
+    assert f'[[{NS}:ocx:ocxXML|ocxXML]]' in page
+    # The page of the removed element is not linked
+    assert 'Barge' in page and f'[[{NS}:ocx:Barge|' not in page
+
+
+@pytest.mark.asyncio
+async def test_only_changed_pages_are_published(ocx_schema_folder, new_schema_folder, manager):
+    assert manager.process_schema_folder(new_schema_folder)
+    change_set = manager.diff_schema(ocx_schema_folder)
+
+    results = await manager.publish_changes_async(change_set)
+
+    written = [call.args[0] for call in manager.client.set_page_async.call_args_list]
+    assert results['errors'] == [] and results['changelog'] is True
+    assert results['pages'] == len(change_set.keys(ADDED, MODIFIED)) == len(written) - 1
+    assert 'ocx:Barge' in written and written[-1] == CHANGELOG_PAGE
+    assert all(call.args[3] == NS for call in manager.client.set_page_async.call_args_list)
@@ -0,0 +1,57 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the full-text search of the schema items."""
+
+import time
+
+import pytest
+
+from ocxwiki.schema_cache import SchemaCache
+from ocxwiki.search import SearchIndex, tokenize
+from ocxwiki.wiki_manager import WikiManager
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    index.add('pages', 'ocx:Plate', 'A plate of the hull structure.', ['PlateMaterial', 'guid'])
+    index.add('pages', 'ocx:PlateCutBy', 'The features cutting a plate.', ['CutByRef'])
+    index.add('pages', 'ocx:Vessel', 'Vessel asset subject to Classification.', ['Hull', 'BuilderInformation'])
+    index.add('enums', 'ocx:curveForm_enum', 'Enumerator of NURBS curve forms.', ['Open', 'Closed', 'Periodic'])
+    index.add('pages', 'ocx:Plate', 'A duplicate is ignored.')
+    index.build()
+    return index
+
+
+def test_tokenize():
+    assert tokenize('PlateCutBy and NURBS curveForm_enum') == ['platecutby', 'plate', 'cut', 'by', 'and', 'nurbs',
+                                                                'curveform', 'curve', 'form', 'enum']
+    assert tokenize(None) == []
+
+
+def test_ranked_token_prefix_and_fuzzy_matches(index):
+    assert len(index) == 4
+    assert [hit.name for hit in index.search('plate')] == ['ocx:Plate', 'ocx:PlateCutBy']
+    # Every word must match
+    assert [hit.name for hit in index.search('plate cut')] == ['ocx:PlateCutBy']
+    assert [hit.name for hit in index.search('pla')] == ['ocx:Plate', 'ocx:PlateCutBy']
+    assert [hit.name for hit in index.search('vesel')] == ['ocx:Vessel']
+    assert [hit.name for hit in index.search('periodic')] == ['ocx:curveForm_enum']
+    assert [hit.name for hit in index.search('builder')] == ['ocx:Vessel']
+    assert index.search('plate', kind='enums') == []
+    assert index.search('xyzzy') == [] and index.search('  ') == []
+    assert index.search('plate')[0].description == 'A plate of the hull structure.'
+
+
+def test_search_as_you_type_on_the_schema(ocx_schema_folder, tmp_path):
+    manager = WikiManager('http://localhost/', schema_cache=SchemaCache(tmp_path / 'cache'))
+    assert manager.process_schema_folder(ocx_schema_folder)
+    index = manager.search_index
+    assert len(index) == 344
+
+    start = time.perf_counter()
+    results = [index.search(text, 10) for text in ('v', 've', 'ves', 'vess', 'vesse', 'vessel')]
+    elapsed = time.perf_counter() - start
+
+    assert elapsed / len(results) < 0.01
+    assert results[-1][0].name == 'ocx:Vessel'
+    assert index.search('classification society')[0].name == 'ocx:classificationSociety'
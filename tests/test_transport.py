@@ -0,0 +1,230 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the asyncio XML-RPC transport."""
+
+import asyncio
+import base64
+
+import pytest
+from dokuwiki import DokuWikiError
+
+from ocxwiki.client import WikiClient
+from ocxwiki.error import WikiTransportError
+from ocxwiki.transport import AsyncXmlRpcTransport
+
+
+async def _raw_server(responses):
+    """Start a raw HTTP server answering each request with the next canned response, recording the request heads."""
+    seen = []
+
+    async def handle(reader, writer):
+        while responses:
+            head = await reader.readuntil(b'\r\n\r\n')
+            length = int([line for line in head.split(b'\r\n') if line.lower().startswith(b'content-length')][0]
+                         .split(b':')[1])
+            await reader.readexactly(length)
+            seen.append(head.decode('latin-1'))
+            response, close = responses.pop(0)
+            writer.write(response)
+            await writer.drain()
+            if close:
+                break
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    return server, f'http://127.0.0.1:{server.sockets[0].getsockname()[1]}/', seen
+
+
+def _xml(value: str) -> bytes:
+    return (f"<?xml version='1.0'?><methodResponse><params><param><value><string>{value}</string></value>"
+            f"</param></params></methodResponse>").encode()
+
+
+def _ok(value: str = 'ok') -> bytes:
+    body = _xml(value)
+    return b'HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s' % (len(body), body)
+
+
+@pytest.fixture
+def no_proxy(monkeypatch):
+    """Clear the proxy settings of the environment."""
+    for name in ('http_proxy', 'https_proxy', 'no_proxy', 'all_proxy'):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+    return monkeypatch
+
+
+class TestAsyncXmlRpcTransport:
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_connection_is_reused(self, fake_wiki):
+        url, fake = fake_wiki
+        transport = AsyncXmlRpcTransport(url, max_connections=2)
+
+        for _ in range(5):
+            assert await transport.call('dokuwiki.getVersion') == 'Release fake'
+
+        assert transport.requests == 5
+        assert transport.connections_opened == 1
+        assert len(fake.connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_chunked_response(self):
+        body = _xml('chunked')
+        chunked = b'%x\r\n%s\r\n0\r\n\r\n' % (len(body), body)
+        server, url, _ = await _raw_server([
+            (b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n' + chunked, False)])
+        async with server:
+            transport = AsyncXmlRpcTransport(url)
+            assert await transport.call('dokuwiki.getVersion') == 'chunked'
+
+    @pytest.mark.asyncio
+    async def test_server_closed_idle_connection_is_replaced(self):
+        body = _xml('ok')
+        response = b'HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s' % (len(body), body)
+        # The server closes the connection after the first response without announcing it
+        server, url, seen = await _raw_server([(response, True), (response, False)])
+        async with server:
+            transport = AsyncXmlRpcTransport(url)
+            assert await transport.call('dokuwiki.getVersion') == 'ok'
+            await asyncio.sleep(0.05)
+            assert await transport.call('dokuwiki.getVersion') == 'ok'
+        assert transport.connections_opened == 2
+        assert len(seen) == 2
+
+    @pytest.mark.asyncio
+    async def test_reset_reused_connection_resends_idempotent_calls_only(self):
+        # The server drops the keep-alive connection after reading the second request
+        server, url, seen = await _raw_server([(_ok(), False), (b'', True), (_ok(), False)])
+        async with server:
+            transport = AsyncXmlRpcTransport(url)
+            assert await transport.call('dokuwiki.getVersion') == 'ok'
+            assert await transport.call('dokuwiki.getVersion') == 'ok'
+        assert transport.connections_opened == 2
+        assert len(seen) == 3
+
+        server, url, seen = await _raw_server([(_ok(), False), (b'', True), (_ok(), False)])
+        async with server:
+            transport = AsyncXmlRpcTransport(url)
+            assert await transport.call('dokuwiki.getVersion') == 'ok'
+            with pytest.raises(ConnectionError):
+                await transport.call('dokuwiki.appendPage', 'page', 'text', {}, idempotent=False)
+        assert len(seen) == 2
+
+    @pytest.mark.asyncio
+    async def test_http_error_status(self):
+        server, url, _ = await _raw_server([
+            (b'HTTP/1.1 502 Bad Gateway\r\nRetry-After: 3\r\nContent-Length: 0\r\n\r\n', False)])
+        async with server:
+            transport = AsyncXmlRpcTransport(url)
+            with pytest.raises(WikiTransportError) as err:
+                await transport.call('dokuwiki.getVersion')
+        assert err.value.status == 502
+        assert err.value.headers['retry-after'] == '3'
+
+    @pytest.mark.asyncio
+    async def test_unauthorized(self):
+        server, url, _ = await _raw_server([(b'HTTP/1.1 401 Unauthorized\r\nContent-Length: 0\r\n\r\n', False)])
+        async with server:
+            transport = AsyncXmlRpcTransport(url)
+            with pytest.raises(DokuWikiError):
+                await transport.call('dokuwiki.getVersion')
+
+    def test_connections_are_bound_to_their_event_loop(self, fake_wiki):
+        url, _ = fake_wiki
+        transport = AsyncXmlRpcTransport(url)
+
+        for _ in range(2):
+            loop = asyncio.new_event_loop()
+            try:
+                assert loop.run_until_complete(transport.call('dokuwiki.getVersion')) == 'Release fake'
+            finally:
+                loop.close()
+
+        assert transport.connections_opened == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_url(self):
+        transport = AsyncXmlRpcTransport('not a url')
+        with pytest.raises(DokuWikiError):
+            await transport.call('dokuwiki.getVersion')
+
+    @pytest.mark.asyncio
+    async def test_redirects_are_followed(self, no_proxy):
+        wiki, wiki_url, wiki_seen = await _raw_server([(_ok('moved'), False), (_ok('again'), False)])
+        location = f'{wiki_url}wiki/lib/exe/xmlrpc.php'
+        old, old_url, old_seen = await _raw_server([
+            (b'HTTP/1.1 301 Moved Permanently\r\nLocation: %s\r\nContent-Length: 0\r\n\r\n' % location.encode(),
+             False)])
+        async with wiki, old:
+            transport = AsyncXmlRpcTransport(old_url)
+            assert await transport.call('dokuwiki.getVersion') == 'moved'
+            # A permanent redirect moves the endpoint
+            assert transport.endpoint_url == location
+            assert await transport.call('dokuwiki.getVersion') == 'again'
+        assert len(old_seen) == 1 and len(wiki_seen) == 2
+        assert wiki_seen[0].startswith('POST /wiki/lib/exe/xmlrpc.php HTTP/1.1')
+
+    @pytest.mark.asyncio
+    async def test_redirect_loops_are_stopped(self, no_proxy):
+        redirect = b'HTTP/1.1 307 Temporary Redirect\r\nLocation: /other\r\nContent-Length: 0\r\n\r\n'
+        server, url, seen = await _raw_server([(redirect, False)] * 10)
+        async with server:
+            transport = AsyncXmlRpcTransport(url)
+            with pytest.raises(WikiTransportError, match='redirected more than'):
+                await transport.call('dokuwiki.getVersion')
+        assert len(seen) == 6
+
+    @pytest.mark.asyncio
+    async def test_credentials_in_the_url_are_sent_as_basic_auth(self, no_proxy):
+        server, url, seen = await _raw_server([(_ok(), False)])
+        async with server:
+            transport = AsyncXmlRpcTransport(url.replace('http://', 'http://tester:p%40ss@'))
+            assert await transport.call('dokuwiki.getVersion') == 'ok'
+        assert f'Authorization: Basic {base64.b64encode(b"tester:p@ss").decode()}' in seen[0]
+        assert 'Host: 127.0.0.1:' in seen[0] and 'tester' not in seen[0].split('\r\n')[1]
+
+    @pytest.mark.asyncio
+    async def test_requests_go_through_the_http_proxy(self, no_proxy):
+        proxy, proxy_url, seen = await _raw_server([(_ok('proxied'), False)])
+        no_proxy.setenv('http_proxy', proxy_url.replace('http://', 'http://agent:secret@'))
+        async with proxy:
+            transport = AsyncXmlRpcTransport('http://wiki.example:8080/')
+            assert await transport.call('dokuwiki.getVersion') == 'proxied'
+        head = seen[0].split('\r\n')
+        assert head[0] == 'POST http://wiki.example:8080/lib/exe/xmlrpc.php HTTP/1.1'
+        assert 'Host: wiki.example:8080' in head
+        assert f'Proxy-Authorization: Basic {base64.b64encode(b"agent:secret").decode()}' in head
+
+        no_proxy.setenv('no_proxy', 'wiki.example')
+        assert AsyncXmlRpcTransport('http://wiki.example:8080/')._endpoint.proxy is None
+
+    @pytest.mark.asyncio
+    async def test_https_is_tunnelled_through_the_proxy(self, no_proxy):
+        requests = []
+
+        async def handle(reader, writer):
+            requests.append(await reader.readuntil(b'\r\n\r\n'))
+            writer.write(b'HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n')
+            await writer.drain()
+            writer.close()
+
+        proxy = await asyncio.start_server(handle, '127.0.0.1', 0)
+        no_proxy.setenv('https_proxy', f'http://127.0.0.1:{proxy.sockets[0].getsockname()[1]}')
+        async with proxy:
+            transport = AsyncXmlRpcTransport('https://wiki.example/')
+            with pytest.raises(WikiTransportError, match='refused the tunnel') as err:
+                await transport.call('dokuwiki.getVersion')
+        assert err.value.status == 403
+        assert requests[0].startswith(b'CONNECT wiki.example:443 HTTP/1.1\r\n')
+
+    def test_synchronous_calls_share_one_event_loop(self, fake_wiki):
+        url, fake = fake_wiki
+        client = WikiClient(url)
+        assert client.connect(fake.USER, fake.PASSWORD)
+        opened = client.transport.connections_opened
+
+        for _ in range(3):
+            client.get_page('ocx:vessel')
+
+        # The keep-alive connections of the first call are reused
+        assert client.transport.connections_opened == opened
@@ -210,7 +210,7 @@ class TestTUIProgressIntegration:
         )
 
         # Build a fake publish_complete_schema_async that honours the callback
-        async def fake_publish(max_concurrent=10, progress_callback=None):
+        async def fake_publish(max_concurrent=10, progress_callback=None, **kwargs):
             results = {
                 "pages": 3, "enums": 2, "attributes": 2, "simple_types": 1,
                 "errors": [], "total": grand_total,
@@ -324,7 +324,7 @@ class TestTUIProgressIntegration:
         captured_progress_calls = []
         captured_summary_calls = []
 
-        async def fake_publish(max_concurrent=10, progress_callback=None):
+        async def fake_publish(max_concurrent=10, progress_callback=None, **kwargs):
             results = {
                 "pages": 2, "enums": 1, "attributes": 1, "simple_types": 1,
                 "errors": [], "total": grand_total,
@@ -0,0 +1,121 @@
+#  Copyright (c) 2026. OCX Consortium https://3docx.org. See the LICENSE
+"""Tests for the schema folder watch."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ocxwiki.client import WikiClient
+from ocxwiki.error import OcxWikiError
+from ocxwiki.schema_cache import SchemaCache
+from ocxwiki.watcher import SchemaWatcher
+from ocxwiki.wiki_manager import PublishState, WikiManager
+
+pytestmark = pytest.mark.asyncio
+
+NS = 'https://3docx.org/fileadmin//ocx_schema//V301//OCX_Schema.xsd'
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = WikiManager('http://localhost/', schema_cache=SchemaCache(tmp_path / 'cache'))
+    client = Mock(spec=WikiClient)
+    client.is_connected.return_value = True
+    client.set_page_async = AsyncMock(return_value=True)
+    manager._client = client
+    return manager
+
+
+def _edit(folder, old: str, new: str):
+    schema = folder / 'OCX_Schema.xsd'
+    content = schema.read_text(encoding='utf-8')
+    assert old in content
+    schema.write_text(content.replace(old, new, 1), encoding='utf-8')
+
+
+def _written(manager) -> list:
+    return [call.args[0] for call in manager.client.set_page_async.call_args_list]
+
+
+async def test_only_changed_pages_are_republished(ocx_schema_folder, manager):
+    assert manager.process_schema_folder(ocx_schema_folder)
+    watcher = SchemaWatcher(manager, ocx_schema_folder)
+    watcher._fingerprints = manager.page_fingerprints()
+    _edit(ocx_schema_folder, '<xs:element name="Vessel" substitutionGroup="ocx:Form">',
+          '<xs:element name="Barge" type="ocx:Form_T" substitutionGroup="ocx:Form"/>'
+          '<xs:element name="Vessel" substitutionGroup="ocx:Form">')
+
+    update = await watcher.update()
+
+    assert update.processed
+    assert 'pages:ocx:Barge' in update.changed
+    # The root element has a Form child, replaced by the substitution group members
+    assert 'pages:ocx:ocxXML' in update.changed
+    assert update.published == len(update.changed) < 10
+    assert sorted(_written(manager)) == sorted(key.split(':', 1)[1] for key in update.changed)
+    assert all(call.args[3] == 'ocx-if:draft-schema' for call in manager.client.set_page_async.call_args_list)
+
+    assert (await watcher.update()).changed == []
+
+
+async def test_failed_pages_are_written_with_the_next_change(ocx_schema_folder, manager):
+    assert manager.process_schema_folder(ocx_schema_folder)
+    watcher = SchemaWatcher(manager, ocx_schema_folder)
+    watcher._fingerprints = manager.page_fingerprints()
+    manager.client.set_page_async.side_effect = OcxWikiError('offline')
+    _edit(ocx_schema_folder, '<xs:attribute name="documentation" type="xs:string" use="optional">',
+          '<xs:attribute name="documentation" type="xs:string" use="required">')
+
+    failed = await watcher.update()
+    manager.client.set_page_async.side_effect = None
+    retried = await watcher.update()
+
+    assert failed.changed and failed.published == 0 and len(failed.errors) == len(failed.changed)
+    assert retried.changed == failed.changed
+    assert retried.published == len(retried.changed)
+
+
+async def test_a_burst_of_saves_is_processed_once(ocx_schema_folder, manager):
+    watcher = SchemaWatcher(manager, ocx_schema_folder, interval=1.0, debounce=0.5, publish=False)
+    schema = ocx_schema_folder / 'OCX_Schema.xsd'
+    updates = []
+    waits = []
+
+    def save():
+        schema.write_bytes(schema.read_bytes() + b'\n')
+
+    def edit():
+        _edit(ocx_schema_folder, 'use="optional"', 'use="required"')
+        save()
+
+    # Each wait of the watch is one step: an edit, two more saves while the watch debounces, a quiet debounce
+    # period and a quiet scan interval, then the watch is stopped
+    steps = [edit, save, save, None, None]
+
+    async def wait(seconds: float) -> bool:
+        waits.append(seconds)
+        if not steps:
+            return True
+        step = steps.pop(0)
+        if step is not None:
+            step()
+        return False
+
+    watcher._wait = wait
+    await asyncio.wait_for(watcher.run(on_update=updates.append), 60)
+
+    assert waits == [1.0, 0.5, 0.5, 0.5, 1.0, 1.0]
+    assert len(updates) == 1
+    assert updates[0].processed and updates[0].changed and updates[0].published == 0
+    assert not watcher.running
+
+
+async def test_publishing_requires_a_connected_draft(ocx_schema_folder, manager):
+    manager.set_publish_state(PublishState.PUBLIC)
+    with pytest.raises(OcxWikiError, match='draft'):
+        await SchemaWatcher(manager, ocx_schema_folder).run()
+
+    manager.client.is_connected.return_value = False
+    with pytest.raises(OcxWikiError, match='connected'):
+        await SchemaWatcher(manager, ocx_schema_folder).run()